@@ -15,6 +15,8 @@ from tzlocal import get_localzone
 from .scrollframe import CustomScrollFrame
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from customtkinter import CTk, CTkFrame, CTkToplevel
 
     from src.gui import GaussUI
@@ -30,7 +32,7 @@ class CustomTable(CustomScrollFrame):
         self,
         app: GaussUI,
         master: CTk | CTkFrame | CTkToplevel | CustomScrollFrame | GaussUI,
-        values: list[list[str]],
+        values: Sequence[list[str]],
         header: str = "Registro de Iteraciones:",
     ) -> None:
         """
@@ -308,4 +308,5 @@ class NavFrame(CTkFrame):
             self.app.ops_manager.save_matrices()
             self.app.ops_manager.save_vectores()
             self.app.save_config()
+            self.app.tareas_manager.cerrar()
             self.app.quit()
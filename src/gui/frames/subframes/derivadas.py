@@ -6,12 +6,13 @@ from tkinter import Variable
 from typing import TYPE_CHECKING
 
 from customtkinter import CTkButton, CTkFrame, CTkLabel
+from sympy import diff
 
 from src.gui.custom import CustomDropdown
 from src.gui.custom.adapted import CustomScrollFrame
-from src.managers import FuncManager
+from src.managers import FuncManager, Tarea
 from src.models import Func
-from src.utils import delete_msg_frame, generate_sep, place_msg_frame
+from src.utils import delete_msg_frame, generate_sep, place_msg_frame, place_tarea_frame
 
 if TYPE_CHECKING:
     from src.gui import GaussUI
@@ -43,6 +44,7 @@ class DerivadasFrame(CustomScrollFrame):
 
         self.nombres_funcs = list(self.func_manager.funcs_ingresadas.keys())
         self.msg_frame: CTkFrame | None = None
+        self.tarea: Tarea | None = None
 
         self.func: Func
         self.func_select = CustomDropdown(
@@ -64,6 +66,7 @@ class DerivadasFrame(CustomScrollFrame):
 
         """
 
+        self.cancelar_tarea()
         delete_msg_frame(self.msg_frame)
         for widget in self.winfo_children():
             if dict(widget.grid_info()).get("row", -1) > 0:
@@ -92,10 +95,64 @@ class DerivadasFrame(CustomScrollFrame):
 
     def encontrar_derivada(self) -> None:
         """
-        Derivar la función seleccionada y mostrar el resultado.
+        Derivar la función seleccionada en segundo plano,
+        o mostrar su derivada directamente si ya se había calculado.
+        """
+
+        self.cancelar_tarea()
+        if Func.memo.derivada(self.func.expr, self.func.var) is not None:
+            delete_msg_frame(self.msg_frame)
+            self.colocar_derivada(self.func.derivar())
+            return
+
+        self.tarea = self.app.tareas_manager.enviar(diff, self.func.expr, self.func.var)
+        self.msg_frame = place_tarea_frame(
+            parent_frame=self,
+            msg_frame=self.msg_frame,
+            tarea=self.tarea,
+            row=4,
+            pady=10,
+        )
+
+        self.app.tareas_manager.esperar(self, self.tarea, self.mostrar_derivada)
+
+    def mostrar_derivada(self, tarea: Tarea) -> None:
+        """
+        Mostrar la derivada calculada, o el error de la tarea.
+
+        Args:
+            tarea: Tarea terminada.
+
+        """
+
+        if tarea is not self.tarea:
+            return
+
+        self.tarea = None
+        delete_msg_frame(self.msg_frame)
+        if tarea.error is not None:
+            self.msg_frame = place_msg_frame(
+                parent_frame=self,
+                msg_frame=self.msg_frame,
+                msg=tarea.error,
+                tipo="error",
+                row=4,
+                pady=10,
+            )
+
+            return
+
+        self.colocar_derivada(self.func.derivar(tarea.resultado()))
+
+    def colocar_derivada(self, derivada: Func) -> None:
+        """
+        Mostrar la imagen de una derivada.
+
+        Args:
+            derivada: Derivada a mostrar.
+
         """
 
-        derivada = self.func.derivar()
         self.msg_frame = place_msg_frame(
             parent_frame=self,
             msg_frame=self.msg_frame,
@@ -110,11 +167,21 @@ class DerivadasFrame(CustomScrollFrame):
             pady=10,  # type: ignore[reportArgumentType]
         )
 
+    def cancelar_tarea(self) -> None:
+        """
+        Cancelar la tarea en ejecución, si existe.
+        """
+
+        if self.tarea is not None:
+            self.tarea.cancelar()
+            self.tarea = None
+
     def update_frame(self) -> None:
         """
         Actualizar colores de widgets.
         """
 
+        self.cancelar_tarea()
         delete_msg_frame(self.msg_frame)
         self.nombres_funcs = list(self.func_manager.funcs_ingresadas.keys())
         self.func_select.configure(
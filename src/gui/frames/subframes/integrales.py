@@ -2,16 +2,25 @@
 Implementación de frame de integrales de funciones.
 """
 
+from decimal import Decimal
+from fractions import Fraction
 from tkinter import Variable
 from typing import TYPE_CHECKING
 
-from customtkinter import CTkButton, CTkFrame, CTkLabel
+from customtkinter import CTkButton, CTkFont, CTkFrame, CTkLabel
+from sympy import Rational, integrate, latex
 
-from src.gui.custom import CustomDropdown
+from src.gui.custom import CustomDropdown, CustomEntry
 from src.gui.custom.adapted import CustomScrollFrame
-from src.managers import FuncManager
+from src.managers import LIMITE_SIMBOLICO, FuncManager, Tarea
 from src.models import Func
-from src.utils import delete_msg_frame, generate_sep, place_msg_frame
+from src.utils import (
+    delete_msg_frame,
+    generate_sep,
+    handle_pi,
+    place_msg_frame,
+    place_tarea_frame,
+)
 
 if TYPE_CHECKING:
     from src.gui import GaussUI
@@ -44,8 +53,11 @@ class IntegralesFrame(CustomScrollFrame):
 
         self.nombres_funcs = list(self.func_manager.funcs_ingresadas.keys())
         self.msg_frame: CTkFrame | None = None
+        self.tarea: Tarea | None = None
 
         self.func: Func
+        self.a_entry: CustomEntry
+        self.b_entry: CustomEntry
         self.func_select = CustomDropdown(
             self,
             width=40,
@@ -65,6 +77,7 @@ class IntegralesFrame(CustomScrollFrame):
 
         """
 
+        self.cancelar_tarea()
         delete_msg_frame(self.msg_frame)
         for widget in self.winfo_children():
             if dict(widget.grid_info()).get("row", -1) > 0:
@@ -91,12 +104,105 @@ class IntegralesFrame(CustomScrollFrame):
             command=self.encontrar_integral,
         ).grid(row=3, column=0, ipadx=10, pady=5, sticky="n")
 
+        limites_frame = CTkFrame(self, fg_color="transparent")
+        limites_frame.grid(row=4, column=0, pady=5, sticky="n")
+
+        CTkLabel(limites_frame, text="Límites de integración:").grid(
+            row=0,
+            column=0,
+            padx=5,
+            sticky="e",
+        )
+
+        self.a_entry = CustomEntry(limites_frame, width=60, placeholder_text="a")
+        self.a_entry.grid(row=0, column=1, padx=5, sticky="e")
+        CTkLabel(limites_frame, text=",", font=CTkFont(size=18)).grid(
+            row=0,
+            column=2,
+            padx=3,
+            sticky="w",
+        )
+
+        self.b_entry = CustomEntry(limites_frame, width=60, placeholder_text="b")
+        self.b_entry.grid(row=0, column=3, padx=5, sticky="w")
+
+        self.a_entry.bind("<Left>", lambda _: self.b_entry.focus_set())
+        self.a_entry.bind("<Right>", lambda _: self.b_entry.focus_set())
+        self.a_entry.bind("<Return>", lambda _: self.encontrar_integral_definida())
+        self.b_entry.bind("<Left>", lambda _: self.a_entry.focus_set())
+        self.b_entry.bind("<Right>", lambda _: self.a_entry.focus_set())
+        self.b_entry.bind("<Return>", lambda _: self.encontrar_integral_definida())
+
+        CTkButton(
+            limites_frame,
+            height=30,
+            text="Integral definida",
+            command=self.encontrar_integral_definida,
+        ).grid(row=0, column=4, padx=5, sticky="w")
+
     def encontrar_integral(self) -> None:
         """
-        Integrar la función seleccionada.
+        Integrar la función seleccionada en segundo plano,
+        o mostrar su integral directamente si ya se había calculado.
+        """
+
+        self.limpiar_resultados()
+        if Func.memo.integral(self.func.expr, self.func.var) is not None:
+            self.colocar_integral(self.func.integrar())
+            return
+
+        self.tarea = self.app.tareas_manager.enviar(
+            integrate,
+            self.func.expr,
+            self.func.var,
+        )
+
+        self.msg_frame = place_tarea_frame(
+            parent_frame=self,
+            msg_frame=self.msg_frame,
+            tarea=self.tarea,
+            row=5,
+            pady=10,
+        )
+
+        self.app.tareas_manager.esperar(self, self.tarea, self.mostrar_integral)
+
+    def mostrar_integral(self, tarea: Tarea) -> None:
+        """
+        Mostrar la integral indefinida calculada, o el error de la tarea.
+
+        Args:
+            tarea: Tarea terminada.
+
+        """
+
+        if tarea is not self.tarea:
+            return
+
+        self.tarea = None
+        delete_msg_frame(self.msg_frame)
+        if tarea.error is not None:
+            self.msg_frame = place_msg_frame(
+                parent_frame=self,
+                msg_frame=self.msg_frame,
+                msg=tarea.error,
+                tipo="error",
+                row=5,
+                pady=10,
+            )
+
+            return
+
+        self.colocar_integral(self.func.integrar(tarea.resultado()))
+
+    def colocar_integral(self, integral: Func) -> None:
         """
+        Mostrar la imagen de una integral indefinida.
+
+        Args:
+            integral: Integral a mostrar.
 
-        integral = self.func.integrar()
+        """
 
         try:
             msg = None
@@ -116,15 +222,167 @@ class IntegralesFrame(CustomScrollFrame):
             msg=msg,
             img=integ_img,
             tipo="resultado" if msg is None else "error",
-            row=4,
+            row=5,
+            pady=10,
+        )
+
+    def encontrar_integral_definida(self) -> None:
+        """
+        Aproximar numéricamente la integral definida de la función
+        seleccionada, y buscar su valor exacto en segundo plano.
+        """
+
+        self.limpiar_resultados()
+
+        try:
+            a, b = handle_pi(self.a_entry.get()), handle_pi(self.b_entry.get())
+            aproximacion = FuncManager.integral_numerica(self.func, (a, b))
+        except (ValueError, ZeroDivisionError, ArithmeticError) as e:
+            if isinstance(e, ValueError):
+                error_msg = (
+                    "Debe ingresar números racionales para los límites de integración."
+                )
+            elif isinstance(e, ZeroDivisionError):
+                error_msg = "El denominador de una fracción no puede ser 0."
+            else:
+                error_msg = str(e)
+
+            self.msg_frame = place_msg_frame(
+                parent_frame=self,
+                msg_frame=self.msg_frame,
+                msg=error_msg,
+                tipo="error",
+                row=6,
+                pady=10,
+            )
+
+            return
+
+        self.tarea = self.app.tareas_manager.enviar(
+            integrate,
+            self.func.expr,
+            (self.func.var, Rational(str(a)), Rational(str(b))),
+            limite_tiempo=LIMITE_SIMBOLICO,
+        )
+
+        self.msg_frame = place_tarea_frame(
+            parent_frame=self,
+            msg_frame=self.msg_frame,
+            tarea=self.tarea,
+            msg="Buscando la integral exacta...",
+            row=6,
+            pady=10,
+        )
+
+        self.app.tareas_manager.esperar(
+            self,
+            self.tarea,
+            lambda tarea: self.mostrar_integral_definida(tarea, (a, b), aproximacion),
+        )
+
+    def mostrar_integral_definida(
+        self,
+        tarea: Tarea,
+        intervalo: tuple[Fraction, Fraction],
+        aproximacion: tuple[Decimal, Decimal, bool],
+    ) -> None:
+        """
+        Mostrar la integral definida: el valor exacto si la tarea
+        lo encontró, y si no, solo la aproximación numérica.
+
+        Args:
+            tarea:        Tarea terminada de la integral exacta.
+            intervalo:    Límites de integración.
+            aproximacion: Aproximación numérica, error estimado,
+                          y si se alcanzó el margen de error.
+
+        """
+
+        if tarea is not self.tarea:
+            return
+
+        self.tarea = None
+        delete_msg_frame(self.msg_frame)
+
+        a, b = intervalo
+        valor, error_estimado, convergio = aproximacion
+        exacto = (
+            FuncManager.validar_integral(tarea.resultado())
+            if tarea.error is None
+            else None
+        )
+
+        var: str = str(self.func.var)
+        integral_str: str = (
+            rf"\int_{{{a}}}^{{{b}}} {self.func.nombre[0]}({var})\, d{var}"
+        )
+
+        valor_str: str = format(valor.normalize(), "f")
+        if exacto is not None:
+            misc_str = rf"{integral_str} = {latex(exacto)} \approx {valor_str}"
+            interpretacion: str = "Integral definida:"
+        else:
+            misc_str = rf"{integral_str} \approx {valor_str}"
+            interpretacion = (
+                f"{tarea.error or 'No se encontró una integral exacta.'}\n"
+                "Se aproximó numéricamente:"
+            )
+
+        if not convergio:
+            interpretacion += (
+                "\nLa aproximación no alcanzó el margen de error "
+                f"(error estimado: {format(error_estimado.normalize(), 'f')})."
+            )
+
+        CTkLabel(self, text=interpretacion).grid(row=5, column=0, pady=5, sticky="n")
+
+        try:
+            msg = None
+            integ_img = Func.latex_to_png(
+                output_file=f"definida_{self.func.nombre}",
+                misc_str=misc_str,
+            )
+        except RuntimeError:
+            integ_img = None
+            msg = "No se pudo generar la imagen del integral."
+
+        self.msg_frame = place_msg_frame(
+            parent_frame=self,
+            msg_frame=self.msg_frame,
+            msg=msg,
+            img=integ_img,
+            border_color="#ff3131" if not convergio else None,
+            tipo="resultado" if msg is None else "error",
+            row=6,
             pady=10,
         )
 
+    def limpiar_resultados(self) -> None:
+        """
+        Cancelar la tarea en ejecución, y eliminar los resultados mostrados.
+        """
+
+        self.cancelar_tarea()
+        delete_msg_frame(self.msg_frame)
+        for widget in self.winfo_children():
+            if dict(widget.grid_info()).get("row", -1) > 4:
+                widget.destroy()
+
+    def cancelar_tarea(self) -> None:
+        """
+        Cancelar la tarea en ejecución, si existe.
+        """
+
+        if self.tarea is not None:
+            self.tarea.cancelar()
+            self.tarea = None
+
     def update_frame(self) -> None:
         """
         Actualizar colores de widgets.
         """
 
+        self.cancelar_tarea()
         delete_msg_frame(self.msg_frame)
         self.nombres_funcs = list(self.func_manager.funcs_ingresadas.keys())
         self.func_select.configure(
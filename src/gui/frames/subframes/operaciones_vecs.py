@@ -112,7 +112,12 @@ class MagnitudTab(CustomScrollFrame):
         vec = self.vecs_manager.vecs_ingresados[self.vec]
 
         header = f"||  {self.vec}  ||"
-        resultado = Decimal(float(vec.magnitud())).normalize()
+        magnitud = vec.magnitud()
+        resultado = (
+            str(magnitud)
+            if magnitud.es_racional()
+            else f"{magnitud} ≈ {Decimal(float(magnitud)).normalize()}"
+        )
 
         proc = "---------------------------------------------\n"
         proc += f"{self.vec}:\n{vec}\n"
@@ -2,19 +2,29 @@
 Implementación de frame de raíces de funciones.
 """
 
+from collections.abc import Sequence
 from decimal import Decimal
 from random import randint
 from tkinter import Variable
 from typing import TYPE_CHECKING, Literal
 
 from customtkinter import CTkButton, CTkFont, CTkFrame, CTkLabel, CTkToplevel
-from sympy import Contains, Interval
+from sympy import Contains, Interval, Reals
+from sympy.calculus.util import continuous_domain
 
 from src.gui.custom import CustomDropdown, CustomEntry, IconButton
 from src.gui.custom.adapted import CustomScrollFrame, CustomTable
-from src.managers import MARGEN_ERROR, MAX_ITERACIONES, FuncManager
-from src.models import Func
-from src.utils import INFO_ICON, generate_sep, handle_pi, place_msg_frame, set_icon
+from src.managers import MARGEN_ERROR, MAX_ITERACIONES, FuncManager, Tarea
+from src.models import Func, RegistroIteraciones
+from src.utils import (
+    INFO_ICON,
+    delete_msg_frame,
+    generate_sep,
+    handle_pi,
+    place_msg_frame,
+    place_tarea_frame,
+    set_icon,
+)
 
 if TYPE_CHECKING:
     from src.gui import GaussUI
@@ -55,15 +65,19 @@ class RaicesFrame(CustomScrollFrame):
         self.resultado.columnconfigure(0, weight=1)
 
         self.nombres_funcs = list(self.func_manager.funcs_ingresadas.keys())
-        self.metodos: dict[str, Literal[0, 1, 2, 3]] = {
+        self.metodos: dict[str, Literal[0, 1, 2, 3, 4, 5, 6]] = {
             "Método de Bisección": 0,
             "Método de Falsa Posición": 1,
             "Método de Newton": 2,
             "Método de la Secante": 3,
+            "Método de Illinois": 4,
+            "Método de Brent": 5,
+            "Todas las raíces en un intervalo": 6,
         }
 
         self.msg_frame: CTkFrame | None = None
-        self.met_actual: Literal[0, 1, 2, 3] = 0
+        self.tarea: Tarea | None = None
+        self.met_actual: Literal[0, 1, 2, 3, 4, 5, 6] = 0
         self.table_hidden: bool = True
         self.func: Func
 
@@ -96,6 +110,7 @@ class RaicesFrame(CustomScrollFrame):
 
         """
 
+        self.cancelar_tarea()
         self.metodo_frame.grid(row=1, column=0, pady=5, sticky="n")
         self.func = self.func_manager.funcs_ingresadas[nombre_str]
 
@@ -135,6 +150,7 @@ class RaicesFrame(CustomScrollFrame):
 
         """
 
+        self.cancelar_tarea()
         self.datos_frame.grid(row=2, column=0, pady=5, sticky="n")
         for widget in self.datos_frame.winfo_children():
             widget.destroy()
@@ -152,9 +168,7 @@ class RaicesFrame(CustomScrollFrame):
 
         self.met_actual = self.metodos[metodo]
         match self.met_actual:
-            case 0:
-                self.setup_cerrado()
-            case 1:
+            case 0 | 1 | 4 | 5 | 6:
                 self.setup_cerrado()
             case 2:
                 self.setup_abierto(newton=True)
@@ -163,7 +177,9 @@ class RaicesFrame(CustomScrollFrame):
 
     def setup_cerrado(self) -> None:
         """
-        Configurar frame para métodos cerrados (Bisección, Falsa Posición).
+        Configurar frame para métodos cerrados
+        (Bisección, Falsa Posición, Illinois, Brent),
+        y para buscar todas las raíces de un intervalo.
         """
 
         CTkLabel(self.datos_frame, text="Intervalo:").grid(
@@ -234,7 +250,7 @@ class RaicesFrame(CustomScrollFrame):
         CTkButton(
             self.datos_frame,
             height=30,
-            text="Encontrar raíz",
+            text="Encontrar raíces" if self.met_actual == 6 else "Encontrar raíz",
             command=self.leer_datos,
         ).grid(row=2, column=0, columnspan=4, padx=5, pady=5, sticky="n")
 
@@ -358,16 +374,84 @@ class RaicesFrame(CustomScrollFrame):
         Leer los datos correspondientes al método seleccionado.
         """
 
+        self.cancelar_tarea()
         self.resultado.grid(row=3, column=0, pady=5, sticky="n")
         for widget in self.resultado.winfo_children():
             widget.destroy()
 
-        dominio = self.func.get_dominio()
-        if self.met_actual in (0, 1):  # metodos cerrados
+        if self.func.dominio_str is not None:
+            self.validar_datos(self.func.get_dominio())
+            return
+
+        # el dominio aun no se ha calculado, y continuous_domain()
+        # puede tardar, asi que se calcula en segundo plano
+        self.tarea = self.app.tareas_manager.enviar(
+            continuous_domain,
+            self.func.expr,
+            self.func.var,
+            Reals,
+        )
+
+        self.msg_frame = place_tarea_frame(
+            parent_frame=self.resultado,
+            msg_frame=None,
+            tarea=self.tarea,
+            msg="Calculando el dominio...",
+        )
+
+        self.app.tareas_manager.esperar(self, self.tarea, self.recibir_dominio)
+
+    def recibir_dominio(self, tarea: Tarea) -> None:
+        """
+        Almacenar el dominio calculado en segundo plano y validar los datos,
+        o mostrar el error de la tarea.
+
+        Args:
+            tarea: Tarea terminada.
+
+        """
+
+        if tarea is not self.tarea:
+            return
+
+        self.tarea = None
+        delete_msg_frame(self.msg_frame)
+        if tarea.error is not None:
+            self.msg_frame = place_msg_frame(
+                parent_frame=self.resultado,
+                msg_frame=None,
+                msg=tarea.error,
+                tipo="error",
+            )
+
+            return
+
+        self.func.asignar_dominio(tarea.resultado())
+        self.validar_datos(self.func.get_dominio())
+
+    def validar_datos(self, dominio: Interval) -> None:
+        """
+        Validar los datos del método seleccionado con el dominio de la función.
+
+        Args:
+            dominio: Dominio de la función seleccionada.
+
+        """
+
+        if self.met_actual in (0, 1, 4, 5, 6):  # metodos cerrados
             self.ld_cerrado(dominio)
         elif self.met_actual in (2, 3):  # metodos abiertos
             self.ld_abierto(dominio)
 
+    def cancelar_tarea(self) -> None:
+        """
+        Cancelar la tarea en ejecución, si existe.
+        """
+
+        if self.tarea is not None:
+            self.tarea.cancelar()
+            self.tarea = None
+
     def ld_cerrado(self, dominio: Interval) -> None:
         """
         Leer y validar datos para métodos cerrados.
@@ -544,10 +628,37 @@ class RaicesFrame(CustomScrollFrame):
                         max_its=max_its,
                     ),
                 )
+            case 4:
+                self.mostrar_r_cerrado(
+                    FuncManager.illinois(
+                        func=self.func,
+                        intervalo=vals_iniciales,  # type: ignore[reportArgumentType]
+                        error=error,
+                        max_its=max_its,
+                    ),
+                )
+            case 5:
+                self.mostrar_r_cerrado(
+                    FuncManager.brent(
+                        func=self.func,
+                        intervalo=vals_iniciales,  # type: ignore[reportArgumentType]
+                        error=error,
+                        max_its=max_its,
+                    ),
+                )
+            case 6:
+                self.mostrar_todas_raices(
+                    FuncManager.todas_las_raices(
+                        func=self.func,
+                        intervalo=vals_iniciales,  # type: ignore[reportArgumentType]
+                        error=error,
+                        max_its=max_its,
+                    ),
+                )
 
     def mostrar_r_cerrado(
         self,
-        resultado: bool | tuple[Decimal, Decimal, list[list[str]], int],
+        resultado: bool | tuple[Decimal, Decimal, RegistroIteraciones, int],
     ) -> None:
         """
         Mostrar resultados de métodos cerrados.
@@ -557,7 +668,13 @@ class RaicesFrame(CustomScrollFrame):
 
         """
 
-        tipo_metodo: str = "bisección" if self.met_actual == 0 else "falsa posición"
+        tipo_metodo, nombre_archivo = {
+            0: ("bisección", "biseccion"),
+            1: ("falsa posición", "fp"),
+            4: ("Illinois", "illinois"),
+            5: ("Brent", "brent"),
+        }[self.met_actual]
+
         if isinstance(resultado, bool):
             if resultado:
                 error_msg = "La función no cambia de signo en el intervalo indicado."
@@ -577,9 +694,7 @@ class RaicesFrame(CustomScrollFrame):
         fx_igual = rf"{self.func.nombre} = {format(fx.normalize(), 'f')}"
 
         raiz_img = Func.latex_to_png(
-            output_file="resultado_"
-            f"{'biseccion' if self.met_actual == 0 else 'fp'}"
-            f"_{self.func.nombre}",
+            output_file=f"resultado_{nombre_archivo}_{self.func.nombre}",
             misc_str=rf"{x_igual}" + r"\\[1em]" + rf"{fx_igual}",
         )
 
@@ -618,6 +733,76 @@ class RaicesFrame(CustomScrollFrame):
             command=lambda: self.toggle_tabla(registro),
         ).grid(row=2, column=0, ipadx=5, pady=5, sticky="n")
 
+    def mostrar_todas_raices(self, raices: list[tuple[Decimal, Decimal, int]]) -> None:
+        """
+        Mostrar todas las raíces encontradas en un intervalo.
+
+        Args:
+            raices: Valor x, valor y e iteración final de cada raíz.
+
+        """
+
+        if not raices:
+            self.msg_frame = place_msg_frame(
+                parent_frame=self.resultado,
+                msg_frame=self.msg_frame,
+                msg="No se encontraron raíces en el intervalo indicado.",
+                tipo="error",
+            )
+
+            return
+
+        letra: str = self.func.nombre[0]
+        registro = RegistroIteraciones(
+            ["Raíz", self.func.var, f"{letra}({self.func.var})", "Iteraciones"],
+        )
+
+        for x, fx, its in raices:
+            registro.agregar(float(x), float(fx), its)
+
+        raices_img = Func.latex_to_png(
+            output_file=f"resultado_raices_{self.func.nombre}",
+            misc_str=r"\\[1em]".join(
+                rf"{self.func.var}_{{{i}}} = {format(x.normalize(), 'f')}"
+                for i, (x, _, _) in enumerate(raices, start=1)
+            ),
+        )
+
+        sin_converger: int = sum(its == -1 for _, _, its in raices)
+        interpretacion: str = (
+            f"Se encontraron {len(raices)} raíces en el intervalo indicado:"
+            if len(raices) > 1
+            else "Se encontró 1 raíz en el intervalo indicado:"
+        )
+
+        if sin_converger > 0:
+            interpretacion = (
+                f"{sin_converger} de las raíces no llegaron al margen de error "
+                f"después de {MAX_ITERACIONES} iteraciones.\n{interpretacion}"
+            )
+
+        CTkLabel(self.resultado, text=interpretacion).grid(
+            row=0,
+            column=0,
+            pady=5,
+            sticky="n",
+        )
+
+        self.msg_frame = place_msg_frame(
+            parent_frame=self.resultado,
+            msg_frame=self.msg_frame,
+            img=raices_img,
+            tipo="resultado",
+            row=1,
+        )
+
+        CTkButton(
+            self.resultado,
+            height=30,
+            text="Mostrar tabla de raíces",
+            command=lambda: self.toggle_tabla(registro),
+        ).grid(row=2, column=0, ipadx=5, pady=5, sticky="n")
+
     def mostrar_r_abierto(
         self,
         resultado: tuple[Decimal, Decimal, list[list[str]], int, int],
@@ -691,7 +876,7 @@ class RaicesFrame(CustomScrollFrame):
             command=lambda: self.toggle_tabla(registro),
         ).grid(row=2, column=0, ipadx=5, pady=5, sticky="n")
 
-    def toggle_tabla(self, registro: list[list[str]]) -> None:
+    def toggle_tabla(self, registro: Sequence[list[str]]) -> None:
         """
         Mostrar o esconder la registro de iteraciones.
 
@@ -733,6 +918,7 @@ class RaicesFrame(CustomScrollFrame):
         Actualizar colores de widgets.
         """
 
+        self.cancelar_tarea()
         self.nombres_funcs = list(self.func_manager.funcs_ingresadas.keys())
         self.func_select.configure(
             values=self.nombres_funcs,
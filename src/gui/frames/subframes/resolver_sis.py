@@ -19,9 +19,15 @@ from src.utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from src.gui import GaussUI
     from src.gui.frames import SistemasFrame
     from src.models import SistemaEcuaciones
+    from src.models.sistema_ecuaciones import PasoGJ
+
+# pasos de Gauss-Jordan a procesar en cada ciclo del main loop
+PASOS_POR_CICLO: int = 4
 
 
 class ResolverSisFrame(CustomScrollFrame):
@@ -50,7 +56,13 @@ class ResolverSisFrame(CustomScrollFrame):
         self.columnconfigure(0, weight=1)
 
         self.msg_frame: CTkFrame | None = None
-        self.metodos: dict[str, str] = {"Gauss-Jordan": "gj", "Regla de Cramer": "c"}
+        self.metodos: dict[str, str] = {
+            "Gauss-Jordan": "gj",
+            "Gauss-Jordan (disperso)": "gjd",
+            "Regla de Cramer": "c",
+            "Mínimos cuadrados": "mc",
+            "Mínimos cuadrados (flotante)": "mcf",
+        }
 
         # definir atributos, se inicializan en setup_frame
         self.select_sis_mat: CustomDropdown
@@ -61,6 +73,10 @@ class ResolverSisFrame(CustomScrollFrame):
         self.proc_label: CTkLabel | None = None
         self.proc_hidden = True
 
+        # resolucion incremental en curso, si hay alguna
+        self.pasos_actuales: Iterator[PasoGJ] | None = None
+        self.progreso_label: CTkLabel | None = None
+
         self.setup_frame()
 
     def setup_frame(self) -> None:
@@ -106,6 +122,18 @@ class ResolverSisFrame(CustomScrollFrame):
         if self.mats_manager.sis_ingresados[self.sis_mat].es_matriz_cero():
             met = "gj"
 
+        # gauss-jordan se resuelve paso por paso, para que
+        # la interfaz siga respondiendo en sistemas grandes
+        if met == "gj":
+            sistema, self.pasos_actuales = self.mats_manager.pasos_gauss_jordan(
+                self.sis_mat,
+            )
+
+            self.progreso_label = CTkLabel(self, text="Resolviendo...")
+            self.progreso_label.grid(row=5, column=0, pady=10, sticky="n")
+            self.reproducir_pasos(sistema, self.pasos_actuales, 0)
+            return
+
         try:
             sistema = self.mats_manager.resolver_sistema(self.sis_mat, met)
         except (ValueError, ArithmeticError, ZeroDivisionError) as e:
@@ -120,6 +148,66 @@ class ResolverSisFrame(CustomScrollFrame):
 
             return
 
+        self.mostrar_resultado(sistema, met)
+
+    def reproducir_pasos(
+        self,
+        sistema: "SistemaEcuaciones",
+        pasos: "Iterator[PasoGJ]",
+        num_paso: int,
+    ) -> None:
+        """
+        Consumir algunos pasos de la resolución y
+        programar el resto con after(), mostrando el progreso.
+
+        Args:
+            sistema:  Sistema que se está resolviendo.
+            pasos:    Generador de pasos del sistema.
+            num_paso: Número de pasos consumidos hasta ahora.
+
+        """
+
+        # si se inició otra resolución o se cambió de sistema, abandonar esta
+        if pasos is not self.pasos_actuales:
+            return
+
+        paso: PasoGJ | None = None
+        for _ in range(PASOS_POR_CICLO):
+            paso = next(pasos, None)
+            if paso is None:
+                self.pasos_actuales = None
+                if self.progreso_label is not None:
+                    self.progreso_label.destroy()
+                self.mostrar_resultado(sistema, "gj")
+                return
+
+            num_paso += 1
+
+        if self.progreso_label is not None and paso is not None:
+            tipo, fila, otra_fila, _ = paso
+            operacion: str = (
+                f"F{fila + 1}  <=>  F{otra_fila + 1}"
+                if tipo == "intercambio"
+                else f"F{fila + 1}"
+            )
+
+            self.progreso_label.configure(
+                text=f"Resolviendo... paso {num_paso}  ({operacion})",
+            )
+
+        self.after(1, lambda: self.reproducir_pasos(sistema, pasos, num_paso))
+
+    def mostrar_resultado(self, sistema: "SistemaEcuaciones", met: str) -> None:
+        """
+        Mostrar la solución de un sistema resuelto,
+        y el botón para mostrar su procedimiento.
+
+        Args:
+            sistema: Sistema resuelto.
+            met:     Método con que se resolvió el sistema.
+
+        """
+
         delete_msg_frame(self.msg_frame)
         self.msg_frame = place_msg_frame(
             parent_frame=self,
@@ -132,7 +220,7 @@ class ResolverSisFrame(CustomScrollFrame):
 
         proc_text = (
             sistema.procedimiento
-            if met == "gj"
+            if met != "c"
             else sistema.procedimiento + sistema.solucion
         )
 
@@ -184,6 +272,7 @@ class ResolverSisFrame(CustomScrollFrame):
         """
 
         self.sis_mat = valor
+        self.pasos_actuales = None
         delete_msg_frame(self.msg_frame)
 
         for widget in self.winfo_children():
@@ -225,6 +314,7 @@ class ResolverSisFrame(CustomScrollFrame):
         """
 
         self.met = valor
+        self.pasos_actuales = None
         for widget in self.winfo_children():
             if widget.grid_info()["row"] > 4:
                 widget.destroy()
@@ -17,7 +17,7 @@ from customtkinter import (
 )
 
 from src import FRAC_PREC
-from src.managers import FuncManager, OpsManager
+from src.managers import FuncManager, OpsManager, TareasManager
 from src.utils import CONFIG_PATH, LOGGER, THEMES, set_icon
 
 from .frames import (
@@ -66,6 +66,7 @@ class GaussUI(CTk):
         self.ops_manager = OpsManager()
         self.mats_manager = self.ops_manager.mats_manager
         self.vecs_manager = self.ops_manager.vecs_manager
+        self.tareas_manager = TareasManager()
 
         # inicializar frames
         self.home_frame = HomeFrame(app=self, master=self)
@@ -7,14 +7,19 @@ from .binding_manager import KeyBindingManager
 from .mats_manager import MatricesManager
 from .vecs_manager import VectoresManager
 from .ops_manager import OpsManager
-from .func_manager import MARGEN_ERROR, MAX_ITERACIONES, FuncManager
+from .func_manager import LIMITE_SIMBOLICO, MARGEN_ERROR, MAX_ITERACIONES, FuncManager
+from .tareas_manager import LIMITE_TAREA, Tarea, TareasManager
 
 __all__: list[str] = [
+    "LIMITE_SIMBOLICO",
+    "LIMITE_TAREA",
     "MARGEN_ERROR",
     "MAX_ITERACIONES",
     "FuncManager",
     "KeyBindingManager",
     "MatricesManager",
     "OpsManager",
+    "Tarea",
+    "TareasManager",
     "VectoresManager",
 ]
@@ -2,18 +2,120 @@
 Implementación de manejador de funciones matemáticas.
 """
 
-from decimal import Decimal
+from collections.abc import Callable, Sequence
+from decimal import Decimal, getcontext
+from fractions import Fraction
 from json import JSONDecodeError, dump, load
+from sys import float_info
+from time import perf_counter
 
 from customtkinter import CTkImage
-from sympy import lambdify
-from sympy.sets import Contains
-
-from src.models import Func
-from src.utils import FUNCIONES_PATH, LOGGER
-
+from mpmath import mpf, nstr, workdps
+from numpy import (
+    absolute,
+    arange,
+    array,
+    asarray,
+    broadcast_to,
+    concatenate,
+    diff,
+    errstate,
+    flatnonzero,
+    float64,
+    full,
+    inf,
+    int64,
+    isfinite,
+    linspace,
+    maximum,
+    minimum,
+    ones,
+    sign,
+    sort,
+    zeros,
+)
+from numpy.typing import NDArray
+from sympy import Expr, Integral, nan, oo, srepr, zoo
+
+from src.models import Func, Matriz, Polinomio, RegistroIteraciones, SistemaNoLineal
+from src.utils import CALCULOS_PATH, FUNCIONES_PATH, LOGGER
+
+EPSILON: float = float_info.epsilon
 MARGEN_ERROR = Decimal("1e-4")
 MAX_ITERACIONES: int = 100
+PUNTOS_MUESTREO: int = 2001
+
+# digitos significativos de un float, con los que se empieza
+# a refinar en precision arbitraria, y digitos de guarda extra
+DIGITOS_FLOAT: int = float_info.dig
+DIGITOS_GUARDA: int = 5
+
+# segundos que se espera a la integracion simbolica,
+# y presupuesto de tiempo de la integracion numerica
+LIMITE_SIMBOLICO: float = 5.0
+LIMITE_NUMERICO: float = 2.0
+
+# nodos de Gauss-Kronrod de 15 puntos en [-1, 1], con los pesos de Kronrod
+# y los de la regla de Gauss de 7 puntos (que usa los nodos impares)
+NODOS_KRONROD = array(
+    [
+        -0.991455371120812639206854697526329,
+        -0.949107912342758524526189684047851,
+        -0.864864423359769072789712788640926,
+        -0.741531185599394439863864773280788,
+        -0.586087235467691130294144845693013,
+        -0.405845151377397166906606412076961,
+        -0.207784955007898467600689403773245,
+        0.0,
+        0.207784955007898467600689403773245,
+        0.405845151377397166906606412076961,
+        0.586087235467691130294144845693013,
+        0.741531185599394439863864773280788,
+        0.864864423359769072789712788640926,
+        0.949107912342758524526189684047851,
+        0.991455371120812639206854697526329,
+    ],
+)
+
+PESOS_KRONROD = array(
+    [
+        0.022935322010529224963732008058970,
+        0.063092092629978553290700663189204,
+        0.104790010322250183839876322541518,
+        0.140653259715525918745189590510238,
+        0.169004726639267902826583426598550,
+        0.190350578064785409913256402421014,
+        0.204432940075298892414161999234649,
+        0.209482141084727828012999174891714,
+        0.204432940075298892414161999234649,
+        0.190350578064785409913256402421014,
+        0.169004726639267902826583426598550,
+        0.140653259715525918745189590510238,
+        0.104790010322250183839876322541518,
+        0.063092092629978553290700663189204,
+        0.022935322010529224963732008058970,
+    ],
+)
+
+PESOS_GAUSS = array(
+    [
+        0.0,
+        0.129484966168869693270611432679082,
+        0.0,
+        0.279705391489276667901467771423780,
+        0.0,
+        0.381830050505118944950369775488975,
+        0.0,
+        0.417959183673469387755102040816327,
+        0.0,
+        0.381830050505118944950369775488975,
+        0.0,
+        0.279705391489276667901467771423780,
+        0.0,
+        0.129484966168869693270611432679082,
+        0.0,
+    ],
+)
 
 
 class FuncManager:
@@ -36,6 +138,7 @@ class FuncManager:
 
         if funcs_ingresadas is None:
             self.funcs_ingresadas: dict[str, Func] = self._load_funcs()
+            self._load_calculos()
         elif isinstance(funcs_ingresadas, dict) and all(
             isinstance(k, str) and isinstance(v, Func)
             for k, v in funcs_ingresadas.items()
@@ -63,7 +166,7 @@ class FuncManager:
         intervalo: tuple[Decimal, Decimal],
         error: Decimal = MARGEN_ERROR,
         max_its: int = MAX_ITERACIONES,
-    ) -> bool | tuple[Decimal, Decimal, list[list[str]], int]:
+    ) -> bool | tuple[Decimal, Decimal, RegistroIteraciones, int]:
         """
         Implementación del método de bisección,
         un método cerrado para encontrar raíces de funciones.
@@ -79,7 +182,7 @@ class FuncManager:
                 Si el método de bisección no es aplicable a la función:
                 True si la función no cambia de signo,
                 False si no es continua en el intervalo.
-            (Decimal, Decimal, list[list[str]], int):
+            (Decimal, Decimal, RegistroIteraciones, int):
                 Valor x de raíz,
                 valor y de raíz,
                 registro de iteraciones e
@@ -87,69 +190,66 @@ class FuncManager:
 
         """
 
-        if not func.es_continua(intervalo):
-            return False
-
-        registro: list[list[str]] = [
-            [
-                "Iteración",
-                "a",
-                "b",
-                "c",
-                "E",
-                f"{func.nombre[0]}(a)",
-                f"{func.nombre[0]}(b)",
-                f"{func.nombre[0]}(c)",
-            ],
-        ]
+        return FuncManager._metodo_cerrado(
+            func,
+            intervalo,
+            lambda a, b, _fa, _fb: (a + b) / 2,
+            "c",
+            error=error,
+            max_its=max_its,
+        )
 
-        a, b = float(intervalo[0]), float(intervalo[1])
-        f = lambdify(func.var, func.expr)
+    @staticmethod
+    def falsa_posicion(
+        func: Func,
+        intervalo: tuple[Decimal, Decimal],
+        error: Decimal = MARGEN_ERROR,
+        max_its: int = MAX_ITERACIONES,
+    ) -> bool | tuple[Decimal, Decimal, RegistroIteraciones, int]:
+        """
+        Implementación del método de falsa posición,
+        un método cerrado para encontrar raíces de funciones.
 
-        fa = float(f(a))
-        fb = float(f(b))
-        if fa * fb > 0:
-            return True
+        Args:
+            func:      Función que se trabajará.
+            intervalo: Dominio sobre cual se buscará la raíz.
+            error:     Margen de error aceptable para terminar búsqueda.
+            max_its:   Número máximo de iteraciones aceptable para terminar búsqueda.
 
-        i: int = 0
-        while i < max_its:
-            i += 1
+        Returns:
+            bool:
+                Si el método de falsa posición no es aplicable a la función:
+                True si la función no cambia de signo,
+                False si no es continua en el intervalo.
+            (Decimal, Decimal, RegistroIteraciones, int):
+                Valor x de raíz,
+                valor y de raíz,
+                registro de iteraciones e
+                iteración final.
 
-            c = float((a + b) / 2)
-            fc = float(f(c))
-            fa = float(f(a))
-            fb = float(f(b))
-            registro.append(
-                [
-                    str(i),
-                    FuncManager._format_decimal(a),
-                    FuncManager._format_decimal(b),
-                    FuncManager._format_decimal(c),
-                    FuncManager._format_decimal(fc),
-                    FuncManager._format_decimal(fa),
-                    FuncManager._format_decimal(fb),
-                    FuncManager._format_decimal(fc),
-                ],
-            )
+        """
 
-            if abs(fc) < error:
-                return (Decimal(c), Decimal(fc), registro, i)
-            if fa * fc < 0:
-                b: float = c
-            elif fb * fc < 0:
-                a: float = c
-        return (Decimal(c), Decimal(fc), registro, -1)  # type: ignore[reportPossiblyUnboundVariable]
+        return FuncManager._metodo_cerrado(
+            func,
+            intervalo,
+            lambda a, b, fa, fb: b - (fb * (a - b)) / (fa - fb),
+            "xᵣ",
+            error=error,
+            max_its=max_its,
+        )
 
     @staticmethod
-    def falsa_posicion(
+    def illinois(
         func: Func,
         intervalo: tuple[Decimal, Decimal],
         error: Decimal = MARGEN_ERROR,
         max_its: int = MAX_ITERACIONES,
-    ) -> bool | tuple[Decimal, Decimal, list[list[str]], int]:
+    ) -> bool | tuple[Decimal, Decimal, RegistroIteraciones, int]:
         """
-        Implementación del método de bisección,
-        un método cerrado para encontrar raíces de funciones.
+        Implementación del método de Illinois, una variante de falsa posición
+        que, cuando el mismo extremo se retiene dos veces seguidas,
+        divide a la mitad su valor de f en la fórmula de la secante.
+        Así evita que un extremo se estanque, y converge superlinealmente.
 
         Args:
             func:      Función que se trabajará.
@@ -159,10 +259,10 @@ class FuncManager:
 
         Returns:
             bool:
-                Si el método de bisección no es aplicable a la función:
+                Si el método de Illinois no es aplicable a la función:
                 True si la función no cambia de signo,
                 False si no es continua en el intervalo.
-            (Decimal, Decimal, list[list[str]], int):
+            (Decimal, Decimal, RegistroIteraciones, int):
                 Valor x de raíz,
                 valor y de raíz,
                 registro de iteraciones e
@@ -170,58 +270,526 @@ class FuncManager:
 
         """
 
+        return FuncManager._metodo_cerrado(
+            func,
+            intervalo,
+            lambda a, b, fa, fb: b - (fb * (a - b)) / (fa - fb),
+            "xᵣ",
+            error=error,
+            max_its=max_its,
+            illinois=True,
+        )
+
+    @staticmethod
+    def brent(
+        func: Func,
+        intervalo: tuple[Decimal, Decimal],
+        error: Decimal = MARGEN_ERROR,
+        max_its: int = MAX_ITERACIONES,
+    ) -> bool | tuple[Decimal, Decimal, RegistroIteraciones, int]:
+        """
+        Implementación del método de Brent, un método cerrado que combina
+        interpolación cuadrática inversa, secante y bisección. Usa el paso
+        interpolado cuando reduce el intervalo lo suficiente, y si no,
+        biseca; por lo tanto, siempre converge, y en funciones suaves
+        lo hace en pocas iteraciones.
+
+        En el registro de iteraciones, b es la mejor aproximación
+        hasta el momento, y a es el extremo opuesto del intervalo.
+
+        Args:
+            func:      Función que se trabajará.
+            intervalo: Dominio sobre cual se buscará la raíz.
+            error:     Margen de error aceptable para terminar búsqueda.
+            max_its:   Número máximo de iteraciones aceptable para terminar búsqueda.
+
+        Returns:
+            bool:
+                Si el método de Brent no es aplicable a la función:
+                True si la función no cambia de signo,
+                False si no es continua en el intervalo.
+            (Decimal, Decimal, RegistroIteraciones, int):
+                Valor x de raíz,
+                valor y de raíz,
+                registro de iteraciones e
+                iteración final (-1 si no se encontró la raíz).
+
+        """
+
+        preparado = FuncManager._preparar_cerrado(func, intervalo, "s")
+        if isinstance(preparado, bool):
+            return preparado
+
+        registro, f, a, b, fa, fb = preparado
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+
+        # c es el valor anterior de b, y d el anterior de c
+        c, fc, d = a, fa, a
+        biseccion_anterior = True
+
+        s, fs = b, fb
+        for i in range(1, max_its + 1):
+            tolerancia: float = 2 * EPSILON * abs(b)
+            if abs(b - a) <= tolerancia:
+                # el intervalo ya no se puede reducir en punto flotante
+                break
+
+            if fa not in (fb, fc) and fb != fc:
+                # interpolacion cuadratica inversa
+                s = (
+                    a * fb * fc / ((fa - fb) * (fa - fc))
+                    + b * fa * fc / ((fb - fa) * (fb - fc))
+                    + c * fa * fb / ((fc - fa) * (fc - fb))
+                )
+            else:
+                # secante
+                s = b - fb * (b - a) / (fb - fa)
+
+            # rechazar el paso interpolado si cae fuera de [(3a + b) / 4, b],
+            # o si no reduce el paso lo suficiente respecto a los anteriores
+            paso_previo: float = abs(b - c) if biseccion_anterior else abs(c - d)
+            if (
+                not min((3 * a + b) / 4, b) < s < max((3 * a + b) / 4, b)
+                or abs(s - b) >= paso_previo / 2
+                or paso_previo < tolerancia
+            ):
+                s = (a + b) / 2
+                biseccion_anterior = True
+            else:
+                biseccion_anterior = False
+
+            fs = float(f(s))
+            registro.agregar(a, b, s, fs, fa, fb, fs)
+            if abs(fs) < error:
+                return (Decimal(s), Decimal(fs), registro, i)
+
+            d, c, fc = c, b, fb
+            if fa * fs < 0:
+                b, fb = s, fs
+            else:
+                a, fa = s, fs
+
+            if abs(fa) < abs(fb):
+                a, b, fa, fb = b, a, fb, fa
+        return (Decimal(s), Decimal(fs), registro, -1)
+
+    @staticmethod
+    def _preparar_cerrado(
+        func: Func,
+        intervalo: tuple[Decimal, Decimal],
+        nombre_x: str,
+    ) -> bool | tuple[RegistroIteraciones, Callable, float, float, float, float]:
+        """
+        Validar el intervalo de un método cerrado,
+        y preparar su registro de iteraciones.
+
+        Args:
+            func:      Función que se trabajará.
+            intervalo: Dominio sobre cual se buscará la raíz.
+            nombre_x:  Nombre del punto en el registro de iteraciones.
+
+        Returns:
+            bool:
+                Si el método no es aplicable a la función:
+                True si la función no cambia de signo,
+                False si no es continua en el intervalo.
+            (RegistroIteraciones, Callable, float, float, float, float):
+                Registro vacío, evaluador de la función, a, b, f(a) y f(b).
+
+        """
+
         if not func.es_continua(intervalo):
             return False
 
-        registro: list[list[str]] = [
+        letra: str = func.nombre[0]
+        registro = RegistroIteraciones(
             [
                 "Iteración",
                 "a",
                 "b",
-                "xᵣ",
+                nombre_x,
                 "E",
-                f"{func.nombre[0]}(a)",
-                f"{func.nombre[0]}(b)",
-                f"{func.nombre[0]}(xᵣ)",
+                f"{letra}(a)",
+                f"{letra}(b)",
+                f"{letra}({nombre_x})",
             ],
-        ]
+        )
 
         a, b = float(intervalo[0]), float(intervalo[1])
-        f = lambdify(func.var, func.expr)
+        f = func.evaluador(modulo="numpy")
 
         fa = float(f(a))
         fb = float(f(b))
         if fa * fb > 0:
             return True
+        return (registro, f, a, b, fa, fb)
 
-        i: int = 0
-        while i < max_its:
-            i += 1
-            fa = float(f(a))
-            fb = float(f(b))
+    @staticmethod
+    def _metodo_cerrado(  # noqa: PLR0913
+        func: Func,
+        intervalo: tuple[Decimal, Decimal],
+        siguiente: Callable[[float, float, float, float], float],
+        nombre_x: str,
+        *,
+        error: Decimal,
+        max_its: int,
+        illinois: bool = False,
+    ) -> bool | tuple[Decimal, Decimal, RegistroIteraciones, int]:
+        """
+        Núcleo común de los métodos cerrados. En cada iteración se elige
+        un punto dentro del intervalo [a, b], y se reemplaza el extremo
+        con el mismo signo que el punto. La función se evalúa una sola vez
+        por iteración: los valores de los extremos se arrastran
+        de una iteración a la siguiente.
 
-            xr = float(b - (fb * (a - b)) / (fa - fb))
-            fxr = float(f(xr))
-            registro.append(
-                [
-                    str(i),
-                    FuncManager._format_decimal(a),
-                    FuncManager._format_decimal(b),
-                    FuncManager._format_decimal(xr),
-                    FuncManager._format_decimal(fxr),
-                    FuncManager._format_decimal(fa),
-                    FuncManager._format_decimal(fb),
-                    FuncManager._format_decimal(fxr),
-                ],
+        Args:
+            func:      Función que se trabajará.
+            intervalo: Dominio sobre cual se buscará la raíz.
+            siguiente: Calcula el siguiente punto a partir de (a, b, f(a), f(b)).
+            nombre_x:  Nombre del punto en el registro de iteraciones.
+            error:     Margen de error aceptable para terminar búsqueda.
+            max_its:   Número máximo de iteraciones aceptable para terminar búsqueda.
+            illinois:  Si se debe dividir a la mitad el valor de f
+                       de un extremo retenido dos veces seguidas.
+
+        Returns:
+            bool:
+                Si el método no es aplicable a la función:
+                True si la función no cambia de signo,
+                False si no es continua en el intervalo.
+            (Decimal, Decimal, RegistroIteraciones, int):
+                Valor x de raíz,
+                valor y de raíz,
+                registro de iteraciones e
+                iteración final (-1 si no se encontró la raíz).
+
+        """
+
+        preparado = FuncManager._preparar_cerrado(func, intervalo, nombre_x)
+        if isinstance(preparado, bool):
+            return preparado
+
+        registro, f, a, b, fa, fb = preparado
+
+        # pesos de f(a) y f(b) en siguiente(), y ultimo extremo reemplazado;
+        # sin illinois, los pesos siempre son 1
+        peso_a, peso_b = 1.0, 1.0
+        reemplazado: str = ""
+
+        x, fx = a, fa
+        for i in range(1, max_its + 1):
+            x = float(siguiente(a, b, fa * peso_a, fb * peso_b))
+            fx = float(f(x))
+            registro.agregar(a, b, x, fx, fa, fb, fx)
+
+            if abs(fx) < error:
+                return (Decimal(x), Decimal(fx), registro, i)
+            if fa * fx < 0:
+                b, fb, peso_b = x, fx, 1.0
+                if illinois and reemplazado == "b":
+                    peso_a /= 2
+                reemplazado = "b"
+            elif fb * fx < 0:
+                a, fa, peso_a = x, fx, 1.0
+                if illinois and reemplazado == "a":
+                    peso_b /= 2
+                reemplazado = "a"
+        return (Decimal(x), Decimal(fx), registro, -1)
+
+    @staticmethod
+    def todas_las_raices(
+        func: Func,
+        intervalo: tuple[Decimal, Decimal],
+        error: Decimal = MARGEN_ERROR,
+        max_its: int = MAX_ITERACIONES,
+        puntos: int = PUNTOS_MUESTREO,
+    ) -> list[tuple[Decimal, Decimal, int]]:
+        """
+        Encontrar todas las raíces de una función en un intervalo.
+
+        La función se evalúa una sola vez sobre una malla de puntos
+        del intervalo, y se buscan cambios de signo entre puntos vecinos;
+        cada uno encierra una raíz. Las raíces de multiplicidad par
+        no cambian el signo, así que también se buscan mínimos locales de |f|,
+        y se localizan encerrando el cambio de signo de f' a su alrededor.
+        Todos los intervalos se refinan a la vez con el método de Illinois,
+        evaluando la función en un solo arreglo por iteración.
+
+        Los cambios de signo causados por asíntotas no convergen,
+        y |f| crece en lugar de disminuir, así que se descartan.
+
+        Si la función es un polinomio, no se muestrea: sus raíces
+        se calculan directamente con _raices_polinomio().
+
+        Args:
+            func:      Función que se trabajará.
+            intervalo: Dominio sobre cual se buscarán las raíces.
+            error:     Margen de error aceptable para terminar búsqueda.
+            max_its:   Número máximo de iteraciones aceptable para terminar búsqueda.
+            puntos:    Número de puntos de la malla de muestreo.
+
+        Returns:
+            list[(Decimal, Decimal, int)]:
+                Valor x, valor y e iteración final de cada raíz, ordenadas por x
+                (iteración 0 si la raíz cae en la malla,
+                -1 si no se llegó al margen de error).
+
+        """
+
+        polinomio: Polinomio | None = func.polinomio
+        if polinomio is not None:
+            return FuncManager._raices_polinomio(polinomio, intervalo, error, max_its)
+
+        f = func.evaluador(modulo="numpy")
+        xs = linspace(float(intervalo[0]), float(intervalo[1]), puntos)
+        ys = FuncManager._evaluar_arreglo(f, xs)
+
+        with errstate(all="ignore"):
+            finitos = isfinite(ys)
+            signos = sign(ys)
+
+        # raices que caen exactamente en la malla
+        exactas = flatnonzero(ys == 0)
+
+        # cambios de signo entre puntos vecinos
+        cambios = flatnonzero(
+            finitos[:-1] & finitos[1:] & (signos[:-1] * signos[1:] < 0),
+        )
+
+        # minimos locales de |f| sin cambio de signo alrededor
+        with errstate(all="ignore"):
+            absolutos = absolute(ys)
+        minimos = 1 + flatnonzero(
+            finitos[:-2]
+            & finitos[1:-1]
+            & finitos[2:]
+            & (signos[:-2] == signos[1:-1])
+            & (signos[1:-1] == signos[2:])
+            & (signos[1:-1] != 0)
+            & (absolutos[1:-1] < absolutos[:-2])
+            & (absolutos[1:-1] <= absolutos[2:]),
+        )
+
+        raices: list[tuple[Decimal, Decimal, int]] = [
+            (Decimal(xs[i]), Decimal(0), 0) for i in exactas
+        ]
+
+        if cambios.size > 0:
+            x, fx, its = FuncManager._refinar_intervalos(
+                f,
+                xs[cambios],
+                xs[cambios + 1],
+                ys[cambios],
+                ys[cambios + 1],
+                error=float(error),
+                max_its=max_its,
             )
 
-            if abs(fxr) < error:
-                return (Decimal(xr), Decimal(fxr), registro, i)
-            if fa * fxr < 0:
-                b: float = xr
-            elif fb * fxr < 0:
-                a: float = xr
-        return (Decimal(xr), Decimal(fxr), registro, -1)  # type: ignore[reportPossiblyUnboundVariable]
+            # descartar asintotas: |f| crece en lugar de disminuir
+            limite = minimum(absolutos[cambios], absolutos[cambios + 1])
+            validas = (its != -1) | (absolute(fx) <= limite)
+            x, fx, its = x[validas], fx[validas], its[validas]
+            raices.extend(
+                (Decimal(xi), Decimal(fxi), int(i))
+                for xi, fxi, i in zip(x, fx, its, strict=True)
+            )
+
+        if minimos.size > 0:
+            f_prima = func.evaluador(1, modulo="numpy")
+            izq, der = xs[minimos - 1], xs[minimos + 1]
+            fp_izq = FuncManager._evaluar_arreglo(f_prima, izq)
+            fp_der = FuncManager._evaluar_arreglo(f_prima, der)
+
+            with errstate(all="ignore"):
+                encerrados = flatnonzero(fp_izq * fp_der < 0)
+
+            if encerrados.size > 0:
+                x, _, its = FuncManager._refinar_intervalos(
+                    f_prima,
+                    izq[encerrados],
+                    der[encerrados],
+                    fp_izq[encerrados],
+                    fp_der[encerrados],
+                    error=float(error),
+                    max_its=max_its,
+                )
+
+                # solo los extremos donde f se anula son raices
+                fx = FuncManager._evaluar_arreglo(f, x)
+                with errstate(all="ignore"):
+                    validas = absolute(fx) < float(error)
+
+                x, fx, its = x[validas], fx[validas], its[validas]
+                raices.extend(
+                    (Decimal(xi), Decimal(fxi), int(i))
+                    for xi, fxi, i in zip(x, fx, its, strict=True)
+                )
+
+        return sorted(raices, key=lambda raiz: raiz[0])
+
+    @staticmethod
+    def _raices_polinomio(
+        polinomio: Polinomio,
+        intervalo: tuple[Decimal, Decimal],
+        error: Decimal,
+        max_its: int,
+    ) -> list[tuple[Decimal, Decimal, int]]:
+        """
+        Encontrar las raíces reales de un polinomio en un intervalo.
+        Las raíces racionales se encuentran de forma exacta (iteración 0),
+        y las demás son los valores propios reales de la matriz compañera
+        del polinomio deflactado, pulidos con el método de Newton
+        evaluando el polinomio y su derivada con el método de Horner.
+
+        Args:
+            polinomio: Polinomio del cual encontrar las raíces.
+            intervalo: Dominio sobre cual se buscarán las raíces.
+            error:     Margen de error aceptable para terminar búsqueda.
+            max_its:   Número máximo de iteraciones aceptable para terminar búsqueda.
+
+        Returns:
+            list[(Decimal, Decimal, int)]:
+                Valor x, valor y e iteración final de cada raíz, ordenadas por x
+                (-1 si no se llegó al margen de error).
+
+        """
+
+        a, b = Fraction(intervalo[0]), Fraction(intervalo[1])
+        racionales, resto = polinomio.raices_racionales()
+        raices: list[tuple[Decimal, Decimal, int]] = [
+            (Decimal(r.numerator) / Decimal(r.denominator), Decimal(0), 0)
+            for r in sorted(set(racionales))
+            if a <= r <= b
+        ]
+
+        # las raices multiples se separan en valores propios cercanos
+        # (o con una parte imaginaria pequeña), del orden de 1e-8
+        propios = resto.raices_numericas()
+        reales = sort(
+            propios.real[
+                absolute(propios.imag) <= 1e-6 * maximum(1, absolute(propios))
+            ],
+        )
+        distintas = reales[
+            diff(reales, prepend=-inf) > 1e-6 * maximum(1, absolute(reales))
+        ]
+
+        # los valores propios son raices de resto (no del polinomio completo),
+        # asi que se pulen con resto y su derivada; del polinomio completo
+        # solo se reporta el residuo en la raiz encontrada
+        tolerancia = float(error)
+        derivada: Polinomio = resto.derivada()
+        for propio in distintas.tolist():
+            x, rx, its = propio, resto.evaluar(propio), 0
+            estancado: bool = False
+            while abs(rx) >= tolerancia and not estancado and its < max_its:
+                rx_prima: float = derivada.evaluar(x)
+                if rx_prima == 0:
+                    break
+
+                paso: float = rx / rx_prima
+                x -= paso
+                rx = resto.evaluar(x)
+                estancado = abs(paso) <= 2 * EPSILON * abs(x)
+                its += 1
+
+            if a <= x <= b:
+                raices.append(
+                    (
+                        Decimal(x),
+                        Decimal(polinomio.evaluar(x)),
+                        its if abs(rx) < tolerancia or estancado else -1,
+                    ),
+                )
+        return sorted(raices, key=lambda raiz: raiz[0])
+
+    @staticmethod
+    def _refinar_intervalos(  # noqa: PLR0913
+        f: Callable,
+        a: NDArray[float64],
+        b: NDArray[float64],
+        fa: NDArray[float64],
+        fb: NDArray[float64],
+        *,
+        error: float,
+        max_its: int,
+    ) -> tuple[NDArray[float64], NDArray[float64], NDArray[int64]]:
+        """
+        Aplicar el método de Illinois a varios intervalos a la vez.
+        En cada iteración, f se evalúa en un solo arreglo con los puntos
+        de los intervalos que todavía no han convergido.
+
+        Args:
+            f:       Evaluador vectorizado de la función.
+            a:       Extremos izquierdos de los intervalos.
+            b:       Extremos derechos de los intervalos.
+            fa:      Valores de f en a.
+            fb:      Valores de f en b.
+            error:   Margen de error aceptable para terminar búsqueda.
+            max_its: Número máximo de iteraciones aceptable para terminar búsqueda.
+
+        Returns:
+            (NDArray[float64], NDArray[float64], NDArray[int64]):
+                Valores x y valores y de las raíces, e iteración final
+                de cada intervalo (-1 si no se llegó al margen de error).
+
+        """
+
+        a, b, fa, fb = a.copy(), b.copy(), fa.copy(), fb.copy()
+        x, fx = a.copy(), fa.copy()
+        its = full(a.size, -1, dtype=int64)
+
+        # pesos de f(a) y f(b), y ultimo extremo reemplazado (1: a, 2: b)
+        peso_a, peso_b = ones(a.size), ones(a.size)
+        reemplazado = zeros(a.size, dtype=int64)
+
+        activos = arange(a.size)
+        for i in range(1, max_its + 1):
+            if activos.size == 0:
+                break
+
+            with errstate(all="ignore"):
+                fa_pesado = fa[activos] * peso_a[activos]
+                fb_pesado = fb[activos] * peso_b[activos]
+                x[activos] = b[activos] - fb_pesado * (a[activos] - b[activos]) / (
+                    fa_pesado - fb_pesado
+                )
+
+                fx[activos] = FuncManager._evaluar_arreglo(f, x[activos])
+                convergidos = absolute(fx[activos]) < error
+                reemplazar_b = ~convergidos & (fa[activos] * fx[activos] < 0)
+                reemplazar_a = ~convergidos & (fb[activos] * fx[activos] < 0)
+
+            its[activos[convergidos]] = i
+
+            en_b = activos[reemplazar_b]
+            peso_a[en_b[reemplazado[en_b] == 2]] /= 2
+            b[en_b], fb[en_b], peso_b[en_b], reemplazado[en_b] = x[en_b], fx[en_b], 1, 2
+
+            en_a = activos[reemplazar_a]
+            peso_b[en_a[reemplazado[en_a] == 1]] /= 2
+            a[en_a], fa[en_a], peso_a[en_a], reemplazado[en_a] = x[en_a], fx[en_a], 1, 1
+
+            # los intervalos que ya no se pueden reducir en punto flotante,
+            # o donde f dejo de ser finita, no van a converger
+            activos = activos[reemplazar_a | reemplazar_b]
+            activos = activos[
+                absolute(b[activos] - a[activos]) > 2 * EPSILON * absolute(x[activos])
+            ]
+
+        return (x, fx, its)
+
+    @staticmethod
+    def _evaluar_arreglo(f: Callable, xs: NDArray[float64]) -> NDArray[float64]:
+        """
+        Evaluar un evaluador vectorizado sobre un arreglo, sin advertencias
+        de numpy; las funciones constantes retornan un escalar,
+        así que el resultado se extiende a la forma de xs.
+        """
+
+        with errstate(all="ignore"):
+            return broadcast_to(asarray(f(xs), dtype=float64), xs.shape).copy()
 
     @staticmethod
     def newton(
@@ -234,6 +802,10 @@ class FuncManager:
         Implementación del método de Newton,
         un método abierto para encontrar raíces de funciones.
 
+        Se itera en punto flotante, y si xᵢ deja de cambiar antes de llegar
+        al margen de error (porque es menor que la resolución de un float),
+        se continúa en precisión arbitraria con _newton_mp().
+
         Args:
             func:    Función que se trabajará.
             inicial: Valor inicial de búsqueda.
@@ -271,14 +843,12 @@ class FuncManager:
         ]
 
         derivada = func.derivar()
-        dominio_derivada = derivada.get_dominio()
-        dominio_func = func.get_dominio()
 
-        f = lambdify(func.var, func.expr)
-        f_prima = lambdify(func.var, derivada.expr)
+        f = func.evaluador(modulo="numpy")
+        f_prima = func.evaluador(1, modulo="numpy")
 
         xi = float(inicial)
-        if not Contains(xi, dominio_derivada):
+        if not derivada.en_dominio(xi):
             return (Decimal(xi), Decimal(float(f(xi))), registro, 0, 1)
 
         i: int = 0
@@ -288,12 +858,28 @@ class FuncManager:
             fxi_prima = float(f_prima(xi))
 
             temp_xi = xi
-            if not Contains(temp_xi, dominio_func):
+            if not func.en_dominio(temp_xi):
                 return (Decimal(temp_xi), Decimal(fxi), registro, i, 2)
-            if not Contains(temp_xi, dominio_derivada):
+            if not derivada.en_dominio(temp_xi):
                 return (Decimal(temp_xi), Decimal(fxi), registro, i, 1)
 
             xi -= fxi / fxi_prima
+            estancado: bool = abs(xi - temp_xi) <= 2 * EPSILON * abs(xi)
+            if (abs(fxi) < error or estancado) and FuncManager._digitos_objetivo(
+                error,
+                xi,
+            ) > DIGITOS_FLOAT:
+                # el float no alcanza la precision pedida,
+                # repetir esta iteracion con mpmath
+                return FuncManager._newton_mp(
+                    func,
+                    temp_xi,
+                    error,
+                    its=i - 1,
+                    max_its=max_its,
+                    registro=registro,
+                )
+
             registro.append(
                 [
                     str(i),
@@ -321,6 +907,11 @@ class FuncManager:
         Implementación del método de la secante,
         un método abierto para encontrar raíces de funciones.
 
+        Se itera en punto flotante, y si la secante deja de estar definida
+        antes de llegar al margen de error (porque los valores son menores
+        que la resolución de un float), se continúa en precisión
+        arbitraria con _secante_mp().
+
         Args:
             func:      Función que se trabajará.
             iniciales: Par de valores iniciales de búsqueda.
@@ -349,13 +940,36 @@ class FuncManager:
         registro: list[list[str]] = [["Iteración", "xᵢ − 1", "xᵢ", "xᵢ + 1"]]
 
         xi, xn = float(iniciales[0]), float(iniciales[1])
-        f = lambdify(func.var, func.expr)
-        f_dominio = func.get_dominio()
+        f = func.evaluador(modulo="numpy")
 
         i: int = 0
         while i < max_its:
             i += 1
             fxi, fxn = float(f(xi)), float(f(xn))
+            estancado: bool = fxi == fxn or abs(xn - xi) <= 2 * EPSILON * abs(xn)
+            if (abs(fxn) < error or estancado) and FuncManager._digitos_objetivo(
+                error,
+                xn,
+            ) > DIGITOS_FLOAT:
+                return FuncManager._secante_mp(
+                    func,
+                    (xi, xn),
+                    error,
+                    its=i - 1,
+                    max_its=max_its,
+                    registro=registro,
+                )
+
+            if fxi == fxn:
+                # la secante no esta definida; xn puede ser ya una raiz
+                return (
+                    Decimal(xn),
+                    Decimal(fxn),
+                    registro,
+                    i,
+                    0 if abs(fxn) < error else -1,
+                )
+
             new_xn = float(xn - (fxn * (xi - xn)) / (fxi - fxn))
 
             registro.append(
@@ -371,12 +985,424 @@ class FuncManager:
                 return (Decimal(xn), Decimal(fxn), registro, i, 0)
 
             xi, xn = xn, new_xn
-            if xn not in f_dominio:
+            if not func.en_dominio(xn):
                 return (Decimal(xn), Decimal(fxn), registro, i, 2)
         return (Decimal(xn), Decimal(fxn), registro, max_its, -1)  # type: ignore[reportPossiblyUnboundVariable]
 
     @staticmethod
-    def _format_decimal(num: float) -> str:
+    def _newton_mp(  # noqa: PLR0913
+        func: Func,
+        inicial: float,
+        error: Decimal,
+        *,
+        its: int,
+        max_its: int,
+        registro: list[list[str]],
+    ) -> tuple[Decimal, Decimal, list[list[str]], int, int]:
+        """
+        Continuar el método de Newton en precisión arbitraria con mpmath.
+        Cada iteración de Newton duplica los dígitos correctos, así que
+        la precisión empieza en la de un float y se duplica en cada paso,
+        hasta llegar a los dígitos que requieren el margen de error
+        y la precisión de Decimal; solo los últimos pasos pagan
+        el costo de la precisión completa.
+
+        Args:
+            func:     Función que se trabajará.
+            inicial:  Aproximación de punto flotante de la cual partir.
+            error:    Margen de error aceptable para terminar búsqueda.
+            its:      Iteraciones ya realizadas en punto flotante.
+            max_its:  Número máximo de iteraciones aceptable para terminar búsqueda.
+            registro: Registro de iteraciones a continuar.
+
+        Returns:
+            (Decimal, Decimal, list[list[str]], int, int):
+                Lo mismo que newton() (con bandera -1 o 0).
+
+        """
+
+        f = func.evaluador(modulo="mpmath")
+        f_prima = func.evaluador(1, modulo="mpmath")
+
+        objetivo: int = FuncManager._digitos_objetivo(error, inicial)
+        digitos: int = DIGITOS_FLOAT
+
+        xi = fxi = mpf(inicial)
+        while its < max_its:
+            its += 1
+            digitos = min(2 * digitos, objetivo)
+            with workdps(digitos):
+                fxi, fxi_prima = f(xi), f_prima(xi)
+                temp_xi = xi
+
+                xi -= fxi / fxi_prima if fxi_prima != 0 else 0
+                registro.append(
+                    [
+                        str(its),
+                        *(
+                            FuncManager._format_decimal(
+                                FuncManager._mp_a_decimal(valor, digitos),
+                            )
+                            for valor in (temp_xi, xi, fxi, fxi, fxi_prima)
+                        ),
+                    ],
+                )
+
+                if digitos == objetivo and (
+                    abs(fxi) < mpf(str(error)) or fxi_prima == 0
+                ):
+                    return (
+                        FuncManager._mp_a_decimal(xi, digitos),
+                        FuncManager._mp_a_decimal(fxi, DIGITOS_FLOAT),
+                        registro,
+                        its,
+                        0,
+                    )
+
+        return (
+            FuncManager._mp_a_decimal(xi, digitos),
+            FuncManager._mp_a_decimal(fxi, DIGITOS_FLOAT),
+            registro,
+            max_its,
+            -1,
+        )
+
+    @staticmethod
+    def _secante_mp(  # noqa: PLR0913
+        func: Func,
+        iniciales: tuple[float, float],
+        error: Decimal,
+        *,
+        its: int,
+        max_its: int,
+        registro: list[list[str]],
+    ) -> tuple[Decimal, Decimal, list[list[str]], int, int]:
+        """
+        Continuar el método de la secante en precisión arbitraria con mpmath,
+        duplicando la precisión en cada paso, desde la de un float
+        hasta los dígitos que requieren el margen de error
+        y la precisión de Decimal.
+
+        Args:
+            func:      Función que se trabajará.
+            iniciales: Par de aproximaciones de punto flotante de las cuales partir.
+            error:     Margen de error aceptable para terminar búsqueda.
+            its:       Iteraciones ya realizadas en punto flotante.
+            max_its:   Número máximo de iteraciones aceptable para terminar búsqueda.
+            registro:  Registro de iteraciones a continuar.
+
+        Returns:
+            (Decimal, Decimal, list[list[str]], int, int):
+                Lo mismo que secante() (con bandera -1 o 0).
+
+        """
+
+        f = func.evaluador(modulo="mpmath")
+
+        objetivo: int = FuncManager._digitos_objetivo(error, iniciales[1])
+        digitos: int = DIGITOS_FLOAT
+
+        xi, xn = mpf(iniciales[0]), mpf(iniciales[1])
+        fxn = f(xn)
+        while its < max_its:
+            its += 1
+            digitos = min(2 * digitos, objetivo)
+            with workdps(digitos):
+                if xi == xn:
+                    # los puntos coinciden con la precision anterior;
+                    # separarlos por esa resolucion para definir la secante
+                    xi = xn + mpf(10) ** -(digitos // 2) * max(1, abs(xn))
+
+                fxi, fxn = f(xi), f(xn)
+                if fxi == fxn:
+                    # la secante no esta definida; xn puede ser ya una raiz
+                    if abs(fxn) < mpf(str(error)):
+                        return (
+                            FuncManager._mp_a_decimal(xn, digitos),
+                            FuncManager._mp_a_decimal(fxn, DIGITOS_FLOAT),
+                            registro,
+                            its,
+                            0,
+                        )
+                    break
+
+                new_xn = xn - (fxn * (xi - xn)) / (fxi - fxn)
+                registro.append(
+                    [
+                        str(its),
+                        *(
+                            FuncManager._format_decimal(
+                                FuncManager._mp_a_decimal(valor, digitos),
+                            )
+                            for valor in (xi, xn, new_xn)
+                        ),
+                    ],
+                )
+
+                if digitos == objetivo and abs(fxn) < mpf(str(error)):
+                    return (
+                        FuncManager._mp_a_decimal(xn, digitos),
+                        FuncManager._mp_a_decimal(fxn, DIGITOS_FLOAT),
+                        registro,
+                        its,
+                        0,
+                    )
+
+                xi, xn = xn, new_xn
+
+        return (
+            FuncManager._mp_a_decimal(xn, digitos),
+            FuncManager._mp_a_decimal(fxn, DIGITOS_FLOAT),
+            registro,
+            its,
+            -1,
+        )
+
+    @staticmethod
+    def _digitos_objetivo(error: Decimal, x: float) -> int:
+        """
+        Calcular los dígitos significativos con los cuales refinar una raíz
+        cercana a x: los dígitos enteros de x, más los decimales que pide
+        el margen de error, más dígitos de guarda; pero nunca menos
+        que la precisión configurada para Decimal.
+        """
+
+        enteros: int = max(0, Decimal(x).adjusted() + 1) if x != 0 else 0
+        return max(
+            getcontext().prec,
+            enteros - error.adjusted() + DIGITOS_GUARDA,
+            DIGITOS_FLOAT,
+        )
+
+    @staticmethod
+    def _mp_a_decimal(num: mpf, digitos: int) -> Decimal:
+        """
+        Convertir un mpf a Decimal, conservando los dígitos indicados.
+        """
+
+        return Decimal(nstr(num, digitos))
+
+    @staticmethod
+    def newton_multivariable(
+        sistema: SistemaNoLineal,
+        inicial: Sequence[Decimal],
+        error: Decimal = MARGEN_ERROR,
+        max_its: int = MAX_ITERACIONES,
+    ) -> tuple[list[Decimal], RegistroIteraciones, int, int]:
+        """
+        Implementación del método de Newton para sistemas no lineales F(x) = 0.
+
+        En cada iteración se evalúan F y su jacobiano J con los evaluadores
+        compilados del sistema, y se resuelve el sistema lineal J • Δ = −F
+        reduciendo la matriz aumentada [J | −F] con
+        Matriz.forma_escalonada_reducida(); luego xᵢ₊₁ = xᵢ + Δ.
+
+        Args:
+            sistema: Sistema a resolver (con tantas ecuaciones como variables).
+            inicial: Valores iniciales de las variables, en el orden de sistema.vars.
+            error:   Margen de error aceptable para terminar búsqueda.
+            max_its: Número máximo de iteraciones aceptable para terminar búsqueda.
+
+        Returns:
+            (list[Decimal], RegistroIteraciones, int, int):
+                Valores de las variables,
+                registro de iteraciones,
+                iteración final y
+                bandera de resultado (
+                    -1: no se encontró solución;
+                     0: se encontró solución dentro del margen de error;
+                     1: el jacobiano es singular en xᵢ;
+                     2: se llegó a un valor fuera del dominio del sistema.
+                )
+
+        Raises:
+            ValueError: Si el sistema no es cuadrado, o si el número
+                        de valores iniciales no coincide con las variables.
+
+        """
+
+        if not sistema.es_cuadrado:
+            raise ValueError("El sistema debe tener tantas ecuaciones como variables.")
+        if len(inicial) != len(sistema.vars):
+            raise ValueError(
+                f"Se necesitan {len(sistema.vars)} valores iniciales, "
+                f"no {len(inicial)}.",
+            )
+
+        registro = RegistroIteraciones(
+            ["Iteración", *(f"{var}ᵢ" for var in sistema.vars), "‖F(xᵢ)‖", "‖Δ‖"],
+        )
+
+        f = sistema.evaluador()
+        jacobiano = sistema.jacobiano()
+
+        x: NDArray[float64] = array([float(v) for v in inicial])
+        for i in range(1, max_its + 1):
+            fx = f(*x)
+            jx = jacobiano(*x)
+            if not (isfinite(fx).all() and isfinite(jx).all()):
+                return ([Decimal(v) for v in x], registro, i, 2)
+
+            norma_f = float(absolute(fx).max())
+            if norma_f < error:
+                registro.agregar(*x, norma_f, 0.0)
+                return ([Decimal(v) for v in x], registro, i, 0)
+
+            delta = FuncManager._resolver_lineal(jx, -fx)
+            if delta is None:
+                return ([Decimal(v) for v in x], registro, i, 1)
+
+            norma_delta = float(absolute(delta).max())
+            registro.agregar(*x, norma_f, norma_delta)
+
+            x = x + delta
+            if norma_delta < error:
+                return ([Decimal(v) for v in x], registro, i, 0)
+
+        return ([Decimal(v) for v in x], registro, max_its, -1)
+
+    @staticmethod
+    def _resolver_lineal(
+        coeficientes: NDArray[float64],
+        constantes: NDArray[float64],
+    ) -> NDArray[float64] | None:
+        """
+        Resolver un sistema lineal cuadrado con la eliminación exacta de Matriz,
+        convirtiendo cada float en la fracción que representa exactamente.
+
+        Returns:
+            NDArray[float64] | None: Solución, o None si la matriz es singular.
+
+        """
+
+        n: int = len(constantes)
+        aumentada = Matriz(
+            filas=n,
+            columnas=n + 1,
+            valores=[
+                [*(Fraction(float(a)) for a in fila), Fraction(float(b))]
+                for fila, b in zip(coeficientes, constantes, strict=True)
+            ],
+            aumentada=True,
+        )
+
+        reducida, pivotes, _ = aumentada.forma_escalonada_reducida()
+        if pivotes != list(range(n)):
+            return None
+        return array([float(fila[-1]) for fila in reducida.valores])
+
+    @staticmethod
+    def validar_integral(exacto: Expr | None) -> Expr | None:
+        """
+        Validar que el resultado de integrate() para una integral definida
+        sea un número en forma cerrada: se descarta si sympy no pudo
+        evaluar la integral, o si resultó infinita o indefinida.
+
+        Args:
+            exacto: Resultado de integrate().
+
+        Returns:
+            Expr | None: El resultado, o None si no es válido.
+
+        """
+
+        if exacto is None or exacto.has(Integral, oo, -oo, zoo, nan):
+            return None
+        return exacto if exacto.is_number else None
+
+    @staticmethod
+    def integral_numerica(
+        func: Func,
+        intervalo: tuple[Decimal | Fraction, Decimal | Fraction],
+        error: Decimal = MARGEN_ERROR,
+        limite_tiempo: float = LIMITE_NUMERICO,
+    ) -> tuple[Decimal, Decimal, bool]:
+        """
+        Aproximar una integral definida con cuadratura adaptativa
+        de Gauss-Kronrod (7 y 15 puntos).
+
+        En cada subintervalo, la diferencia entre las reglas de Gauss
+        y de Kronrod estima el error. Los subintervalos con un error mayor
+        a su parte proporcional del margen se dividen a la mitad, y los demás
+        se aceptan. En cada ronda, los nodos de todos los subintervalos
+        pendientes se evalúan en una sola llamada al evaluador vectorizado.
+        Si se agota el presupuesto de tiempo, se retorna la mejor
+        aproximación hasta el momento.
+
+        Args:
+            func:          Función a integrar.
+            intervalo:     Límites de integración.
+            error:         Error absoluto aceptable.
+            limite_tiempo: Presupuesto de tiempo en segundos.
+
+        Returns:
+            (Decimal, Decimal, bool):
+                Aproximación de la integral, error estimado,
+                y si se alcanzó el margen de error.
+
+        Raises:
+            ArithmeticError: Si la integral no converge (por ejemplo,
+                             por una asíntota dentro del intervalo).
+
+        """
+
+        f = func.evaluador(modulo="numpy")
+        a, b = float(intervalo[0]), float(intervalo[1])
+        tolerancia, ancho_total = float(error), abs(b - a)
+        if ancho_total == 0:
+            return (Decimal(0), Decimal(0), True)
+        limite: float = perf_counter() + limite_tiempo
+
+        aceptado: float = 0.0
+        error_aceptado: float = 0.0
+        izq, der = array([a]), array([b])
+        while True:
+            centros, radios = (izq + der) / 2, (der - izq) / 2
+            fx = FuncManager._evaluar_arreglo(
+                f,
+                centros[:, None] + radios[:, None] * NODOS_KRONROD,
+            )
+
+            with errstate(all="ignore"):
+                kronrod = radios * (fx @ PESOS_KRONROD)
+                errores = absolute(kronrod - radios * (fx @ PESOS_GAUSS))
+                errores[~isfinite(errores)] = inf
+
+                # cada subintervalo debe cumplir con la parte
+                # del margen de error proporcional a su ancho
+                cumplen = errores <= tolerancia * absolute(der - izq) / ancho_total
+
+            aceptado += kronrod[cumplen].sum()
+            error_aceptado += errores[cumplen].sum()
+            pendientes = ~cumplen
+
+            # terminar si se agoto el tiempo, o si algun subintervalo
+            # pendiente ya no se puede dividir en punto flotante
+            if (
+                not pendientes.any()
+                or perf_counter() > limite
+                or (
+                    absolute(radios[pendientes])
+                    <= EPSILON * absolute(centros[pendientes])
+                ).any()
+            ):
+                break
+
+            medios = centros[pendientes]
+            izq = concatenate((izq[pendientes], medios))
+            der = concatenate((medios, der[pendientes]))
+
+        total: float = aceptado + kronrod[pendientes].sum()
+        error_total: float = error_aceptado + errores[pendientes].sum()
+        if not isfinite(total):
+            raise ArithmeticError(
+                "La integral no converge en el intervalo indicado.",
+            )
+
+        return (Decimal(total), Decimal(error_total), bool(error_total <= tolerancia))
+
+    @staticmethod
+    def _format_decimal(num: float | Decimal) -> str:
         """
         Formatear número para uso en registro de iteraciones.
         """
@@ -391,15 +1417,25 @@ class FuncManager:
         # descomponer los objetos Func() en self.funcs_ingresadas
         # para que se guarden los atributos individuales del objeto,
         # en lugar de una referencia al objeto Func() completo
+        # el dominio solo se guarda si ya se calculo,
+        # para no tener que calcularlo de nuevo al cargar
         funciones_dict: dict[str, dict[str, str | bool]] = {
             nombre: {
                 "nombre": func.nombre,
                 "expr": str(func.expr),
+                "srepr": srepr(func.expr),
                 "latexified": func.latexified,
+                **(
+                    {"dominio": func.dominio_str}
+                    if func.dominio_str is not None
+                    else {}
+                ),
             }
             for nombre, func in self.funcs_ingresadas.items()
         }
 
+        self.save_calculos()
+
         # crear funciones.json si no existe
         if not FUNCIONES_PATH.exists():
             FUNCIONES_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -416,6 +1452,47 @@ class FuncManager:
 
         LOGGER.info("Funciones guardadas en '%s' exitosamente.", FUNCIONES_PATH)
 
+    def save_calculos(self) -> None:
+        """
+        Guardar las derivadas e integrales almacenadas en Func.memo
+        en el archivo de cálculos, junto al archivo de funciones.
+        """
+
+        if len(Func.memo) == 0:
+            return
+
+        if not CALCULOS_PATH.exists():
+            CALCULOS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            LOGGER.info("Creando archivo '%s'...", CALCULOS_PATH)
+
+        with CALCULOS_PATH.open(mode="w") as calculos_file:
+            dump(Func.memo.exportar(), calculos_file, indent=4)
+
+        LOGGER.info("Cálculos guardados en '%s' exitosamente.", CALCULOS_PATH)
+
+    def _load_calculos(self) -> None:
+        """
+        Cargar en Func.memo las derivadas e integrales
+        almacenadas en el archivo de cálculos.
+        """
+
+        if not CALCULOS_PATH.exists():
+            LOGGER.info("Archivo '%s' no existe...", CALCULOS_PATH)
+            return
+
+        with CALCULOS_PATH.open() as calculos_file:
+            try:
+                Func.memo.cargar(load(calculos_file))
+                LOGGER.info("Cálculos cargados exitosamente.")
+            except (AttributeError, JSONDecodeError, TypeError, ValueError) as e:
+                # un archivo de calculos invalido solo
+                # significa que hay que calcularlos de nuevo
+                LOGGER.error(
+                    "Error al leer archivo '%s':\n%s",
+                    CALCULOS_PATH,
+                    str(e),
+                )
+
     def _load_funcs(self) -> dict[str, Func]:
         """
         Cargar las funciones almacenadas en el archivo de datos de funciones.
@@ -431,11 +1508,7 @@ class FuncManager:
                 funciones_dict: dict = load(funciones_file)
                 LOGGER.info("Funciones cargadas exitosamente.")
                 return {
-                    nombre: Func(
-                        nombre=func["nombre"],
-                        expr=func["expr"],
-                        latexified=func["latexified"],
-                    )
+                    nombre: self._crear_func(func)
                     for nombre, func in funciones_dict.items()
                 }
             except JSONDecodeError as j:
@@ -452,6 +1525,35 @@ class FuncManager:
                     )
                 return {}
 
+    @staticmethod
+    def _crear_func(func: dict) -> Func:
+        """
+        Crear una función guardada en el archivo de datos de funciones.
+        Si se guardó su srepr(), la expresión se construye directamente;
+        si no (o si no es válido), se interpreta el texto de la expresión.
+        """
+
+        if "srepr" in func:
+            try:
+                return Func.desde_srepr(
+                    nombre=func["nombre"],
+                    expr_srepr=func["srepr"],
+                    latexified=func["latexified"],
+                    dominio=func.get("dominio"),
+                )
+            except ValueError:
+                LOGGER.warning(
+                    "srepr inválido para '%s', interpretando su expresión...",
+                    func["nombre"],
+                )
+
+        return Func(
+            nombre=func["nombre"],
+            expr=func["expr"],
+            latexified=func["latexified"],
+            dominio=func.get("dominio"),
+        )
+
     def _validar_funcs_ingresadas(self) -> bool:
         """
         Validar el diccionario de funciones.
@@ -2,12 +2,18 @@
 Implementación de manejador de matrices.
 """
 
+from collections.abc import Iterator
 from fractions import Fraction
 from typing import Literal
 
 from src.models import Matriz, SistemaEcuaciones
+from src.models.sistema_ecuaciones import PasoGJ
 from src.utils import format_factor, format_proc_num
 
+# numero de entradas a partir del cual se valida la consistencia
+# de un sistema con aritmetica modular antes de resolverlo
+UMBRAL_PREVALIDACION: int = 400
+
 
 class MatricesManager:
     """
@@ -149,10 +155,11 @@ class MatricesManager:
 
         Args:
             nombre_sis: Nombre de la matriz que representa el sistema de ecuaciones.
-            metodo:     Método a utilizar para resolver el sistema ("gj" o "c").
+            metodo:     Método a utilizar para resolver el sistema
+                        ("gj", "gjd", "c", "mc" o "mcf").
 
         Raises:
-            ValueError: Si método no es "gj" o "c".
+            ValueError: Si método no es "gj", "gjd", "c", "mc" o "mcf".
 
         Returns:
             SistemaEcuaciones: objeto con el sistema resuelto.
@@ -162,14 +169,40 @@ class MatricesManager:
         sistema = SistemaEcuaciones(self.sis_ingresados[nombre_sis])
 
         if metodo == "gj":
-            sistema.gauss_jordan()
+            sistema.gauss_jordan(prevalidar=self._prevalidar(nombre_sis))
+        elif metodo == "gjd":
+            sistema.gauss_jordan_disperso()
         elif metodo == "c":
             sistema.cramer(nombre_sis)
+        elif metodo == "mc":
+            sistema.minimos_cuadrados()
+        elif metodo == "mcf":
+            sistema.minimos_cuadrados(flotante=True)
         else:
             raise ValueError("Argumento inválido para 'metodo'.")
 
         return sistema
 
+    def pasos_gauss_jordan(
+        self,
+        nombre_sis: str,
+    ) -> tuple[SistemaEcuaciones, Iterator[PasoGJ]]:
+        """
+        Preparar la resolución incremental de un sistema con Gauss-Jordan.
+
+        Args:
+            nombre_sis: Nombre de la matriz que representa el sistema de ecuaciones.
+
+        Returns:
+            (SistemaEcuaciones, Iterator[PasoGJ]):
+                Sistema a resolver y
+                generador de sus pasos (self.pasos_gauss_jordan()).
+
+        """
+
+        sistema = SistemaEcuaciones(self.sis_ingresados[nombre_sis])
+        return (sistema, sistema.pasos_gauss_jordan(self._prevalidar(nombre_sis)))
+
     def suma_resta_mats(
         self,
         operador: Literal["+", "−"],
@@ -492,6 +525,23 @@ class MatricesManager:
 
         return (proc, nombre_mat_invertida, inversa)
 
+    def _prevalidar(self, nombre_sis: str) -> bool:
+        """
+        Decidir si se debe validar la consistencia de un sistema con
+        aritmética modular antes de resolverlo. Solo vale la pena en
+        sistemas grandes; en los pequeños se prefiere mostrar el procedimiento.
+
+        Args:
+            nombre_sis: Nombre del sistema.
+
+        Returns:
+            bool: Si el sistema tiene al menos UMBRAL_PREVALIDACION entradas.
+
+        """
+
+        sistema: Matriz = self.sis_ingresados[nombre_sis]
+        return sistema.filas * sistema.columnas >= UMBRAL_PREVALIDACION
+
     def _validar_mats_ingresadas(self) -> bool:
         """
         Validar el diccionario de matrices.
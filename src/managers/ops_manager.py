@@ -2,8 +2,9 @@
 Implementación de manejador de operaciones globales, encargado de matrices y vectores.
 """
 
-from fractions import Fraction
 from json import JSONDecodeError, dump, load
+from math import lcm, sumprod
+from typing import TYPE_CHECKING
 
 from src import FRAC_PREC
 from src.models import FractionDecoder, FractionEncoder, Matriz, Vector
@@ -18,6 +19,9 @@ from src.utils import (
 from .mats_manager import MatricesManager
 from .vecs_manager import VectoresManager
 
+if TYPE_CHECKING:
+    from fractions import Fraction
+
 
 class OpsManager:
     """
@@ -58,7 +62,7 @@ class OpsManager:
             else vecs_manager
         )
 
-    def mat_por_vec(self, nombre_mat: str, nombre_vec: str) -> tuple[str, str, Matriz]:
+    def mat_por_vec(self, nombre_mat: str, nombre_vec: str) -> tuple[str, str, Vector]:
         """
         Multiplicar una matriz por un vector.
 
@@ -71,47 +75,38 @@ class OpsManager:
                              compatibles para la multiplicación.
 
         Returns:
-            (str, str, Matriz): Procedimiento de la operación,
-                                nombre de la matriz resultante y
-                                la matriz resultante de la multiplicación.
+            (str, str, Vector): Procedimiento de la operación,
+                                nombre del vector resultante y
+                                el vector resultante de la multiplicación.
 
         """
 
         mat: Matriz = self.mats_manager.mats_ingresadas[nombre_mat]
         vec: Vector = self.vecs_manager.vecs_ingresados[nombre_vec]
-        if mat.columnas != len(vec):
-            raise ArithmeticError(
-                "El número de columnas de la matriz debe ser "
-                "igual al número de componentes del vector.",
-            )
-
-        # inicializar la lista 2D de la matriz resultante
-        multiplicacion: list[list[Fraction]] = [
-            [Fraction(0) for _ in range(len(vec))] for _ in range(mat.filas)
-        ]
-
-        # realizar la multiplicacion
-        for i in range(mat.filas):
-            for j, componente in enumerate(vec.componentes):
-                multiplicacion[i][j] += mat[i, j] * componente
+        self._validar_mat_vec(mat, vec)
 
-        mat_resultante = Matriz(mat.filas, len(vec), valores=multiplicacion)
-        nombre_mat_resultante = f"{nombre_mat}{nombre_vec}"
+        filas, denominador = self._filas_enteras(mat)
+        vec_resultante: Vector = self._multiplicar_filas(filas, denominador, vec)
+        nombre_vec_resultante = f"{nombre_mat}{nombre_vec}"
 
-        mat_proc = Matriz(
+        # cada componente del resultado es el producto punto
+        # de la fila correspondiente de la matriz con el vector
+        vec_proc = Matriz(
             filas=mat.filas,
-            columnas=len(vec),
+            columnas=1,
             valores=[  # type: ignore[reportArgumentType]
                 [
-                    format_proc_num(
-                        (
-                            mat[i, j].limit_denominator(FRAC_PREC["prec"]),
-                            vec.componentes[j].limit_denominator(FRAC_PREC["prec"]),
-                        ),
-                    )
-                    for j in range(len(vec))
+                    " + ".join(
+                        format_proc_num(
+                            (
+                                a.limit_denominator(FRAC_PREC["prec"]),
+                                b.limit_denominator(FRAC_PREC["prec"]),
+                            ),
+                        )
+                        for a, b in zip(fila, vec.componentes, strict=True)
+                    ),
                 ]
-                for i in range(mat.filas)
+                for fila in mat.valores
             ],
         )
 
@@ -119,12 +114,125 @@ class OpsManager:
         proc += f"{nombre_mat}:\n{mat}\n\n"
         proc += f"{nombre_vec}:\n{vec}\n"
         proc += "---------------------------------------------\n"
-        proc += f"{nombre_mat_resultante}:\n{mat_proc}\n"
+        proc += f"{nombre_vec_resultante}:\n{vec_proc}\n"
         proc += "---------------------------------------------\n"
-        proc += f"{nombre_mat_resultante}:\n{mat_resultante}\n"
+        proc += f"{nombre_vec_resultante}:\n{vec_resultante}\n"
         proc += "---------------------------------------------"
 
-        return (proc, nombre_mat_resultante, mat_resultante)
+        return (proc, nombre_vec_resultante, vec_resultante)
+
+    def mat_por_vecs(
+        self,
+        nombre_mat: str,
+        nombres_vecs: list[str] | None = None,
+    ) -> dict[str, Vector]:
+        """
+        Multiplicar una matriz por varios vectores guardados en una sola pasada.
+        Las filas de la matriz se convierten a enteros una sola vez
+        (con _filas_enteras()), y se reutilizan para todos los vectores;
+        no se genera procedimiento.
+
+        Args:
+            nombre_mat:   Nombre de la matriz a multiplicar.
+            nombres_vecs: Nombres de los vectores (por defecto, todos).
+
+        Raises:
+            ValueError:      si nombres_vecs es una lista vacía.
+            ArithmeticError: si la matriz y algún vector no son
+                             compatibles para la multiplicación.
+
+        Returns:
+            dict[str, Vector]: Vectores resultantes, indexados por
+                               su nombre (e.g. 'Au').
+
+        """
+
+        if nombres_vecs is None:
+            nombres_vecs = list(self.vecs_manager.vecs_ingresados)
+        elif len(nombres_vecs) == 0:
+            raise ValueError("¡Debe seleccionar al menos un vector!")
+
+        mat: Matriz = self.mats_manager.mats_ingresadas[nombre_mat]
+        vecs: dict[str, Vector] = {
+            nombre: self.vecs_manager.vecs_ingresados[nombre] for nombre in nombres_vecs
+        }
+
+        for vec in vecs.values():
+            self._validar_mat_vec(mat, vec)
+
+        filas, denominador = self._filas_enteras(mat)
+        return {
+            f"{nombre_mat}{nombre}": self._multiplicar_filas(filas, denominador, vec)
+            for nombre, vec in vecs.items()
+        }
+
+    @staticmethod
+    def _validar_mat_vec(mat: Matriz, vec: Vector) -> None:
+        """
+        Validar que una matriz y un vector sean compatibles para multiplicación.
+
+        Raises:
+            ArithmeticError: Si las columnas de la matriz no son
+                             iguales a los componentes del vector.
+
+        """
+
+        if mat.columnas != len(vec):
+            raise ArithmeticError(
+                "El número de columnas de la matriz debe ser "
+                "igual al número de componentes del vector.",
+            )
+
+    @staticmethod
+    def _filas_enteras(mat: Matriz) -> tuple[list[list[int]], int]:
+        """
+        Llevar todas las filas de una matriz a un denominador común.
+        Cada fila se lee como una vista (sin copiarla), y sus numeradores
+        se escalan del denominador de la fila al común.
+
+        Args:
+            mat: Matriz a convertir.
+
+        Returns:
+            (list[list[int]], int): Numeradores de cada fila y denominador común.
+
+        """
+
+        filas: list[Vector] = [Vector.vista_fila(mat, i) for i in range(mat.filas)]
+        denominador: int = lcm(*(fila.denominador for fila in filas))
+        return (
+            [
+                [n * (denominador // fila.denominador) for n in fila.numeradores]
+                for fila in filas
+            ],
+            denominador,
+        )
+
+    @staticmethod
+    def _multiplicar_filas(
+        filas: list[list[int]],
+        denominador: int,
+        vec: Vector,
+    ) -> Vector:
+        """
+        Multiplicar una matriz, dada como numeradores enteros sobre un
+        denominador común, por un vector; todas las sumas se realizan
+        con enteros, y el resultado se reduce una sola vez.
+
+        Args:
+            filas:       Numeradores de las filas de la matriz.
+            denominador: Denominador común de la matriz.
+            vec:         Vector a multiplicar.
+
+        Returns:
+            Vector: Vector resultante de la multiplicación.
+
+        """
+
+        return Vector.desde_enteros(
+            [sumprod(fila, vec.numeradores) for fila in filas],
+            denominador * vec.denominador,
+        )
 
     def save_sistemas(self) -> None:
         """
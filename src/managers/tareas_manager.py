@@ -0,0 +1,435 @@
+"""
+Implementación de manejador de tareas simbólicas en segundo plano.
+Las tareas se ejecutan en procesos aparte, para que un cálculo de sympy
+que tarda demasiado no congele la interfaz, y se pueda detener.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import CancelledError
+from multiprocessing import get_context
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import BaseContext
+    from tkinter import Misc
+
+# segundos que puede tardar una tarea por defecto,
+# y milisegundos entre cada sondeo desde la interfaz
+LIMITE_TAREA: float = 30.0
+INTERVALO_SONDEO: int = 100
+
+
+class Tarea:
+    """
+    Resultado futuro de una tarea enviada a un TareasManager.
+    """
+
+    def __init__(
+        self,
+        manager: TareasManager,
+        funcion: Callable[..., Any],
+        args: tuple,
+        limite_tiempo: float | None,
+    ) -> None:
+        """
+        Args:
+            manager:       Manager que ejecuta la tarea.
+            funcion:       Función a ejecutar (debe poder serializarse con pickle).
+            args:          Argumentos de la función.
+            limite_tiempo: Segundos que puede tardar la tarea (None para no limitarla).
+
+        """
+
+        self.manager = manager
+        self.funcion = funcion
+        self.args = args
+        self.limite_tiempo = limite_tiempo
+
+        self.estado: Literal[
+            "pendiente",
+            "ejecutando",
+            "terminada",
+            "fallida",
+            "agotada",
+            "cancelada",
+        ] = "pendiente"
+
+        self.inicio: float = 0.0
+        self._resultado: Any = None
+        self._excepcion: BaseException | None = None
+
+    def listo(self) -> bool:
+        """
+        Actualizar las tareas del manager, y validar si esta ya terminó
+        (con un resultado, un error, por tiempo agotado o por cancelación).
+        """
+
+        self.manager.actualizar()
+        return self.estado not in ("pendiente", "ejecutando")
+
+    def cancelar(self) -> bool:
+        """
+        Cancelar la tarea, deteniendo su proceso si ya se está ejecutando.
+
+        Returns:
+            bool: Si se canceló (False si ya había terminado).
+
+        """
+
+        return self.manager.cancelar(self)
+
+    def resultado(self, espera: float | None = None) -> Any:  # noqa: ANN401
+        """
+        Esperar a que la tarea termine y obtener su resultado.
+
+        Args:
+            espera: Segundos a esperar (None para esperar indefinidamente).
+
+        Returns:
+            Any: Valor retornado por la función.
+
+        Raises:
+            TimeoutError:   Si la tarea excedió su límite de tiempo,
+                            o si no terminó dentro de la espera.
+            CancelledError: Si la tarea se canceló.
+            Exception:      La excepción que lanzó la función.
+
+        """
+
+        fin: float | None = None if espera is None else perf_counter() + espera
+        while not self.listo():
+            if fin is not None and perf_counter() > fin:
+                raise TimeoutError("La tarea no terminó dentro de la espera.")
+            sleep(INTERVALO_SONDEO / 1000)
+
+        if self._excepcion is not None:
+            raise self._excepcion
+        return self._resultado
+
+    @property
+    def error(self) -> str | None:
+        """
+        Mensaje para mostrar si la tarea no terminó con un resultado,
+        o None si terminó exitosamente (o todavía no ha terminado).
+        """
+
+        match self.estado:
+            case "agotada":
+                return (
+                    "El cálculo excedió el límite de "
+                    f"{self.limite_tiempo:g} segundos y se detuvo."
+                )
+            case "cancelada":
+                return "Se canceló el cálculo."
+            case "fallida":
+                return f"No se pudo completar el cálculo:\n{self._excepcion}"
+        return None
+
+    def terminar(self, exito: bool, valor: Any) -> None:  # noqa: ANN401
+        """
+        Registrar el resultado (o la excepción) de la tarea;
+        lo llama el manager al recibirlo del proceso trabajador.
+        """
+
+        if exito:
+            self.estado = "terminada"
+            self._resultado = valor
+        else:
+            self.estado = "fallida"
+            self._excepcion = valor
+
+    def detener(
+        self,
+        estado: Literal["agotada", "cancelada"],
+        excepcion: BaseException,
+    ) -> None:
+        """
+        Registrar que el manager detuvo la tarea sin que terminara.
+        """
+
+        self.estado = estado
+        self._excepcion = excepcion
+
+
+class TareasManager:
+    """
+    Manager de tareas en segundo plano.
+
+    Mantiene un grupo de procesos trabajadores, que se crean a medida
+    que se necesitan. Cada tarea tiene un límite de tiempo, y si lo excede
+    o se cancela, su proceso se termina y se reemplaza por uno nuevo.
+    El límite cuenta desde que el proceso avisa que está listo,
+    así que no incluye el tiempo de iniciarlo (e importar sympy).
+    No usa hilos: las tareas se actualizan al sondearlas
+    (con Tarea.listo(), o con esperar() desde la interfaz).
+    """
+
+    def __init__(self, max_procesos: int = 2) -> None:
+        """
+        Args:
+            max_procesos: Número máximo de tareas que se ejecutan a la vez.
+
+        Raises:
+            ValueError: Si max_procesos no es positivo.
+
+        """
+
+        if max_procesos <= 0:
+            raise ValueError("El número de procesos debe ser positivo.")
+
+        self.max_procesos = max_procesos
+        self._contexto: BaseContext = get_context()
+        self._trabajadores: list[_Trabajador] = []
+        self._pendientes: deque[Tarea] = deque()
+
+    def enviar(
+        self,
+        funcion: Callable[..., Any],
+        *args: Any,  # noqa: ANN401
+        limite_tiempo: float | None = LIMITE_TAREA,
+    ) -> Tarea:
+        """
+        Enviar una tarea para ejecutarla en segundo plano.
+        La función y sus argumentos se envían con pickle, así que deben
+        ser funciones de módulo y objetos serializables (como Expr de sympy).
+
+        Args:
+            funcion:       Función a ejecutar.
+            args:          Argumentos de la función.
+            limite_tiempo: Segundos que puede tardar la tarea (None para no limitarla).
+
+        Returns:
+            Tarea: Tarea creada, para consultar su resultado.
+
+        """
+
+        tarea = Tarea(self, funcion, args, limite_tiempo)
+        self._pendientes.append(tarea)
+        self.actualizar()
+        return tarea
+
+    def esperar(
+        self,
+        widget: Misc,
+        tarea: Tarea,
+        al_terminar: Callable[[Tarea], None],
+    ) -> None:
+        """
+        Sondear una tarea con widget.after(), sin bloquear la interfaz,
+        y llamar a al_terminar cuando termine.
+
+        Args:
+            widget:      Widget con el cual programar los sondeos.
+            tarea:       Tarea a esperar.
+            al_terminar: Función a llamar con la tarea terminada.
+
+        """
+
+        if tarea.listo():
+            al_terminar(tarea)
+        else:
+            widget.after(
+                INTERVALO_SONDEO,
+                lambda: self.esperar(widget, tarea, al_terminar),
+            )
+
+    def actualizar(self) -> None:
+        """
+        Recoger los resultados de las tareas en ejecución, detener
+        las que excedieron su límite de tiempo o cuyo proceso murió,
+        y asignar las tareas pendientes a los procesos libres.
+        """
+
+        ahora: float = perf_counter()
+        for trabajador in list(self._trabajadores):
+            if trabajador.tarea is not None:
+                self._revisar(trabajador, trabajador.tarea, ahora)
+
+        while self._pendientes:
+            trabajador = next(
+                (t for t in self._trabajadores if t.tarea is None),
+                None,
+            )
+
+            if trabajador is None:
+                if len(self._trabajadores) >= self.max_procesos:
+                    break
+                trabajador = _Trabajador(self._contexto)
+                self._trabajadores.append(trabajador)
+
+            tarea = self._pendientes.popleft()
+            try:
+                trabajador.conexion.send((tarea.funcion, tarea.args))
+            except Exception as e:  # noqa: BLE001
+                # la funcion o sus argumentos no se pudieron serializar
+                tarea.terminar(False, e)
+                continue
+
+            # si el trabajador todavia no esta listo,
+            # el inicio se reinicia al recibir su aviso
+            tarea.estado = "ejecutando"
+            tarea.inicio = perf_counter()
+            trabajador.tarea = tarea
+
+    def _revisar(self, trabajador: _Trabajador, tarea: Tarea, ahora: float) -> None:
+        """
+        Recoger el resultado de la tarea de un trabajador si ya llegó,
+        o detenerla si su proceso murió o excedió su límite de tiempo.
+        """
+
+        if not trabajador.listo:
+            if trabajador.recibir_aviso():
+                tarea.inicio = ahora
+            elif trabajador.proceso.is_alive():
+                return
+
+        if trabajador.conexion.poll():
+            try:
+                exito, valor = trabajador.conexion.recv()
+            except (EOFError, OSError) as e:
+                tarea.terminar(False, e)
+                self._reemplazar(trabajador)
+            else:
+                tarea.terminar(exito, valor)
+                trabajador.tarea = None
+        elif not trabajador.proceso.is_alive():
+            tarea.terminar(
+                False,
+                RuntimeError("El proceso de la tarea terminó inesperadamente."),
+            )
+            self._reemplazar(trabajador)
+        elif (
+            tarea.limite_tiempo is not None
+            and ahora - tarea.inicio > tarea.limite_tiempo
+        ):
+            tarea.detener(
+                "agotada",
+                TimeoutError("La tarea excedió su límite de tiempo."),
+            )
+            self._reemplazar(trabajador)
+
+    def cancelar(self, tarea: Tarea) -> bool:
+        """
+        Cancelar una tarea pendiente o en ejecución.
+
+        Args:
+            tarea: Tarea a cancelar.
+
+        Returns:
+            bool: Si se canceló (False si ya había terminado).
+
+        """
+
+        if tarea.estado == "pendiente":
+            self._pendientes.remove(tarea)
+        elif tarea.estado == "ejecutando":
+            self._reemplazar(next(t for t in self._trabajadores if t.tarea is tarea))
+        else:
+            return False
+
+        tarea.detener("cancelada", CancelledError("La tarea se canceló."))
+        return True
+
+    def cerrar(self) -> None:
+        """
+        Cancelar todas las tareas y terminar los procesos trabajadores.
+        """
+
+        for tarea in list(self._pendientes):
+            self.cancelar(tarea)
+        for trabajador in self._trabajadores:
+            if trabajador.tarea is not None:
+                trabajador.tarea.detener(
+                    "cancelada",
+                    CancelledError("La tarea se canceló."),
+                )
+            trabajador.detener()
+        self._trabajadores.clear()
+
+    def _reemplazar(self, trabajador: _Trabajador) -> None:
+        """
+        Terminar el proceso de un trabajador y descartarlo;
+        se creará uno nuevo cuando haga falta.
+        """
+
+        trabajador.detener()
+        self._trabajadores.remove(trabajador)
+
+
+class _Trabajador:
+    """
+    Proceso trabajador, conectado al manager por un Pipe.
+    """
+
+    def __init__(self, contexto: BaseContext) -> None:
+        """
+        Args:
+            contexto: Contexto de multiprocessing con el cual crear el proceso.
+
+        """
+
+        self.conexion, conexion_hijo = contexto.Pipe()
+        self.proceso = contexto.Process(  # type: ignore[reportAttributeAccessIssue]
+            target=_bucle_trabajador,
+            args=(conexion_hijo,),
+            daemon=True,
+        )
+
+        self.proceso.start()
+        conexion_hijo.close()
+        self.tarea: Tarea | None = None
+        self.listo = False
+
+    def recibir_aviso(self) -> bool:
+        """
+        Recibir el aviso que envía el proceso al terminar de iniciar,
+        si ya llegó, y validar si el trabajador está listo.
+        """
+
+        if not self.listo and self.conexion.poll():
+            try:
+                self.conexion.recv()
+            except (EOFError, OSError):
+                return False
+            self.listo = True
+        return self.listo
+
+    def detener(self) -> None:
+        """
+        Terminar el proceso y cerrar su conexión.
+        """
+
+        self.proceso.terminate()
+        self.proceso.join()
+        self.conexion.close()
+
+
+def _bucle_trabajador(conexion: Connection) -> None:
+    """
+    Ejecutar en un proceso trabajador las tareas que llegan por conexion,
+    y enviar de vuelta (True, resultado) o (False, excepción).
+    Antes de recibir tareas, envía None para avisar que está listo.
+    """
+
+    conexion.send(None)
+    while True:
+        try:
+            funcion, args = conexion.recv()
+        except EOFError:
+            return
+
+        try:
+            respuesta: tuple[bool, Any] = (True, funcion(*args))
+        except Exception as e:  # noqa: BLE001
+            respuesta = (False, e)
+
+        try:
+            conexion.send(respuesta)
+        except Exception as e:  # noqa: BLE001
+            # el resultado no se pudo serializar
+            conexion.send((False, RuntimeError(str(e))))
@@ -3,10 +3,11 @@ Implementación de manejador de vectores.
 """
 
 from fractions import Fraction
+from math import lcm, sumprod
 from typing import Literal
 
 from src import FRAC_PREC
-from src.models import Vector
+from src.models import Matriz, Radical, Vector
 from src.utils import format_factor, format_proc_num
 
 
@@ -37,6 +38,11 @@ class VectoresManager:
         else:
             raise TypeError("Argumento inválido para 'vecs_ingresados'.")
 
+        # ultima eliminacion y ultima matriz de Gram calculadas,
+        # indexadas por los vectores con los que se calcularon
+        self._eliminacion: tuple[tuple[Vector, ...], Matriz, list[int]] | None = None
+        self._gram: tuple[tuple[Vector, ...], Matriz] | None = None
+
     def get_vectores(self, calculado: Literal[-1, 0, 1]) -> str:
         """
         Formatear los vectores guardados como un solo string.
@@ -113,17 +119,19 @@ class VectoresManager:
         nombre_vec_resultado = f"{nombre_vec1} {operador} {nombre_vec2}"
         vec_resultado = vec1 + vec2 if operador == "+" else vec1 - vec2
 
-        vec_proc = Vector(
-            componentes=[  # type: ignore[reportArgumentType]
-                f"{
+        vec_proc = Matriz(
+            filas=len(vec1),
+            columnas=1,
+            valores=[  # type: ignore[reportArgumentType]
+                [
                     format_proc_num(
                         (
-                            vec1[i].limit_denominator(FRAC_PREC['prec']),
-                            vec2[i].limit_denominator(FRAC_PREC['prec']),
+                            vec1[i].limit_denominator(FRAC_PREC["prec"]),
+                            vec2[i].limit_denominator(FRAC_PREC["prec"]),
                         ),
                         operador=operador,
-                    )
-                }"
+                    ),
+                ]
                 for i in range(len(vec1))
             ],
         )
@@ -163,13 +171,15 @@ class VectoresManager:
         escalar_str = format_factor(escalar)
         nombre_vec_multiplicado = f"{escalar_str}{nombre_vec}"
 
-        vec_proc = Vector(
-            componentes=[  # type: ignore[reportArgumentType]
-                f"{
+        vec_proc = Matriz(
+            filas=len(vec),
+            columnas=1,
+            valores=[  # type: ignore[reportArgumentType]
+                [
                     format_proc_num(
-                        (escalar, vec[i].limit_denominator(FRAC_PREC['prec']))
-                    )
-                }"
+                        (escalar, vec[i].limit_denominator(FRAC_PREC["prec"])),
+                    ),
+                ]
                 for i in range(len(vec))
             ],
         )
@@ -211,41 +221,33 @@ class VectoresManager:
         prod_punto = vec1 * vec2
         nombre_prod_punto = f"{nombre_vec1}.{nombre_vec2}"
 
-        vec1_proc = Vector(
-            componentes=[  # type: ignore[reportArgumentType]
-                f"{
-                    format_factor(
-                        vec1[i].limit_denominator(FRAC_PREC['prec']), mult=False
-                    )
-                }"
-                for i in range(len(vec1))
+        vec1_proc = Matriz(
+            filas=len(vec1),
+            columnas=1,
+            valores=[  # type: ignore[reportArgumentType]
+                [format_factor(c.limit_denominator(FRAC_PREC["prec"]), mult=False)]
+                for c in vec1.componentes
             ],
         )
 
-        vec2_proc = Vector(
-            componentes=[  # type: ignore[reportArgumentType]
-                f"{
-                    format_factor(
-                        vec2[i].limit_denominator(FRAC_PREC['prec']), mult=False
-                    )
-                }"
-                for i in range(len(vec2))
+        vec2_proc = Matriz(
+            filas=len(vec2),
+            columnas=1,
+            valores=[  # type: ignore[reportArgumentType]
+                [format_factor(c.limit_denominator(FRAC_PREC["prec"]), mult=False)]
+                for c in vec2.componentes
             ],
         )
 
-        pp_proc = Vector(
-            componentes=[  # type: ignore[reportArgumentType]
-                f"{
-                    format_proc_num(
-                        (
-                            vec1[i].limit_denominator(FRAC_PREC['prec']),
-                            vec2[i].limit_denominator(FRAC_PREC['prec']),
-                        )
-                    )
-                }"
-                for i in range(len(vec1))
-            ],
-        )
+        pp_proc: list[str] = [
+            format_proc_num(
+                (
+                    vec1[i].limit_denominator(FRAC_PREC["prec"]),
+                    vec2[i].limit_denominator(FRAC_PREC["prec"]),
+                ),
+            )
+            for i in range(len(vec1))
+        ]
 
         proc: str = "---------------------------------------------\n"
         proc += f"{nombre_vec1}:\n{vec1_proc}\n\n"
@@ -255,12 +257,425 @@ class VectoresManager:
         proc += "se debe sumar el producto de sus componentes.\n\n"
 
         proc += f"{nombre_prod_punto}  =\n"
-        proc += f"{'\n+\n'.join(str(c) for c in pp_proc.componentes)}\n"
+        proc += f"{'\n+\n'.join(pp_proc)}\n"
         proc += "---------------------------------------------\n"
         proc += f"{nombre_prod_punto}  =  {prod_punto}"
 
         return (proc, nombre_prod_punto, prod_punto)
 
+    def apilar_vectores(self, nombres: list[str] | None = None) -> Matriz:
+        """
+        Apilar los vectores indicados como las filas de una sola matriz,
+        que comparte las listas de componentes de los vectores
+        (con Vector.matriz_filas(), sin copiarlas).
+        La matriz no debe modificarse.
+
+        Args:
+            nombres: Nombres de los vectores (por defecto, todos los guardados).
+
+        Returns:
+            Matriz: Matriz k x n, con un vector por fila.
+
+        Raises:
+            ValueError:      Si nombres es una lista vacía.
+            ArithmeticError: Si los vectores no tienen las mismas dimensiones.
+
+        """
+
+        return Vector.matriz_filas(
+            self._obtener_vectores(self._nombres_vectores(nombres)),
+        )
+
+    def matriz_gram(
+        self,
+        nombres: list[str] | None = None,
+        procedimiento: bool = False,
+    ) -> tuple[str, Matriz]:
+        """
+        Calcular la matriz de Gram G = V • Vᵀ de los vectores indicados,
+        donde V tiene un vector por fila, y G[i, j] = vi.vj.
+
+        Los numeradores de los vectores se apilan sobre un denominador
+        común d, en una matriz entera N con V = N / d, así que
+        G = (N • Nᵀ) / d^2: el producto se realiza solo con enteros,
+        y cada elemento se divide una sola vez. Como G es simétrica,
+        solo se calcula su triángulo superior, y la última matriz
+        calculada se reutiliza mientras los vectores no cambien.
+
+        Args:
+            nombres:       Nombres de los vectores (por defecto, todos).
+            procedimiento: Si se debe generar el procedimiento por pares.
+
+        Returns:
+            (str, Matriz): Procedimiento (vacío si no se pidió) y matriz de Gram.
+
+        Raises:
+            ValueError:      Si nombres es una lista vacía.
+            ArithmeticError: Si los vectores no tienen las mismas dimensiones.
+
+        """
+
+        nombres = self._nombres_vectores(nombres)
+        vecs: list[Vector] = self._obtener_vectores(nombres)
+
+        clave: tuple[Vector, ...] = tuple(vecs)
+        if self._gram is None or self._gram[0] != clave:
+            denominador: int = lcm(*(vec.denominador for vec in vecs))
+            enteros: list[list[int]] = [
+                [n * (denominador // vec.denominador) for n in vec.numeradores]
+                for vec in vecs
+            ]
+
+            cuadrado: int = denominador**2
+            gram: list[list[Fraction]] = [[Fraction(0)] * len(vecs) for _ in vecs]
+            for i, fila in enumerate(enteros):
+                for j in range(i, len(enteros)):
+                    gram[i][j] = gram[j][i] = Fraction(
+                        sumprod(fila, enteros[j]),
+                        cuadrado,
+                    )
+
+            self._gram = (
+                clave,
+                Matriz(filas=len(vecs), columnas=len(vecs), valores=gram),
+            )
+
+        mat_gram: Matriz = self._gram[1]
+        if not procedimiento:
+            return ("", mat_gram)
+
+        proc: str = "---------------------------------------------\n"
+        proc += f"V:\n{self.apilar_vectores(nombres)}\n"
+        proc += "---------------------------------------------\n"
+        proc += "La matriz de Gram contiene el producto punto\n"
+        proc += "de cada par de vectores: G = V • Vᵀ\n\n"
+
+        for i, nombre1 in enumerate(nombres):
+            for j in range(i, len(nombres)):
+                proc += f"{nombre1}.{nombres[j]}  =  {
+                    mat_gram[i, j].limit_denominator(FRAC_PREC['prec'])
+                }\n"
+
+        proc += "---------------------------------------------\n"
+        proc += f"G:\n{mat_gram}"
+
+        return (proc, mat_gram)
+
+    def productos_punto(
+        self,
+        nombres: list[str] | None = None,
+    ) -> dict[tuple[str, str], Fraction]:
+        """
+        Calcular el producto punto de todos los pares de vectores indicados,
+        a partir de una sola matriz de Gram.
+
+        Args:
+            nombres: Nombres de los vectores (por defecto, todos los guardados).
+
+        Returns:
+            dict[tuple[str, str], Fraction]:
+                Productos punto, indexados por par de nombres (i < j).
+
+        Raises:
+            ValueError:      Si nombres es una lista vacía.
+            ArithmeticError: Si los vectores no tienen las mismas dimensiones.
+
+        """
+
+        nombres = self._nombres_vectores(nombres)
+        _, gram = self.matriz_gram(nombres)
+
+        return {
+            (nombre1, nombres[j]): gram[i, j]
+            for i, nombre1 in enumerate(nombres)
+            for j in range(i + 1, len(nombres))
+        }
+
+    def distancias(
+        self,
+        nombres: list[str] | None = None,
+    ) -> dict[tuple[str, str], Radical]:
+        """
+        Calcular la distancia exacta entre todos los pares de vectores
+        indicados, reutilizando la matriz de Gram.
+
+        Utiliza la fórmula:
+        - || vi - vj ||^2 = G[i, i] + G[j, j] - 2 • G[i, j]
+
+        Args:
+            nombres: Nombres de los vectores (por defecto, todos los guardados).
+
+        Returns:
+            dict[tuple[str, str], Radical]:
+                Distancias, indexadas por par de nombres (i < j).
+
+        Raises:
+            ValueError:      Si nombres es una lista vacía.
+            ArithmeticError: Si los vectores no tienen las mismas dimensiones.
+
+        """
+
+        nombres = self._nombres_vectores(nombres)
+        _, gram = self.matriz_gram(nombres)
+
+        return {
+            (nombre1, nombres[j]): Radical.raiz(
+                gram[i, i] + gram[j, j] - 2 * gram[i, j],
+            )
+            for i, nombre1 in enumerate(nombres)
+            for j in range(i + 1, len(nombres))
+        }
+
+    def independencia_lineal(
+        self,
+        nombres: list[str] | None = None,
+        modular: bool = False,
+        procedimiento: bool = False,
+    ) -> tuple[str, bool, int, list[str]]:
+        """
+        Determinar si los vectores indicados son linealmente independientes,
+        el rango del conjunto, y una base del espacio que generan.
+
+        Los vectores se colocan como columnas de una matriz A, que se reduce
+        una sola vez a su forma escalonada reducida; los vectores en las
+        columnas pivote forman la base. La eliminación se almacena, así que
+        consultas repetidas sobre los mismos vectores no la repiten.
+
+        Con modular, primero se calcula el rango módulo varios primos,
+        que nunca es mayor que el rango real: si ya es igual al número
+        de vectores, el conjunto es independiente sin eliminar con fracciones.
+
+        Args:
+            nombres:       Nombres de los vectores (por defecto, todos).
+            modular:       Si se debe intentar la validación modular primero.
+            procedimiento: Si se debe generar el procedimiento.
+
+        Returns:
+            (str, bool, int, list[str]):
+                Procedimiento (vacío si no se pidió),
+                si los vectores son linealmente independientes,
+                rango del conjunto y
+                nombres de los vectores que forman una base.
+
+        Raises:
+            ArithmeticError: Si los vectores no tienen las mismas dimensiones.
+
+        """
+
+        nombres = nombres or list(self.vecs_ingresados)
+        vecs: list[Vector] = self._obtener_vectores(nombres)
+
+        # k vectores en R^n, con k <= n, pueden ser independientes
+        if (
+            modular
+            and not procedimiento
+            and len(vecs) <= len(vecs[0])
+            and self.apilar_vectores(nombres).rango_modular() == len(vecs)
+        ):
+            return ("", True, len(vecs), nombres)
+
+        reducida, pivotes = self._eliminar_vectores(vecs)
+        rango: int = len(pivotes)
+        independiente: bool = rango == len(vecs)
+        base: list[str] = [nombres[j] for j in pivotes]
+
+        if not procedimiento:
+            return ("", independiente, rango, base)
+
+        proc: str = "---------------------------------------------\n"
+        proc += f"A = [ {' '.join(nombres)} ]:\n"
+        proc += f"{Vector.matriz_columnas(vecs)}\n"
+        proc += "---------------------------------------------\n"
+        proc += "Los vectores son linealmente independientes si\n"
+        proc += "la forma escalonada reducida de A tiene un pivote\n"
+        proc += "en cada columna; las columnas pivote forman una base.\n\n"
+        proc += f"Forma escalonada reducida de A:\n{reducida}\n"
+        proc += "---------------------------------------------\n"
+        proc += f"rango(A) = {rango}\n"
+        proc += f"Base: {{ {', '.join(base)} }}\n"
+        proc += f"Los vectores {
+            'son' if independiente else 'no son'
+        } linealmente independientes."
+
+        return (proc, independiente, rango, base)
+
+    def proyeccion(
+        self,
+        nombre_vec: str,
+        nombres_base: list[str],
+    ) -> tuple[str, str, Vector, Vector]:
+        """
+        Descomponer el vector indicado como b = proj + perp, donde proj es
+        la proyección de b sobre el espacio W generado por los vectores base,
+        y perp es ortogonal a W.
+
+        Si W = gen{ a1, ..., ak }, proj = c1 • a1 + ... + ck • ak, donde
+        los coeficientes resuelven G • c = [ a1.b, ..., ak.b ]ᵀ, con G
+        la matriz de Gram de una base de W. Para un solo vector,
+        se reduce a proj = (a.b / a.a) • a, con a.a almacenado en a.
+
+        Args:
+            nombre_vec:   Nombre del vector a proyectar.
+            nombres_base: Nombres de los vectores que generan W.
+
+        Returns:
+            (str, str, Vector, Vector):
+                Procedimiento de la operación realizada,
+                nombre de la proyección (e.g. 'proj_u(b)'),
+                proyección y componente ortogonal.
+
+        Raises:
+            ValueError:      Si no se indica ningún vector base.
+            ArithmeticError: Si los vectores no tienen las mismas dimensiones.
+
+        """
+
+        # independencia_lineal() interpreta una lista vacia como
+        # todos los vectores ingresados
+        if len(nombres_base) == 0:
+            raise ValueError("¡Debe seleccionar al menos un vector base!")
+
+        vec: Vector = self._obtener_vectores([nombre_vec, *nombres_base])[0]
+
+        # descartar los vectores dependientes, para que G sea invertible
+        _, _, _, base = self.independencia_lineal(nombres_base)
+        vecs_base: list[Vector] = [self.vecs_ingresados[nombre] for nombre in base]
+        productos: list[Fraction] = [vec_base * vec for vec_base in vecs_base]
+
+        mat_gram: Matriz | None = None
+        coeficientes: list[Fraction] = []
+        if len(base) == 1:
+            coeficientes = [productos[0] / vecs_base[0].norma_cuadrada()]
+        elif len(base) > 1:
+            _, mat_gram = self.matriz_gram(base)
+            reducida, _, _ = Matriz(
+                filas=len(base),
+                columnas=len(base) + 1,
+                valores=[[*mat_gram[i], productos[i]] for i in range(len(base))],
+                aumentada=True,
+            ).forma_escalonada_reducida()
+
+            coeficientes = [reducida[i, -1] for i in range(len(base))]
+
+        proj: Vector = Vector([Fraction(0) for _ in range(len(vec))])
+        for coeficiente, vec_base in zip(coeficientes, vecs_base, strict=True):
+            proj += vec_base * coeficiente
+        perp: Vector = vec - proj
+
+        nombre_espacio: str = nombres_base[0] if len(nombres_base) == 1 else "W"
+        nombre_proj = f"proj_{nombre_espacio}({nombre_vec})"
+        nombre_perp = f"{nombre_vec} − {nombre_proj}"
+
+        proc: str = "---------------------------------------------\n"
+        proc += f"{nombre_vec}:\n{vec}\n"
+        if len(nombres_base) > 1:
+            proc += f"\nW = gen{{ {', '.join(nombres_base)} }}\n"
+            if base != nombres_base:
+                proc += f"Base de W: {{ {', '.join(base)} }}\n"
+        proc += "---------------------------------------------\n"
+
+        if len(base) == 1:
+            proc += f"{nombre_proj}  =  ({base[0]}.{nombre_vec} / {base[0]}.{
+                base[0]
+            }) • {base[0]}\n"
+
+            proc += f"{nombre_proj}  =  ({
+                productos[0].limit_denominator(FRAC_PREC['prec'])
+            } / {
+                vecs_base[0].norma_cuadrada().limit_denominator(FRAC_PREC['prec'])
+            }) • {base[0]}\n".replace("-", "−")
+        elif mat_gram is not None:
+            proc += f"{nombre_proj}  =  {
+                ' + '.join(f'c{i + 1} • {nombre}' for i, nombre in enumerate(base))
+            }\n"
+
+            proc += "donde G • c = [ "
+            proc += f"{', '.join(f'{nombre}.{nombre_vec}' for nombre in base)} ]ᵀ,\n"
+            proc += "con G la matriz de Gram de la base de W.\n\n"
+            proc += f"G:\n{mat_gram}\n\n"
+            proc += "".join(
+                f"c{i + 1}  =  {c.limit_denominator(FRAC_PREC['prec'])}\n"
+                for i, c in enumerate(coeficientes)
+            ).replace("-", "−")
+        else:
+            proc += "Los vectores base son todos cero,\n"
+            proc += "así que la proyección es el vector cero.\n"
+
+        proc += "---------------------------------------------\n"
+        proc += f"{nombre_proj}:\n{proj}\n\n"
+        proc += f"{nombre_perp}:\n{perp}"
+
+        return (proc, nombre_proj, proj, perp)
+
+    def _eliminar_vectores(self, vecs: list[Vector]) -> tuple[Matriz, list[int]]:
+        """
+        Reducir la matriz con los vectores dados como columnas,
+        reutilizando la última eliminación si los vectores no han cambiado.
+
+        Args:
+            vecs: Vectores a reducir.
+
+        Returns:
+            (Matriz, list[int]): Matriz escalonada reducida y columnas pivote.
+
+        """
+
+        clave: tuple[Vector, ...] = tuple(vecs)
+        if self._eliminacion is None or self._eliminacion[0] != clave:
+            reducida, pivotes, _ = Vector.matriz_columnas(
+                vecs,
+            ).forma_escalonada_reducida()
+
+            self._eliminacion = (clave, reducida, pivotes)
+
+        _, reducida, pivotes = self._eliminacion
+        return (reducida, pivotes)
+
+    def _nombres_vectores(self, nombres: list[str] | None) -> list[str]:
+        """
+        Obtener los nombres de los vectores a operar en conjunto:
+        None indica todos los vectores guardados, pero una lista vacía
+        no se interpreta como todos (seguramente es una selección vacía).
+
+        Raises:
+            ValueError: Si nombres es una lista vacía.
+
+        """
+
+        if nombres is None:
+            return list(self.vecs_ingresados)
+        if len(nombres) == 0:
+            raise ValueError("¡Debe seleccionar al menos un vector!")
+        return nombres
+
+    def _obtener_vectores(self, nombres: list[str] | None) -> list[Vector]:
+        """
+        Obtener los vectores indicados, validando que
+        existan y que todos tengan las mismas dimensiones.
+
+        Args:
+            nombres: Nombres de los vectores (por defecto, todos los guardados).
+
+        Returns:
+            list[Vector]: Vectores indicados.
+
+        Raises:
+            ValueError:      Si no hay vectores que operar.
+            ArithmeticError: Si los vectores no tienen las mismas dimensiones.
+
+        """
+
+        vecs: list[Vector] = [
+            self.vecs_ingresados[nombre]
+            for nombre in (nombres or list(self.vecs_ingresados))
+        ]
+
+        if not vecs:
+            raise ValueError("¡No se ha ingresado ningún vector!")
+        if any(len(vec) != len(vecs[0]) for vec in vecs):
+            raise ArithmeticError("Los vectores deben tener la misma longitud.")
+        return vecs
+
     def _validar_vecs_ingresados(self) -> bool:
         """
         Validar si el diccionario de vectores ingresados esta vacío o no.
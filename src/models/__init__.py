@@ -4,15 +4,29 @@ Implementaciones de modelos fundamentales de la aplicación.
 
 from .fraction_encoding import FractionDecoder, FractionEncoder
 from .func import Func
+from .func_multivariable import FuncMultivariable
 from .matriz import Matriz
+from .memo_calculos import MemoCalculos
+from .polinomio import Polinomio
+from .radical import Radical
+from .registro_iteraciones import RegistroIteraciones
 from .sistema_ecuaciones import SistemaEcuaciones
+from .sistema_no_lineal import SistemaNoLineal
+from .solucion_parametrica import SolucionParametrica
 from .vector import Vector
 
 __all__: list[str] = [
     "FractionDecoder",
     "FractionEncoder",
     "Func",
+    "FuncMultivariable",
     "Matriz",
+    "MemoCalculos",
+    "Polinomio",
+    "Radical",
+    "RegistroIteraciones",
     "SistemaEcuaciones",
+    "SistemaNoLineal",
+    "SolucionParametrica",
     "Vector",
 ]
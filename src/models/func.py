@@ -2,9 +2,13 @@
 Implementación de clase representando funciones matemáticas.
 """
 
+from collections.abc import Callable
 from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
 from logging import WARNING, getLogger
-from re import compile as comp, sub
+from re import Match, compile as comp
+from typing import ClassVar, Literal
 
 from PIL.Image import open as open_img
 from customtkinter import CTkImage
@@ -12,16 +16,27 @@ from matplotlib import use
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.pyplot import axis, close, rc, savefig, subplots, text
 from sympy import (
+    Complement,
     Expr,
+    FiniteSet,
+    ImageSet,
+    Integers,
+    Intersection,
     Interval,
+    Poly,
     Reals,
+    S,
+    Set,
     Symbol,
-    diff,
-    integrate,
+    Union,
+    degree,
+    lambdify,
     latex,
     nan,
     oo,
     parse_expr,
+    sympify,
+    true,
     zoo,
 )
 from sympy.calculus.util import continuous_domain
@@ -32,23 +47,67 @@ from sympy.parsing.sympy_parser import (
 
 from src.utils import SAVED_FUNCS_PATH, transparent_invert
 
+from .memo_calculos import MemoCalculos, leer_srepr
+from .polinomio import Polinomio
+
 use("TkAgg")
 getLogger("matplotlib").setLevel(WARNING)
 
 TRANSFORMS: tuple = (*standard_transformations, implicit_multiplication_application)
 
+# tokens que se reescriben antes de interpretar una expresion,
+# reconocidos en una sola pasada: "sen" -> "sin", "^" -> "**",
+# "e^" (o "e**") -> "exp", y la variable x -> la variable de la funcion
+PATRON_TOKENS = comp(r"sen|e(?:\^|\*\*)|\^|\bx\b")
+PATRON_VAR = comp(r"\(([a-z])\)")
+REEMPLAZOS: dict[str, str] = {"sen": "sin", "^": "**", "e^": "exp", "e**": "exp"}
+
+# numero de expresiones interpretadas que se recuerdan
+LIMITE_CACHE_EXPRS: int = 256
+
+# conjuntos predefinidos de sympy, que sympify()
+# interpretaria como simbolos al leer un dominio guardado
+CONJUNTOS_SYMPY: dict[str, Set] = {
+    "Complexes": S.Complexes,
+    "EmptySet": S.EmptySet,
+    "Integers": S.Integers,
+    "Naturals": S.Naturals,
+    "Naturals0": S.Naturals0,
+    "Rationals": S.Rationals,
+    "Reals": S.Reals,
+}
+
+# modulos con los que se compilan los evaluadores numericos;
+# para "math", las funciones que no existan en math se buscan en mpmath y sympy
+MODULOS_EVALUADOR: dict[str, str | list[str]] = {
+    "math": ["math", "mpmath", "sympy"],
+    "numpy": "numpy",
+    "mpmath": ["mpmath", "sympy"],
+}
+
 
 class Func:
     """
     Representa una función matemática.
     """
 
-    def __init__(self, nombre: str, expr: str, latexified: bool = False) -> None:
+    # derivadas e integrales compartidas por todas las funciones
+    memo: ClassVar[MemoCalculos] = MemoCalculos()
+
+    def __init__(
+        self,
+        nombre: str,
+        expr: str | Expr,
+        latexified: bool = False,
+        dominio: str | None = None,
+    ) -> None:
         """
         Args:
             nombre:     Nombre de la función en la notación f(x).
-            expr:       La expresión matemática que define la función.
+            expr:       La expresión que define la función (como texto,
+                        o como Expr para no tener que interpretarla).
             latexified: Si la función se ha convertido en notación LaTeX.
+            dominio:    Dominio previamente calculado, como texto.
 
         Raises:
             ValueError: Si la expresión tiene un dominio complejo.
@@ -57,33 +116,49 @@ class Func:
 
         self.nombre = nombre
 
-        var_pattern: str = r"\(([a-z])\)"
-        self.var = Symbol(comp(var_pattern).findall(nombre)[0])
+        self.var = Symbol(PATRON_VAR.findall(nombre)[0])
 
         self.latexified = latexified
         self.latex_img: CTkImage | None = None
+        self._derivada: Func | None = None
 
-        def replace_var(expr: str) -> str:
-            var_str = str(self.var)
-            patt: str = r"\bx\b"
+        self.expr: Expr = (
+            expr if isinstance(expr, Expr) else interpretar_expr(expr, str(self.var))
+        )
+
+        if self.expr.has(oo, -oo, zoo, nan):
+            raise ValueError("La función tiene un dominio complejo.")
 
-            replaced_expr = expr
-            for _ in list(comp(patt).finditer(expr)):
-                replaced_expr = sub(patt, var_str, expr)
-            return replaced_expr
+        if dominio is not None:
+            self._dominio = sympify(dominio, locals=CONJUNTOS_SYMPY)
+
+    @classmethod
+    def desde_srepr(
+        cls,
+        nombre: str,
+        expr_srepr: str,
+        latexified: bool = False,
+        dominio: str | None = None,
+    ) -> "Func":
+        """
+        Crear una función a partir de la forma srepr() de su expresión,
+        construyéndola directamente, sin reescribirla ni interpretarla.
 
-        if "sen" in expr:
-            expr = expr.replace("sen", "sin")
-        if "^" in expr:
-            expr = expr.replace("^", "**")
-        if "e**" in expr:
-            expr = expr.replace("e**", "exp")
+        Args:
+            nombre:     Nombre de la función en la notación f(x).
+            expr_srepr: srepr() de la expresión que define la función.
+            latexified: Si la función se ha convertido en notación LaTeX.
+            dominio:    Dominio previamente calculado, como texto.
 
-        expr = replace_var(expr)
-        self.expr: Expr = parse_expr(expr, transformations=TRANSFORMS)
+        Returns:
+            Func: Función creada.
 
-        if self.expr.has(oo, -oo, zoo, nan):
-            raise ValueError("La función tiene un dominio complejo.")
+        Raises:
+            ValueError: Si expr_srepr no es un srepr() válido.
+
+        """
+
+        return cls(nombre, leer_srepr(expr_srepr), latexified, dominio)
 
     def __str__(self) -> str:
         """
@@ -92,16 +167,160 @@ class Func:
 
         return f"{self.nombre} = {self.expr}"
 
+    @property
+    def expr(self) -> Expr:
+        """
+        Expresión matemática que define la función.
+        """
+
+        return self._expr
+
+    @expr.setter
+    def expr(self, expr: Expr) -> None:
+        """
+        Reemplazar la expresión de la función,
+        invalidando las derivadas y evaluadores almacenados.
+        """
+
+        self._expr = expr
+        self._derivada = None
+        self._dominio: Set | None = None
+        self._predicado_dominio: Callable[[float], bool] | None = None
+        self._derivadas: dict[int, Expr] = {0: expr}
+        self._evaluadores: dict[tuple[int, str], Callable[[float], float]] = {}
+        self._polinomio: Polinomio | None = None
+        self._polinomio_detectado: bool = False
+
+    @property
+    def polinomio(self) -> Polinomio | None:
+        """
+        Coeficientes de 'self.expr' como Polinomio, si es un polinomio
+        en 'self.var' con coeficientes racionales; None si no lo es.
+        Se detecta una sola vez, hasta que cambie 'self.expr'.
+        """
+
+        if not self._polinomio_detectado:
+            self._polinomio = detectar_polinomio(self.expr, self.var)
+            self._polinomio_detectado = True
+        return self._polinomio
+
+    def derivada_expr(self, orden: int = 1) -> Expr:
+        """
+        Obtener la derivada de 'self.expr' del orden indicado.
+        Cada derivada se obtiene a partir de la anterior, de la memoria
+        compartida si ya se había calculado, y se almacena.
+
+        Args:
+            orden: Orden de la derivada (0 para la expresión misma).
+
+        Returns:
+            Expr: Derivada de 'self.expr'.
+
+        """
+
+        if orden not in self._derivadas:
+            self._derivadas[orden] = Func.memo.derivar(
+                self.derivada_expr(orden - 1),
+                self.var,
+            )
+        return self._derivadas[orden]
+
+    def evaluador(
+        self,
+        orden: int = 0,
+        modulo: Literal["math", "numpy", "mpmath"] = "math",
+    ) -> Callable[[float], float]:
+        """
+        Obtener una función numérica que evalúa la derivada del orden indicado
+        (0 para f, 1 para f', 2 para f''). Se compila con lambdify() solo
+        la primera vez, y se reutiliza hasta que cambie 'self.expr'.
+        Si la función es un polinomio, se evalúa con el método de Horner
+        sobre sus coeficientes, en lugar de compilar la expresión
+        (excepto con "mpmath").
+
+        Con "math", se evalúan escalares rápidamente, pero los valores fuera
+        del dominio lanzan excepciones; con "numpy", se pueden evaluar arreglos,
+        y los valores fuera del dominio resultan en nan o inf; con "mpmath",
+        se evalúan mpf con la precisión de mpmath vigente al llamarlo
+        (las constantes racionales se convierten en cada llamada).
+
+        Args:
+            orden:  Orden de la derivada a evaluar.
+            modulo: Módulo numérico con el cual compilar la expresión.
+
+        Returns:
+            Callable[[float], float]: Evaluador compilado.
+
+        """
+
+        clave: tuple[int, str] = (orden, modulo)
+        if clave not in self._evaluadores:
+            polinomio: Polinomio | None = self.polinomio
+            self._evaluadores[clave] = (
+                polinomio.derivada(orden).evaluar
+                if polinomio is not None and modulo != "mpmath"
+                else lambdify(
+                    self.var,
+                    self.derivada_expr(orden),
+                    modules=MODULOS_EVALUADOR[modulo],
+                )
+            )
+        return self._evaluadores[clave]
+
+    @property
+    def dominio_str(self) -> str | None:
+        """
+        Dominio ya calculado como texto, para guardarlo
+        junto a la función; None si aún no se ha calculado.
+        """
+
+        return str(self._dominio) if self._dominio is not None else None
+
     def get_dominio(self) -> Interval:
         """
         Wrapper para continuous_domain() de sympy.
+        El dominio se calcula una sola vez, y se reutiliza
+        hasta que cambie 'self.expr'.
 
         Returns:
             Interval: El dominio real de 'self.expr'.
 
         """
 
-        return continuous_domain(self.expr, self.var, Reals)
+        if self._dominio is None:
+            self._dominio = continuous_domain(self.expr, self.var, Reals)
+        return self._dominio  # type: ignore[reportReturnType]
+
+    def asignar_dominio(self, dominio: Set) -> None:
+        """
+        Almacenar un dominio calculado fuera de la función
+        (por ejemplo, en un proceso aparte), para no recalcularlo.
+
+        Args:
+            dominio: Dominio real de 'self.expr'.
+
+        """
+
+        self._dominio = dominio
+        self._predicado_dominio = None
+
+    def en_dominio(self, x: float) -> bool:
+        """
+        Validar si x pertenece al dominio de la función, con un predicado
+        de comparaciones de punto flotante compilado a partir del dominio,
+        en lugar de Contains() de sympy.
+
+        Args:
+            x: Valor a validar.
+
+        Returns:
+            bool: Si x pertenece al dominio.
+
+        """
+
+        if self._predicado_dominio is None:
+            self._predicado_dominio = compilar_predicado(self.get_dominio())
+        return self._predicado_dominio(float(x))
 
     def es_continua(self, intervalo: tuple[Decimal, Decimal]) -> bool:
         """
@@ -121,15 +340,25 @@ class Func:
             self.get_dominio(),
         )  # type: ignore[reportReturnType]
 
-    def derivar(self) -> "Func":
+    def derivar(self, derivada: Expr | None = None) -> "Func":
         """
-        Encontrar la derivada de self.
+        Encontrar la derivada de self. Se crea una sola vez y se
+        reutiliza, junto con sus evaluadores, hasta que cambie 'self.expr'.
+
+        Args:
+            derivada: Derivada ya calculada (por ejemplo, en un proceso aparte).
 
         Returns:
             Func: Derivada de 'self.expr'.
 
         """
 
+        if self._derivada is not None:
+            return self._derivada
+        if derivada is not None:
+            Func.memo.agregar("derivadas", self.expr, self.var, derivada)
+            self._derivadas[1] = derivada
+
         if "'" not in self.nombre:
             d_nombre = f"{self.nombre[0]}'{self.nombre[1:]}"
 
@@ -140,12 +369,16 @@ class Func:
                 "".join("'" for _ in range(num_diff + 1)),
             )
 
-        return Func(d_nombre, str(diff(self.expr, self.var)))
+        self._derivada = Func(d_nombre, self.derivada_expr())
+        return self._derivada
 
-    def integrar(self) -> "Func":
+    def integrar(self, integral: Expr | None = None) -> "Func":
         """
         Encontrar la integral indefinida de self.
 
+        Args:
+            integral: Integral ya calculada (por ejemplo, en un proceso aparte).
+
         Returns:
             Func: Integral indefinida de 'self.expr'.
 
@@ -166,7 +399,11 @@ class Func:
         else:
             i_nombre = rf"{self.nombre[0]}^{'(-1)'}{self.nombre[1:]}"
 
-        return Func(i_nombre, str(integrate(self.expr, self.var)))
+        if integral is None:
+            integral = Func.memo.integrar(self.expr, self.var)
+        else:
+            Func.memo.agregar("integrales", self.expr, self.var, integral)
+        return Func(i_nombre, integral)
 
     def get_di_nombre(self, diffr: bool = False, integ: bool = False) -> str:
         """
@@ -342,3 +579,114 @@ class Func:
             light_image=img,
             size=(int(width * 20), int(height * 20)),
         )
+
+
+@lru_cache(maxsize=LIMITE_CACHE_EXPRS)
+def interpretar_expr(expr: str, var: str) -> Expr:
+    """
+    Interpretar una expresión ingresada como texto: se reescriben sus tokens
+    en una sola pasada con PATRON_TOKENS, y se interpreta con parse_expr().
+    Las expresiones son inmutables, así que el resultado se recuerda
+    y se comparte entre las funciones con el mismo texto.
+
+    Args:
+        expr: Expresión a interpretar.
+        var:  Variable de la función, que reemplaza a x.
+
+    Returns:
+        Expr: Expresión interpretada.
+
+    """
+
+    def reemplazar(token: Match[str]) -> str:
+        return var if token.group() == "x" else REEMPLAZOS[token.group()]
+
+    return parse_expr(PATRON_TOKENS.sub(reemplazar, expr), transformations=TRANSFORMS)
+
+
+def detectar_polinomio(expr: Expr, var: Symbol) -> Polinomio | None:
+    """
+    Extraer los coeficientes de una expresión, si es un polinomio en var
+    con coeficientes racionales (los decimales se leen de forma exacta).
+
+    Args:
+        expr: Expresión a analizar.
+        var:  Variable del polinomio.
+
+    Returns:
+        Polinomio | None: Polinomio de la expresión, o None si no es uno.
+
+    """
+
+    if not expr.is_polynomial(var):
+        return None
+
+    coeficientes: list[Expr] = Poly(expr, var).all_coeffs()
+    if not all(c.is_Rational or c.is_Float for c in coeficientes):
+        return None
+
+    return Polinomio(
+        [
+            Fraction(str(c)) if c.is_Float else Fraction(int(c.p), int(c.q))
+            for c in coeficientes
+        ],
+    )
+
+
+def compilar_predicado(conjunto: Set) -> Callable[[float], bool]:  # noqa: PLR0911
+    """
+    Convertir un conjunto de sympy en un predicado sobre floats.
+
+    Se traducen intervalos, uniones, intersecciones, complementos,
+    conjuntos finitos, y conjuntos de la forma { a • n + b | n ∈ Z }
+    (como las asíntotas de tan(x)). Cualquier otro conjunto se delega
+    a contains() de sympy, y si no se puede determinar
+    la pertenencia, se considera que x no pertenece.
+
+    Args:
+        conjunto: Conjunto a convertir.
+
+    Returns:
+        Callable[[float], bool]: Predicado de pertenencia.
+
+    """
+
+    if conjunto == Reals:
+        return lambda _: True
+    if conjunto.is_empty:
+        return lambda _: False
+
+    if isinstance(conjunto, Interval):
+        inicio, fin = float(conjunto.start), float(conjunto.end)
+        izq_abierto, der_abierto = conjunto.left_open, conjunto.right_open
+        return lambda x: (
+            (inicio < x if izq_abierto else inicio <= x)
+            and (x < fin if der_abierto else x <= fin)
+        )
+
+    if isinstance(conjunto, (Union, Intersection)):
+        predicados = [compilar_predicado(arg) for arg in conjunto.args]
+        combinar = any if isinstance(conjunto, Union) else all
+        return lambda x: combinar(predicado(x) for predicado in predicados)
+
+    if isinstance(conjunto, Complement):
+        base, excluido = (compilar_predicado(arg) for arg in conjunto.args)
+        return lambda x: base(x) and not excluido(x)
+
+    if isinstance(conjunto, FiniteSet) and all(p.is_number for p in conjunto.args):
+        puntos: set[float] = {float(p) for p in conjunto.args if p.is_real}
+        return lambda x: x in puntos
+
+    if isinstance(conjunto, ImageSet) and conjunto.base_sets == (Integers,):
+        (n,) = conjunto.lamda.variables
+        expr: Expr = conjunto.lamda.expr
+        if expr.is_polynomial(n) and degree(expr, n) == 1:
+            pendiente, ordenada = float(expr.coeff(n)), float(expr.subs(n, 0))
+
+            def es_punto(x: float) -> bool:
+                k: float = (x - ordenada) / pendiente
+                return abs(k - round(k)) <= 1e-12 * max(1.0, abs(k))
+
+            return es_punto
+
+    return lambda x: conjunto.contains(x) is true
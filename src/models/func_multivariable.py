@@ -0,0 +1,192 @@
+"""
+Implementación de funciones matemáticas de varias variables.
+Su gradiente y su matriz hessiana se calculan simbólicamente una sola vez,
+y se compilan en evaluadores vectorizados con numpy.
+"""
+
+from __future__ import annotations
+
+from re import compile as comp
+from typing import TYPE_CHECKING
+
+from numpy import (
+    asarray,
+    broadcast_shapes,
+    broadcast_to,
+    errstate,
+    float64,
+    shape,
+    stack,
+)
+from sympy import Expr, Symbol, diff, lambdify, nan, oo, zoo
+
+from .func import interpretar_expr
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import NDArray
+
+# variables de una funcion en la notacion f(x, y, z)
+PATRON_VARS = comp(r"\(\s*([a-z](?:\s*,\s*[a-z])*)\s*\)")
+
+
+class FuncMultivariable:
+    """
+    Representa una función matemática de varias variables, f(x, y, ...).
+    """
+
+    def __init__(self, nombre: str, expr: str | Expr) -> None:
+        """
+        Args:
+            nombre: Nombre de la función en la notación f(x, y).
+            expr:   La expresión que define la función (como texto, o como Expr).
+
+        Raises:
+            ValueError: Si el nombre no indica variables distintas,
+                        si la expresión depende de otras variables,
+                        o si tiene un dominio complejo.
+
+        """
+
+        coincidencia = PATRON_VARS.search(nombre)
+        if coincidencia is None:
+            raise ValueError("El nombre debe indicar las variables, como f(x, y).")
+
+        nombres_vars: list[str] = [v.strip() for v in coincidencia.group(1).split(",")]
+        if len(set(nombres_vars)) != len(nombres_vars):
+            raise ValueError("Las variables de la función deben ser distintas.")
+
+        self.nombre = nombre
+        self.vars: tuple[Symbol, ...] = tuple(Symbol(v) for v in nombres_vars)
+
+        # x no se reemplaza, cada variable se interpreta con su propio nombre
+        self.expr: Expr = (
+            expr if isinstance(expr, Expr) else interpretar_expr(expr, "x")
+        )
+
+        if self.expr.has(oo, -oo, zoo, nan):
+            raise ValueError("La función tiene un dominio complejo.")
+        if not self.expr.free_symbols <= set(self.vars):
+            raise ValueError(
+                f"La expresión depende de variables que no son parte de {nombre}.",
+            )
+
+        self._gradiente: list[Expr] | None = None
+        self._hessiana: list[list[Expr]] | None = None
+        self._evaluadores: dict[str, Callable[..., NDArray[float64]]] = {}
+
+    def __str__(self) -> str:
+        """
+        Crear ecuación matemática con 'self.nombre' y 'self.expr'.
+        """
+
+        return f"{self.nombre} = {self.expr}"
+
+    def gradiente_expr(self) -> list[Expr]:
+        """
+        Obtener el gradiente de 'self.expr': sus derivadas parciales
+        con respecto a cada variable, en el orden de 'self.vars'.
+        """
+
+        if self._gradiente is None:
+            self._gradiente = [diff(self.expr, var) for var in self.vars]
+        return self._gradiente
+
+    def hessiana_expr(self) -> list[list[Expr]]:
+        """
+        Obtener la matriz hessiana de 'self.expr'. Es simétrica,
+        así que solo se deriva el triángulo superior.
+        """
+
+        if self._hessiana is None:
+            gradiente: list[Expr] = self.gradiente_expr()
+            n: int = len(self.vars)
+
+            hessiana: list[list[Expr]] = [[gradiente[0]] * n for _ in range(n)]
+            for i in range(n):
+                for j in range(i, n):
+                    hessiana[i][j] = hessiana[j][i] = diff(gradiente[i], self.vars[j])
+            self._hessiana = hessiana
+        return self._hessiana
+
+    def evaluador(self) -> Callable[..., NDArray[float64]]:
+        """
+        Obtener el evaluador vectorizado de f: recibe un valor
+        (o un arreglo de valores) por variable, y retorna
+        un arreglo con la forma de los puntos.
+        """
+
+        if "f" not in self._evaluadores:
+            self._evaluadores["f"] = compilar_arreglo(self.vars, [self.expr], ())
+        return self._evaluadores["f"]
+
+    def gradiente(self) -> Callable[..., NDArray[float64]]:
+        """
+        Obtener el evaluador vectorizado del gradiente:
+        retorna un arreglo de forma (n, *forma de los puntos).
+        """
+
+        if "gradiente" not in self._evaluadores:
+            self._evaluadores["gradiente"] = compilar_arreglo(
+                self.vars,
+                self.gradiente_expr(),
+                (len(self.vars),),
+            )
+        return self._evaluadores["gradiente"]
+
+    def hessiana(self) -> Callable[..., NDArray[float64]]:
+        """
+        Obtener el evaluador vectorizado de la matriz hessiana:
+        retorna un arreglo de forma (n, n, *forma de los puntos).
+        """
+
+        if "hessiana" not in self._evaluadores:
+            n: int = len(self.vars)
+            self._evaluadores["hessiana"] = compilar_arreglo(
+                self.vars,
+                [d for fila in self.hessiana_expr() for d in fila],
+                (n, n),
+            )
+        return self._evaluadores["hessiana"]
+
+
+def compilar_arreglo(
+    variables: Sequence[Symbol],
+    exprs: list[Expr],
+    forma: tuple[int, ...],
+) -> Callable[..., NDArray[float64]]:
+    """
+    Compilar varias expresiones en un solo evaluador de numpy,
+    compartiendo sus subexpresiones comunes (con cse=True).
+
+    El evaluador recibe un valor o arreglo por variable, y retorna
+    un arreglo de forma (*forma, *forma de los puntos); las expresiones
+    constantes se expanden a la forma de los puntos. Los valores
+    fuera del dominio resultan en nan o inf.
+
+    Args:
+        variables: Variables de las expresiones, en orden de argumento.
+        exprs:     Expresiones a compilar (aplanadas, en orden de fila).
+        forma:     Forma del resultado en cada punto (() para un escalar).
+
+    Returns:
+        Callable[..., NDArray[float64]]: Evaluador compilado.
+
+    """
+
+    funcion = lambdify(variables, exprs, modules="numpy", cse=True)
+
+    def evaluar(*valores: float | NDArray[float64]) -> NDArray[float64]:
+        forma_puntos: tuple[int, ...] = broadcast_shapes(*(shape(v) for v in valores))
+        with errstate(all="ignore"):
+            componentes = funcion(*valores)
+
+        return stack(
+            [
+                broadcast_to(asarray(c, dtype=float64), forma_puntos)
+                for c in componentes
+            ],
+        ).reshape(forma + forma_puntos)
+
+    return evaluar
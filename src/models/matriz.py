@@ -9,11 +9,16 @@ from __future__ import annotations
 
 from copy import deepcopy
 from fractions import Fraction
+from math import lcm
+from random import randrange
 from typing import overload
 
 from src import FRAC_PREC
 from src.utils import format_factor
 
+# bases de Miller-Rabin suficientes para validar cualquier n < 3_215_031_751
+BASES_MILLER_RABIN: tuple[int, ...] = (2, 3, 5, 7)
+
 
 class Matriz:
     """
@@ -671,3 +676,193 @@ class Matriz:
         adjunta: Matriz = self.encontrar_adjunta()
         inversa: Matriz = adjunta * Fraction(1 / det)  # type: ignore[reportOperatorIssue]
         return (inversa, adjunta, det)  # type: ignore[reportReturnType]
+
+    def forma_escalonada_reducida(self) -> tuple[Matriz, list[int], Fraction]:
+        """
+        Reducir self a su forma escalonada reducida con una sola eliminación,
+        registrando las columnas pivote y el factor de escala acumulado.
+
+        El factor es el producto de los pivotes antes de normalizarlos,
+        con el signo de los intercambios de filas. Si self tiene rango
+        completo por filas, es igual al determinante de la submatriz
+        formada por sus columnas pivote.
+
+        Returns:
+            (Matriz, list[int], Fraction):
+                Matriz escalonada reducida,
+                índices de las columnas pivote y
+                factor de escala acumulado.
+
+        """
+
+        reducida: list[list[Fraction]] = [list(fila) for fila in self.valores]
+        pivotes: list[int] = []
+        factor = Fraction(1)
+        actual: int = 0
+
+        for j in range(self.columnas):
+            if actual == self.filas:
+                break
+
+            fila_pivote: int | None = next(
+                (i for i in range(actual, self.filas) if reducida[i][j] != 0),
+                None,
+            )
+
+            if fila_pivote is None:
+                continue
+
+            if fila_pivote != actual:
+                reducida[actual], reducida[fila_pivote] = (
+                    reducida[fila_pivote],
+                    reducida[actual],
+                )
+
+                factor = -factor
+
+            pivote: Fraction = reducida[actual][j]
+            factor *= pivote
+            fila: list[Fraction] = [x / pivote for x in reducida[actual]]
+            reducida[actual] = fila
+
+            for i in range(self.filas):
+                coeficiente: Fraction = reducida[i][j]
+                if i != actual and coeficiente != 0:
+                    reducida[i] = [
+                        a - coeficiente * b
+                        for a, b in zip(reducida[i], fila, strict=True)
+                    ]
+
+            pivotes.append(j)
+            actual += 1
+
+        return (Matriz(self.filas, self.columnas, valores=reducida), pivotes, factor)
+
+    def pivotes_modulares(self, primo: int) -> list[int]:
+        """
+        Encontrar las columnas pivote de self módulo un primo,
+        con aritmética de enteros pequeños en lugar de fracciones.
+
+        Cada fila se escala por el mínimo común múltiplo de sus
+        denominadores (lo cual no altera el rango), y se reduce
+        módulo el primo. El rango módulo p nunca es mayor que el rango
+        real, y solo es menor si p divide a ciertos menores de la matriz.
+
+        Args:
+            primo: Primo con el cual reducir la matriz.
+
+        Returns:
+            list[int]: Índices de las columnas pivote.
+
+        """
+
+        filas: list[list[int]] = []
+        for fila in self.valores:
+            mcm: int = lcm(*(x.denominator for x in fila))
+            filas.append([(x.numerator * (mcm // x.denominator)) % primo for x in fila])
+
+        pivotes: list[int] = []
+        actual: int = 0
+        for j in range(self.columnas):
+            fila_pivote: int | None = next(
+                (i for i in range(actual, self.filas) if filas[i][j] != 0),
+                None,
+            )
+
+            if fila_pivote is None:
+                continue
+
+            filas[actual], filas[fila_pivote] = filas[fila_pivote], filas[actual]
+            inverso: int = pow(filas[actual][j], -1, primo)
+            pivote: list[int] = [(x * inverso) % primo for x in filas[actual]]
+            filas[actual] = pivote
+
+            for i in range(actual + 1, self.filas):
+                factor: int = filas[i][j]
+                if factor != 0:
+                    filas[i] = [
+                        (a - factor * b) % primo
+                        for a, b in zip(filas[i], pivote, strict=True)
+                    ]
+
+            pivotes.append(j)
+            actual += 1
+            if actual == self.filas:
+                break
+
+        return pivotes
+
+    def rango_modular(self, num_primos: int = 3) -> int:
+        """
+        Calcular el rango de self con alta probabilidad,
+        como el máximo de los rangos módulo varios primos aleatorios grandes.
+
+        Args:
+            num_primos: Número de primos a utilizar.
+
+        Returns:
+            int: Rango de self (con alta probabilidad).
+
+        """
+
+        return max(
+            len(self.pivotes_modulares(primo_aleatorio())) for _ in range(num_primos)
+        )
+
+
+def primo_aleatorio(minimo: int = 2**30, maximo: int = 2**31) -> int:
+    """
+    Generar un primo aleatorio en el rango [minimo, maximo),
+    validado con Miller-Rabin determinista.
+
+    Args:
+        minimo: Límite inferior del rango.
+        maximo: Límite superior del rango (menor a 3_215_031_751).
+
+    Returns:
+        int: Primo generado.
+
+    """
+
+    while True:
+        candidato: int = randrange(minimo, maximo) | 1
+        if es_primo(candidato):
+            return candidato
+
+
+def es_primo(n: int) -> bool:
+    """
+    Validar si n es primo con el test de Miller-Rabin,
+    determinista para n < 3_215_031_751.
+
+    Args:
+        n: Número a validar.
+
+    Returns:
+        bool: Si n es primo.
+
+    """
+
+    if n < 2:
+        return False
+    for base in BASES_MILLER_RABIN:
+        if n % base == 0:
+            return n == base
+
+    d: int = n - 1
+    s: int = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in BASES_MILLER_RABIN:
+        x: int = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
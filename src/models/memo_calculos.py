@@ -0,0 +1,207 @@
+"""
+Implementación de memoria de derivadas e integrales simbólicas.
+Cada entrada relaciona una expresión con su derivada (o antiderivada),
+así que las cadenas f -> f' -> f'' y f -> ∫f -> ∫∫f se recorren
+entrada por entrada, y solo se calcula con sympy lo que falta.
+Las expresiones guardadas se leen con leer_srepr(), sin eval.
+"""
+
+from __future__ import annotations
+
+import ast
+from typing import Literal
+
+import sympy
+from sympy import Basic, Expr, Symbol, diff, integrate, srepr
+
+from src.utils import LOGGER
+
+# numero maximo de entradas de cada tabla; al excederlo,
+# se descartan las entradas mas antiguas
+LIMITE_MEMO: int = 1000
+
+
+class MemoCalculos:
+    """
+    Memoria de derivadas y antiderivadas, indexada por la forma canónica
+    de la expresión (su srepr()) y la variable. Los resultados se almacenan
+    como Expr, para no tener que interpretarlos de nuevo como texto.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializar tablas vacías de derivadas e integrales.
+        """
+
+        self._tablas: dict[str, dict[tuple[str, str], Expr]] = {
+            "derivadas": {},
+            "integrales": {},
+        }
+
+    def __len__(self) -> int:
+        """
+        Número total de entradas almacenadas.
+        """
+
+        return sum(len(tabla) for tabla in self._tablas.values())
+
+    def derivada(self, expr: Expr, var: Symbol) -> Expr | None:
+        """
+        Buscar la derivada de expr con respecto a var, sin calcularla.
+
+        Returns:
+            Expr | None: La derivada, o None si no se ha almacenado.
+
+        """
+
+        return self._tablas["derivadas"].get(MemoCalculos.clave(expr, var))
+
+    def integral(self, expr: Expr, var: Symbol) -> Expr | None:
+        """
+        Buscar la antiderivada de expr con respecto a var, sin calcularla.
+
+        Returns:
+            Expr | None: La antiderivada, o None si no se ha almacenado.
+
+        """
+
+        return self._tablas["integrales"].get(MemoCalculos.clave(expr, var))
+
+    def derivar(self, expr: Expr, var: Symbol) -> Expr:
+        """
+        Obtener la derivada de expr, calculándola solo si no se ha almacenado.
+        """
+
+        derivada: Expr | None = self.derivada(expr, var)
+        if derivada is None:
+            derivada = diff(expr, var)
+            self.agregar("derivadas", expr, var, derivada)
+        return derivada
+
+    def integrar(self, expr: Expr, var: Symbol) -> Expr:
+        """
+        Obtener la antiderivada de expr, calculándola solo si no se ha almacenado.
+        """
+
+        integral: Expr | None = self.integral(expr, var)
+        if integral is None:
+            integral = integrate(expr, var)
+            self.agregar("integrales", expr, var, integral)
+        return integral
+
+    def agregar(
+        self,
+        tabla: Literal["derivadas", "integrales"],
+        expr: Expr,
+        var: Symbol,
+        resultado: Expr,
+    ) -> None:
+        """
+        Almacenar una derivada o antiderivada ya calculada.
+
+        Args:
+            tabla:     Tabla donde almacenar el resultado.
+            expr:      Expresión original.
+            var:       Variable con respecto a la cual se calculó.
+            resultado: Derivada o antiderivada de expr.
+
+        """
+
+        entradas: dict[tuple[str, str], Expr] = self._tablas[tabla]
+        entradas[MemoCalculos.clave(expr, var)] = resultado
+        while len(entradas) > LIMITE_MEMO:
+            del entradas[next(iter(entradas))]
+
+    def exportar(self) -> dict[str, list[list[str]]]:
+        """
+        Convertir las tablas en listas de [variable, expresión, resultado],
+        con las expresiones en su forma srepr(), para guardarlas como JSON.
+        """
+
+        return {
+            nombre: [
+                [var, expr, srepr(resultado)]
+                for (var, expr), resultado in tabla.items()
+            ]
+            for nombre, tabla in self._tablas.items()
+        }
+
+    def cargar(self, datos: dict[str, list[list[str]]]) -> None:
+        """
+        Cargar entradas guardadas con exportar().
+
+        Args:
+            datos: Tablas a cargar.
+
+        """
+
+        for nombre, entradas in datos.items():
+            if nombre not in self._tablas:
+                continue
+
+            tabla: dict[tuple[str, str], Expr] = self._tablas[nombre]
+            for entrada in entradas:
+                try:
+                    var, expr, resultado = entrada
+                    tabla[(var, expr)] = leer_srepr(resultado)
+                except (TypeError, ValueError):
+                    # una entrada invalida solo se descarta,
+                    # y se calculara de nuevo si se necesita
+                    LOGGER.warning("Entrada inválida en cálculos: %s", entrada)
+
+            while len(tabla) > LIMITE_MEMO:
+                del tabla[next(iter(tabla))]
+
+    @staticmethod
+    def clave(expr: Expr, var: Symbol) -> tuple[str, str]:
+        """
+        Clave canónica de una expresión y su variable.
+        """
+
+        return (str(var), srepr(expr))
+
+
+def leer_srepr(texto: str) -> Expr:
+    """
+    Construir una expresión a partir de su forma srepr(), recorriendo
+    su árbol sintáctico: solo se permiten llamadas a clases de sympy
+    y constantes de sympy, con argumentos literales.
+
+    Args:
+        texto: srepr() de la expresión.
+
+    Returns:
+        Expr: Expresión construida.
+
+    Raises:
+        ValueError: Si el texto no es un srepr() válido.
+
+    """
+
+    def construir(nodo: ast.expr) -> object:
+        if isinstance(nodo, ast.Constant):
+            return nodo.value
+        if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.USub):
+            return -construir(nodo.operand)  # type: ignore[reportOperatorIssue]
+        if isinstance(nodo, ast.Name):
+            constante = getattr(sympy, nodo.id, None)
+            if isinstance(constante, Basic):
+                return constante
+        elif isinstance(nodo, ast.Call) and isinstance(nodo.func, ast.Name):
+            clase = getattr(sympy, nodo.func.id, None)
+            if isinstance(clase, type) and issubclass(clase, Basic):
+                return clase(
+                    *(construir(arg) for arg in nodo.args),
+                    **{kw.arg: construir(kw.value) for kw in nodo.keywords if kw.arg},
+                )
+
+        raise ValueError(f"Expresión inválida: '{ast.unparse(nodo)}'.")
+
+    try:
+        expr = construir(ast.parse(texto, mode="eval").body)
+    except (SyntaxError, TypeError) as e:
+        raise ValueError(f"Expresión inválida: '{texto}'.") from e
+
+    if isinstance(expr, Expr):
+        return expr
+    raise ValueError(f"Expresión inválida: '{texto}'.")
@@ -0,0 +1,265 @@
+"""
+Implementación de polinomios con coeficientes racionales.
+Se evalúan con el método de Horner, sus raíces racionales se encuentran
+de forma exacta con el teorema de la raíz racional, y el resto de raíces
+(reales y complejas) como valores propios de la matriz compañera.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from math import gcd, lcm
+from typing import TYPE_CHECKING, overload
+
+from numpy import complex128, eye, zeros
+from numpy.linalg import eigvals
+from sympy import divisors
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy import float64
+    from numpy.typing import NDArray
+
+
+class Polinomio:
+    """
+    Representa un polinomio con coeficientes racionales,
+    ordenados del término de mayor grado al término constante.
+    """
+
+    __slots__ = ("_coeficientes", "_flotantes")
+
+    def __init__(self, coeficientes: Sequence[Fraction | int]) -> None:
+        """
+        Args:
+            coeficientes: Coeficientes del polinomio, del mayor grado al constante.
+
+        Raises:
+            ValueError: Si no se recibe ningún coeficiente.
+
+        """
+
+        if len(coeficientes) == 0:
+            raise ValueError("Un polinomio debe tener al menos un coeficiente.")
+
+        fracciones: list[Fraction] = [Fraction(c) for c in coeficientes]
+
+        # descartar los ceros del principio, dejando al menos el termino constante
+        inicio: int = next(
+            (i for i, c in enumerate(fracciones) if c != 0),
+            len(fracciones) - 1,
+        )
+
+        self._coeficientes: tuple[Fraction, ...] = tuple(fracciones[inicio:])
+        self._flotantes: tuple[float, ...] = tuple(float(c) for c in self._coeficientes)
+
+    @property
+    def coeficientes(self) -> tuple[Fraction, ...]:
+        """
+        Coeficientes del polinomio, del mayor grado al constante.
+        """
+
+        return self._coeficientes
+
+    @property
+    def grado(self) -> int:
+        """
+        Grado del polinomio (0 para polinomios constantes).
+        """
+
+        return len(self._coeficientes) - 1
+
+    @overload
+    def evaluar(self, x: Fraction | int) -> Fraction: ...
+
+    @overload
+    def evaluar(self, x: float) -> float: ...
+
+    @overload
+    def evaluar(self, x: NDArray[float64]) -> NDArray[float64]: ...
+
+    def evaluar(
+        self,
+        x: Fraction | float | NDArray[float64],
+    ) -> Fraction | float | NDArray[float64]:
+        """
+        Evaluar el polinomio con el método de Horner:
+        a • x^2 + b • x + c = (a • x + b) • x + c.
+
+        Los racionales se evalúan de forma exacta, y cualquier otro valor
+        (floats o arreglos de numpy) con los coeficientes en punto flotante.
+
+        Args:
+            x: Valor o arreglo de valores en los cuales evaluar.
+
+        Returns:
+            Fraction | float | NDArray[float64]: Valor del polinomio en x.
+
+        """
+
+        coeficientes: Sequence[Fraction | float] = (
+            self._coeficientes if isinstance(x, (Fraction, int)) else self._flotantes
+        )
+
+        # se empieza con 0 • x para conservar la forma de los arreglos
+        resultado = 0 * x + coeficientes[0]
+        for coeficiente in coeficientes[1:]:
+            resultado = resultado * x + coeficiente
+        return resultado
+
+    def derivada(self, orden: int = 1) -> Polinomio:
+        """
+        Calcular la derivada del polinomio del orden indicado.
+
+        Args:
+            orden: Orden de la derivada (0 para el polinomio mismo).
+
+        Returns:
+            Polinomio: Derivada del polinomio.
+
+        """
+
+        coeficientes: list[Fraction] = list(self._coeficientes)
+        for _ in range(orden):
+            grado: int = len(coeficientes) - 1
+            if grado == 0:
+                return Polinomio([0])
+
+            coeficientes = [c * (grado - i) for i, c in enumerate(coeficientes[:-1])]
+        return Polinomio(coeficientes)
+
+    def deflactar(self, raiz: Fraction | float) -> Polinomio:
+        """
+        Dividir el polinomio entre (x - raiz) con división sintética,
+        descartando el residuo (que es 0 si raiz es una raíz).
+
+        Args:
+            raiz: Raíz a factorizar.
+
+        Returns:
+            Polinomio: Cociente de la división.
+
+        """
+
+        cociente: list[Fraction] = [self._coeficientes[0]]
+        for coeficiente in self._coeficientes[1:-1]:
+            cociente.append(cociente[-1] * Fraction(raiz) + coeficiente)
+        return Polinomio(cociente)
+
+    def coeficientes_enteros(self) -> list[int]:
+        """
+        Escalar los coeficientes a enteros coprimos,
+        multiplicando por el mcm de los denominadores.
+        """
+
+        denominador: int = lcm(*(c.denominator for c in self._coeficientes))
+        enteros: list[int] = [
+            c.numerator * (denominador // c.denominator) for c in self._coeficientes
+        ]
+
+        divisor: int = gcd(*enteros) or 1
+        return [n // divisor for n in enteros]
+
+    def raices_racionales(self) -> tuple[list[Fraction], Polinomio]:
+        """
+        Encontrar las raíces racionales del polinomio, con multiplicidad.
+
+        Por el teorema de la raíz racional, toda raíz racional p/q
+        (en términos mínimos) cumple que p divide al término constante
+        y q al coeficiente principal. Cada candidato se valida de forma
+        exacta con enteros, y cada raíz encontrada se factoriza
+        para seguir buscando en un polinomio de menor grado.
+
+        Returns:
+            (list[Fraction], Polinomio):
+                Raíces racionales ordenadas, y el polinomio
+                que queda al factorizarlas (sin raíces racionales).
+
+        """
+
+        raices: list[Fraction] = []
+        resto: Polinomio = self
+
+        # los terminos constantes nulos corresponden a la raiz 0
+        while resto.grado > 0 and resto._coeficientes[-1] == 0:
+            raices.append(Fraction(0))
+            resto = Polinomio(resto._coeficientes[:-1])
+
+        if resto.grado == 0:
+            return (raices, resto)
+
+        enteros: list[int] = resto.coeficientes_enteros()
+        candidatos: list[Fraction] = sorted(
+            {
+                Fraction(signo * p, q)
+                for p in divisors(abs(enteros[-1]))
+                for q in divisors(abs(enteros[0]))
+                for signo in (1, -1)
+            },
+            key=abs,
+        )
+
+        for candidato in candidatos:
+            while resto.grado > 0 and Polinomio._anula(
+                enteros,
+                candidato.numerator,
+                candidato.denominator,
+            ):
+                raices.append(candidato)
+                resto = resto.deflactar(candidato)
+                enteros = resto.coeficientes_enteros()
+
+            if resto.grado == 0:
+                break
+        return (sorted(raices), resto)
+
+    def raices_numericas(self) -> NDArray[complex128]:
+        """
+        Aproximar todas las raíces (reales y complejas) del polinomio
+        como los valores propios de su matriz compañera, con una sola
+        llamada a numpy. Para x^n + c₁ • x^(n - 1) + ... + cₙ,
+        la matriz compañera tiene −c₁, ..., −cₙ en la primera fila,
+        y unos debajo de la diagonal principal.
+
+        Returns:
+            NDArray[complex128]: Raíces del polinomio.
+
+        """
+
+        if self.grado < 1:
+            return zeros(0, dtype=complex128)
+
+        principal: float = self._flotantes[0]
+        companera = zeros((self.grado, self.grado))
+        companera[0, :] = [-c / principal for c in self._flotantes[1:]]
+        companera[1:, :-1] = eye(self.grado - 1)
+        return eigvals(companera).astype(complex128)
+
+    def raices(self) -> tuple[list[Fraction], NDArray[complex128]]:
+        """
+        Encontrar todas las raíces del polinomio: las racionales de forma exacta,
+        y las demás como valores propios del polinomio deflactado.
+
+        Returns:
+            (list[Fraction], NDArray[complex128]):
+                Raíces racionales y raíces restantes.
+
+        """
+
+        racionales, resto = self.raices_racionales()
+        return (racionales, resto.raices_numericas())
+
+    @staticmethod
+    def _anula(enteros: list[int], p: int, q: int) -> bool:
+        """
+        Validar si p/q es raíz del polinomio con coeficientes enteros,
+        evaluando q^n • P(p/q) = Σ aₖ • p^(n - k) • q^k solo con enteros.
+        """
+
+        resultado: int = enteros[0]
+        potencia_q: int = 1
+        for coeficiente in enteros[1:]:
+            potencia_q *= q
+            resultado = resultado * p + coeficiente * potencia_q
+        return resultado == 0
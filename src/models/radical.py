@@ -0,0 +1,244 @@
+"""
+Implementación de radicales exactos de la forma a • √r,
+con a racional y r un entero libre de cuadrados.
+Se utilizan para representar magnitudes de vectores
+sin pasar por aproximaciones de punto flotante.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from math import isqrt, sqrt
+
+from src import FRAC_PREC
+
+
+class Radical:
+    """
+    Representa un número de la forma coeficiente • √radicando,
+    donde el radicando es un entero positivo libre de cuadrados.
+    """
+
+    __slots__ = ("_coeficiente", "_flotante", "_radicando")
+
+    def __init__(self, coeficiente: Fraction, radicando: int = 1) -> None:
+        """
+        Args:
+            coeficiente: Factor racional del radical.
+            radicando:   Entero libre de cuadrados dentro de la raíz.
+
+        Raises:
+            ValueError: Si el radicando no es positivo.
+
+        """
+
+        if radicando <= 0:
+            raise ValueError("El radicando debe ser un entero positivo.")
+
+        self._coeficiente = Fraction(coeficiente)
+        self._radicando: int = radicando if self._coeficiente != 0 else 1
+        self._flotante: float | None = None
+
+    @classmethod
+    def raiz(cls, valor: Fraction) -> Radical:
+        """
+        Calcular la raíz cuadrada exacta de un racional no negativo.
+
+        Si valor = p/q, con p = a^2 • m y q = b^2 • n (m y n libres
+        de cuadrados), entonces √valor = (a / (b • n)) • √(m • n);
+        y como p y q son coprimos, m • n también es libre de cuadrados.
+
+        Args:
+            valor: Racional del cual calcular la raíz.
+
+        Returns:
+            Radical: Raíz cuadrada exacta de valor.
+
+        Raises:
+            ValueError: Si valor es negativo.
+
+        """
+
+        valor = Fraction(valor)
+        if valor < 0:
+            raise ValueError("No se puede calcular la raíz de un número negativo.")
+
+        a, m = extraer_cuadrado(valor.numerator)
+        b, n = extraer_cuadrado(valor.denominator)
+        return cls(Fraction(a, b * n), m * n)
+
+    @property
+    def coeficiente(self) -> Fraction:
+        """
+        Factor racional del radical.
+        """
+
+        return self._coeficiente
+
+    @property
+    def radicando(self) -> int:
+        """
+        Entero libre de cuadrados dentro de la raíz.
+        """
+
+        return self._radicando
+
+    def es_racional(self) -> bool:
+        """
+        Validar si el radical es un número racional (radicando igual a 1).
+        """
+
+        return self._radicando == 1
+
+    def cuadrado(self) -> Fraction:
+        """
+        Calcular el cuadrado exacto del radical.
+        """
+
+        return self._coeficiente**2 * self._radicando
+
+    def inverso(self) -> Radical:
+        """
+        Calcular 1 / (a • √r) = (1 / (a • r)) • √r.
+
+        Raises:
+            ZeroDivisionError: Si el radical es 0.
+
+        """
+
+        if self._coeficiente == 0:
+            raise ZeroDivisionError("No se puede invertir un radical igual a 0.")
+
+        return Radical(1 / (self._coeficiente * self._radicando), self._radicando)
+
+    def __float__(self) -> float:
+        """
+        Aproximación de punto flotante del radical,
+        calculada una sola vez y almacenada.
+        """
+
+        if self._flotante is None:
+            self._flotante = float(self._coeficiente) * sqrt(self._radicando)
+        return self._flotante
+
+    def __mul__(self, multiplicador: Radical | Fraction | int) -> Radical:
+        """
+        Multiplicar self por otro radical o por un racional.
+        """
+
+        if isinstance(multiplicador, Radical):
+            comun, resto = extraer_cuadrado(
+                self._radicando * multiplicador._radicando,
+            )
+
+            return Radical(
+                self._coeficiente * multiplicador._coeficiente * comun,
+                resto,
+            )
+
+        if isinstance(multiplicador, (Fraction, int)):
+            return Radical(self._coeficiente * multiplicador, self._radicando)
+        return NotImplemented
+
+    def __rmul__(self, multiplicador: Fraction | int) -> Radical:
+        """
+        Multiplicar un racional por self.
+        """
+
+        return self * multiplicador
+
+    def __truediv__(self, divisor: Radical | Fraction | int) -> Radical:
+        """
+        Dividir self entre otro radical o entre un racional.
+        """
+
+        if isinstance(divisor, Radical):
+            return self * divisor.inverso()
+        if isinstance(divisor, (Fraction, int)):
+            return Radical(self._coeficiente / divisor, self._radicando)
+        return NotImplemented
+
+    def __rtruediv__(self, dividendo: Fraction | int) -> Radical:
+        """
+        Dividir un racional entre self.
+        """
+
+        return self.inverso() * dividendo
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Validar si dos radicales son iguales, o si self es igual a un racional.
+        """
+
+        if isinstance(other, Radical):
+            return (self._coeficiente, self._radicando) == (
+                other._coeficiente,
+                other._radicando,
+            )
+
+        if isinstance(other, (Fraction, int)):
+            return self.es_racional() and self._coeficiente == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Hashear el par (coeficiente, radicando).
+        """
+
+        return hash((self._coeficiente, self._radicando))
+
+    def __str__(self) -> str:
+        """
+        Formatear el radical como a√r.
+        """
+
+        coeficiente: Fraction = self._coeficiente.limit_denominator(FRAC_PREC["prec"])
+        if self.es_racional():
+            return str(coeficiente)
+
+        raiz = f"√{self._radicando}"
+        if coeficiente == 1:
+            return raiz
+        if coeficiente == -1:
+            return f"−{raiz}"
+        if coeficiente.is_integer():
+            return f"{coeficiente}{raiz}".replace("-", "−")
+        return f"({coeficiente}){raiz}".replace("-", "−")
+
+
+def extraer_cuadrado(n: int) -> tuple[int, int]:
+    """
+    Descomponer un entero positivo como n = a^2 • m, con m libre de cuadrados.
+
+    Se prueba división por factores d mientras d^3 <= n; al terminar,
+    el cofactor restante no tiene factores menores que su raíz cúbica,
+    así que tiene a lo sumo dos factores primos: es un cuadrado
+    perfecto (p^2), o es libre de cuadrados.
+
+    Args:
+        n: Entero positivo a descomponer.
+
+    Returns:
+        (int, int): Factores a y m.
+
+    """
+
+    cuadrado, libre = 1, 1
+    d = 2
+    while d * d * d <= n:
+        exponente = 0
+        while n % d == 0:
+            n //= d
+            exponente += 1
+
+        cuadrado *= d ** (exponente // 2)
+        if exponente % 2 == 1:
+            libre *= d
+        d += 1 if d == 2 else 2
+
+    raiz: int = isqrt(n)
+    if raiz * raiz == n:
+        cuadrado *= raiz
+    else:
+        libre *= n
+    return (cuadrado, libre)
@@ -0,0 +1,108 @@
+"""
+Implementación de registros de iteraciones de métodos numéricos.
+Los valores se almacenan como floats en un arreglo compacto,
+y solo se formatean como texto cuando se muestra la tabla.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import overload
+
+
+class RegistroIteraciones(Sequence[list[str]]):
+    """
+    Tabla de iteraciones de un método numérico, con una fila
+    de encabezados seguida de una fila por iteración.
+    Cada fila se formatea al accederla, como list[str].
+    """
+
+    def __init__(self, encabezados: list[str]) -> None:
+        """
+        Args:
+            encabezados: Encabezados de las columnas, empezando por "Iteración".
+
+        """
+
+        self.encabezados = encabezados
+        self._columnas: int = len(encabezados) - 1
+        self._valores: array[float] = array("d")
+
+    def agregar(self, *valores: float) -> None:
+        """
+        Agregar una fila con los valores de una iteración.
+
+        Args:
+            valores: Valores de la iteración, uno por columna (sin el número).
+
+        Raises:
+            ValueError: Si el número de valores no coincide con las columnas.
+
+        """
+
+        if len(valores) != self._columnas:
+            raise ValueError(
+                f"Se esperaban {self._columnas} valores por iteración, "
+                f"no {len(valores)}.",
+            )
+
+        self._valores.extend(valores)
+
+    @overload
+    def __getitem__(self, indice: int) -> list[str]: ...
+
+    @overload
+    def __getitem__(self, indice: slice) -> list[list[str]]: ...
+
+    def __getitem__(self, indice: int | slice) -> list[str] | list[list[str]]:
+        """
+        Obtener una fila formateada (la fila 0 son los encabezados).
+
+        Args:
+            indice: Índice o slice de filas.
+
+        Returns:
+            list[str]:       Fila formateada.
+            list[list[str]]: Filas formateadas.
+
+        Raises:
+            IndexError: Si el índice está fuera de rango.
+
+        """
+
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice inválido.")
+
+        if indice == 0:
+            return self.encabezados
+
+        inicio: int = (indice - 1) * self._columnas
+        return [
+            str(indice),
+            *(
+                RegistroIteraciones.formatear(valor)
+                for valor in self._valores[inicio : inicio + self._columnas]
+            ),
+        ]
+
+    def __len__(self) -> int:
+        """
+        Número de filas de la tabla, incluyendo los encabezados.
+        """
+
+        return 1 + len(self._valores) // self._columnas
+
+    @staticmethod
+    def formatear(num: float) -> str:
+        """
+        Formatear número para mostrarlo en la tabla de iteraciones.
+        """
+
+        return format(Decimal(num).normalize(), "f").replace("-", "−")
@@ -1,16 +1,26 @@
 """
 Implementación de sistemas de ecuaciones lineales
 representados por una matriz aumentada. Se pueden
-resolver con la Regla de Cramer y el método Gauss-Jordan.
+resolver con la Regla de Cramer, el método Gauss-Jordan,
+y por mínimos cuadrados para sistemas sobredeterminados.
 """
 
+from collections.abc import Iterator
 from copy import deepcopy
+from decimal import Decimal
 from fractions import Fraction
 
+from numpy import array
+from numpy.linalg import lstsq
+
 from src import FRAC_PREC
 from src.utils import LOGGER, format_factor
 
-from .matriz import Matriz
+from .matriz import Matriz, primo_aleatorio
+from .solucion_parametrica import SolucionParametrica
+
+# evento de un paso de Gauss-Jordan: (tipo, fila, otra fila, factor)
+PasoGJ = tuple[str, int, int, Fraction]
 
 
 class SistemaEcuaciones:
@@ -39,8 +49,46 @@ class SistemaEcuaciones:
         # para evitar cambios en la matriz original, ya que
         # este __init__ recibe una referencia a la matriz
         self.matriz = deepcopy(matriz)
-        self.solucion: str = ""
-        self.procedimiento: str = ""
+        self._solucion: str = ""
+        self._procedimiento: str = ""
+
+        # solucion general estructurada, si el sistema tiene infinitas soluciones;
+        # su texto se inserta en el procedimiento (en cada posicion indicada)
+        # hasta que se lee, en lugar de construirse al resolver
+        self.solucion_general: SolucionParametrica | None = None
+        self._diferidos: list[tuple[int, SolucionParametrica]] = []
+
+        # ecuaciones normales (AᵀA, Aᵀb), calculadas al necesitarse
+        self._ata: Matriz | None = None
+        self._atb: list[Fraction] | None = None
+
+    @property
+    def solucion(self) -> str:
+        """
+        Texto de la solución del sistema. Si tiene infinitas soluciones,
+        el texto de self.solucion_general se genera al leerlo.
+        """
+
+        if self.solucion_general is None:
+            return self._solucion
+        return self._solucion + str(self.solucion_general)
+
+    @property
+    def procedimiento(self) -> str:
+        """
+        Texto del procedimiento realizado, con el texto
+        de las soluciones generales generado al leerlo.
+        """
+
+        partes: list[str] = []
+        inicio: int = 0
+        for posicion, solucion_general in self._diferidos:
+            partes.append(self._procedimiento[inicio:posicion])
+            partes.append(str(solucion_general))
+            inicio = posicion
+
+        partes.append(self._procedimiento[inicio:])
+        return "".join(partes)
 
     def __str__(self) -> str:
         """
@@ -131,25 +179,25 @@ class SistemaEcuaciones:
             tipo_sol: str = "no trivial"
 
         # almacenar el procedimiento
-        self.procedimiento += "---------------------------------------------\n"
-        self.procedimiento += f"{nombre}_var:\n{mat_variables}"
-        self.procedimiento += f"\n\nb:\n{col_aumentada}"
-        self.procedimiento += "\n---------------------------------------------\n"
+        self._procedimiento += "---------------------------------------------\n"
+        self._procedimiento += f"{nombre}_var:\n{mat_variables}"
+        self._procedimiento += f"\n\nb:\n{col_aumentada}"
+        self._procedimiento += "\n---------------------------------------------\n"
 
-        self.procedimiento += f"| {nombre}_var |  =  "
-        self.procedimiento += f"{det if det > 0 else f'−{-det}'}\n\n"  # type: ignore[reportOperatorIssue]
+        self._procedimiento += f"| {nombre}_var |  =  "
+        self._procedimiento += f"{det if det > 0 else f'−{-det}'}\n\n"  # type: ignore[reportOperatorIssue]
 
         for i, subdet in enumerate(sub_dets):
-            self.procedimiento += f"| {nombre}_{i + 1} (b) |  =  "
-            self.procedimiento += f"{subdet if det > 0 else f'−{-subdet}'}\n"  # type: ignore[reportOperatorIssue]
+            self._procedimiento += f"| {nombre}_{i + 1} (b) |  =  "
+            self._procedimiento += f"{subdet if det > 0 else f'−{-subdet}'}\n"  # type: ignore[reportOperatorIssue]
 
-        self.procedimiento += "---------------------------------------------\n"
+        self._procedimiento += "---------------------------------------------\n"
 
         # almacenar la solucion
-        self.solucion += f"\nSolución {tipo_sol} encontrada:\n"
+        self._solucion += f"\nSolución {tipo_sol} encontrada:\n"
         for i, sol in enumerate(soluciones):
-            self.solucion += f"X{i + 1} = "
-            self.solucion += f"{
+            self._solucion += f"X{i + 1} = "
+            self._solucion += f"{
                 format_factor(
                     sol.limit_denominator(FRAC_PREC['prec']),
                     mult=False,
@@ -159,12 +207,245 @@ class SistemaEcuaciones:
                 )
             }\n"
 
-    def gauss_jordan(self) -> None:
+    def minimos_cuadrados(self, flotante: bool = False) -> None:
+        """
+        Encontrar la solución por mínimos cuadrados del sistema,
+        i.e. el vector x que minimiza || Ax − b ||, resolviendo
+        las ecuaciones normales AᵀAx = Aᵀb.
+
+        Útil para sistemas sobredeterminados e inconsistentes
+        (ajuste de datos); si el sistema es consistente,
+        la solución coincide con la de self.gauss_jordan().
+
+        Args:
+            flotante: Si se debe resolver en punto flotante con numpy,
+                      en lugar de resolver exactamente con fracciones.
+
+        """
+
+        if flotante:
+            self._minimos_cuadrados_flotante()
+            return
+
+        ata, atb = self._ecuaciones_normales()
+        n: int = ata.filas
+
+        normales = SistemaEcuaciones(
+            Matriz(
+                filas=n,
+                columnas=n + 1,
+                valores=[[*ata[i], atb[i]] for i in range(n)],
+                aumentada=True,
+            ),
+        )
+
+        normales.gauss_jordan()
+
+        # si hay variables libres, tomar la solucion particular
+        # (variables libres iguales a 0), todas dan el mismo residuo
+        if normales.solucion_general is not None:
+            x: list[Fraction] = normales.solucion_general.particular
+        else:
+            x: list[Fraction] = [fila[-1] for fila in normales.matriz.valores]
+
+        norma_residuo: Decimal = self._norma_residuo(x)
+
+        self._procedimiento += "---------------------------------------------\n"
+        self._procedimiento += "Ecuaciones normales:  AᵀA • x = Aᵀb\n\n"
+        self._procedimiento += f"AᵀA:\n{ata}\n\n"
+        self._procedimiento += (
+            f"Aᵀb:\n{Matriz(filas=n, columnas=1, valores=[[c] for c in atb])}\n"
+        )
+        self._procedimiento += "---------------------------------------------\n"
+
+        # incluir el procedimiento de las ecuaciones normales,
+        # sin generar todavia el texto de su solucion general
+        self._diferidos.extend(
+            (len(self._procedimiento) + posicion, solucion_general)
+            for posicion, solucion_general in normales._diferidos
+        )
+        self._procedimiento += normales._procedimiento
+        self._procedimiento += "---------------------------------------------\n"
+
+        libres: str = (
+            "\n(variables libres tomadas como 0)"
+            if normales.solucion_general is not None
+            else ""
+        )
+
+        self._solucion += f"\nSolución por mínimos cuadrados encontrada:{libres}\n"
+        for i, xi in enumerate(x):
+            self._solucion += f"X{i + 1} = {
+                format_factor(
+                    xi.limit_denominator(FRAC_PREC['prec']),
+                    mult=False,
+                    parenth_negs=False,
+                    parenth_fracs=False,
+                    skip_ones=False,
+                )
+            }\n"
+
+        self._solucion += f"\n|| Ax − b ||  =  {
+            format(norma_residuo.normalize(), 'f').replace('-', '−')
+        }\n"
+
+        self._procedimiento += f"\n{self._solucion}"
+
+    def _minimos_cuadrados_flotante(self) -> None:
+        """
+        Resolver el problema de mínimos cuadrados en punto flotante con numpy,
+        sin formar las ecuaciones normales.
+        """
+
+        a = array(
+            [[float(x) for x in fila[:-1]] for fila in self.matriz.valores],
+            dtype=float,
+        )
+
+        b = array([float(fila[-1]) for fila in self.matriz.valores], dtype=float)
+        x, _, rango, _ = lstsq(a, b)
+        norma_residuo = float(((a @ x - b) ** 2).sum() ** 0.5)
+
+        self._procedimiento += "---------------------------------------------\n"
+        self._procedimiento += "Solución en punto flotante (descomposición SVD),\n"
+        self._procedimiento += f"rango de A:  {rango}\n"
+        self._procedimiento += "---------------------------------------------\n"
+
+        self._solucion += "\nSolución por mínimos cuadrados encontrada:\n"
+        for i, xi in enumerate(x):
+            self._solucion += f"X{i + 1} ≈ {float(xi):.10g}\n".replace("-", "−")
+        self._solucion += f"\n|| Ax − b ||  ≈  {norma_residuo:.10g}\n"
+        self._procedimiento += f"\n{self._solucion}"
+
+    def _ecuaciones_normales(self) -> tuple[Matriz, list[Fraction]]:
+        """
+        Calcular (y almacenar) AᵀA y Aᵀb, donde A es la matriz
+        de variables y b la columna aumentada del sistema.
+
+        Returns:
+            (Matriz, list[Fraction]): AᵀA y Aᵀb.
+
+        """
+
+        if self._ata is None or self._atb is None:
+            n: int = self.matriz.columnas - 1
+            columnas: list[tuple[Fraction, ...]] = list(
+                zip(*self.matriz.valores, strict=True),
+            )
+
+            # AᵀA es simetrica, solo se calcula el triangulo superior
+            ata: list[list[Fraction]] = [[Fraction(0)] * n for _ in range(n)]
+            for i in range(n):
+                for j in range(i, n):
+                    producto = sum(
+                        (a * b for a, b in zip(columnas[i], columnas[j], strict=True)),
+                        Fraction(0),
+                    )
+
+                    ata[i][j] = ata[j][i] = producto
+
+            self._ata = Matriz(filas=n, columnas=n, valores=ata)
+            self._atb = [
+                sum(
+                    (a * b for a, b in zip(columnas[i], columnas[-1], strict=True)),
+                    Fraction(0),
+                )
+                for i in range(n)
+            ]
+
+        return (self._ata, self._atb)
+
+    def _norma_residuo(self, x: list[Fraction]) -> Decimal:
+        """
+        Calcular || Ax − b || para un vector x dado.
+
+        Args:
+            x: Valores de las variables.
+
+        Returns:
+            Decimal: Norma euclidiana del residuo.
+
+        """
+
+        cuadrados = sum(
+            (
+                (
+                    sum((a * xi for a, xi in zip(fila, x, strict=False)), Fraction(0))
+                    - fila[-1]
+                )
+                ** 2
+                for fila in self.matriz.valores
+            ),
+            Fraction(0),
+        )
+
+        return (Decimal(cuadrados.numerator) / Decimal(cuadrados.denominator)).sqrt()
+
+    def validar_rango_modular(self, num_primos: int = 3) -> tuple[bool, int, int]:
+        """
+        Validar rápidamente la consistencia del sistema, calculando
+        el rango de A y de (A | b) módulo varios primos aleatorios grandes,
+        sin realizar la eliminación exacta con fracciones.
+
+        Como las columnas se eliminan en orden, una sola eliminación
+        módulo p da ambos rangos: los pivotes en las columnas de variables
+        dan rango(A), y un pivote en la columna aumentada indica que
+        rango(A | b) = rango(A) + 1. El resultado es correcto con alta
+        probabilidad (solo falla si todos los primos dividen menores de A).
+
+        Args:
+            num_primos: Número de primos a utilizar.
+
+        Returns:
+            (bool, int, int):
+                Si el sistema es consistente,
+                rango de la matriz de variables y
+                número de variables libres.
+
+        """
+
+        n: int = self.matriz.columnas - 1
+        rango: int = 0
+        rango_aumentada: int = 0
+
+        for _ in range(num_primos):
+            pivotes: list[int] = self.matriz.pivotes_modulares(primo_aleatorio())
+            rango = max(rango, sum(1 for j in pivotes if j < n))
+            rango_aumentada = max(rango_aumentada, len(pivotes))
+
+        return (rango == rango_aumentada, rango, n - rango)
+
+    def gauss_jordan(self, prevalidar: bool = False) -> None:
         """
         Resolver el sistema aplicando el método de Gauss-Jordan,
         realizando operaciones de fila para reducir
         la matriz y encontrar las soluciones.
 
+        Consume completamente self.pasos_gauss_jordan().
+
+        Args:
+            prevalidar: Si se debe validar la consistencia con
+                        self.validar_rango_modular() antes de reducir.
+
+        """
+
+        for _ in self.pasos_gauss_jordan(prevalidar):
+            pass
+
+    def pasos_gauss_jordan(self, prevalidar: bool = False) -> Iterator[PasoGJ]:
+        """
+        Resolver el sistema con el método de Gauss-Jordan como un generador,
+        produciendo cada operación de fila como un evento compacto
+        (tipo, fila, otra fila, factor) después de aplicarla a la matriz.
+
+        Permite que la interfaz consuma la resolución de forma incremental
+        (e.g. con after()), sin bloquear el main loop en sistemas grandes.
+        El procedimiento y la solución se van acumulando en
+        self.procedimiento y self.solucion como en self.gauss_jordan():
+        el texto de cada paso (con la matriz completa) se construye
+        al aplicarlo, no solo al mostrarlo, porque la interfaz muestra
+        el procedimiento completo y la matriz cambia en el siguiente paso.
+
         ---
 
         Procedimiento:
@@ -174,59 +455,121 @@ class SistemaEcuaciones:
         - Encontrar variables libres y determinar si existe una solución única.
         - Almacenar solución y operaciones realizadas.
 
+        ---
+
+        Args:
+            prevalidar: Si se debe validar la consistencia con
+                        self.validar_rango_modular() antes de reducir;
+                        si el sistema es inconsistente, no se reduce la matriz.
+
+        Yields:
+            PasoGJ: Operación de fila realizada:
+                    - ("intercambio", fila, otra fila, 0)
+                    - ("normalizar", fila, -1, pivote)
+                    - ("eliminar", fila, fila pivote, factor)
+
         """
 
-        self.procedimiento += "\nMatriz original:\n"
-        self.procedimiento += str(self.matriz) + "\n"
+        self._procedimiento += "\nMatriz original:\n"
+        self._procedimiento += str(self.matriz) + "\n"
 
         if self.matriz.es_matriz_cero():
-            self.solucion += "\n¡Sistema tiene soluciones infinitas!\n"
-            self.procedimiento += "\nTodas las ecuaciones tienen la forma 0 = 0, "
-            self.procedimiento += "lo cual siempre es verdadero.\n"
-            self.procedimiento += "Por lo tanto, existen soluciones infinitas.\n"
+            self._solucion += "\n¡Sistema tiene soluciones infinitas!\n"
+            self._procedimiento += "\nTodas las ecuaciones tienen la forma 0 = 0, "
+            self._procedimiento += "lo cual siempre es verdadero.\n"
+            self._procedimiento += "Por lo tanto, existen soluciones infinitas.\n"
             return
 
+        if prevalidar:
+            consistente, rango, libres = self.validar_rango_modular()
+            self._procedimiento += "\nValidación modular del rango:\n"
+            self._procedimiento += f"rango(A) = {rango},  variables libres: {libres}\n"
+
+            if not consistente:
+                self._solucion += "\n¡Sistema es inconsistente!"
+                self._solucion += (
+                    f"\nrango(A) = {rango} != rango(A | b) = {rango + 1}\n"
+                )
+                self._procedimiento += f"\n{self._solucion}"
+                return
+
         test_inicial: tuple[bool, int] = self._validar_consistencia()
         if not test_inicial[0]:
             if self._validar_escalonada_reducida():
-                self.procedimiento += (
+                self._procedimiento += (
                     "\nMatriz ya está en su forma escalonada reducida.\n\n"
                 )
 
-            self.procedimiento += str(self.matriz)
-            self._obtener_soluciones_gj(unica=False, libres=[], validacion=test_inicial)
+            self._procedimiento += str(self.matriz)
+            self._obtener_soluciones_gj(unica=False, validacion=test_inicial)
             return
 
         if self._validar_escalonada_reducida():
-            self.procedimiento += (
+            self._procedimiento += (
                 f"\nMatriz ya está en su forma escalonada reducida.\n\n{self.matriz}"
             )
         else:
-            self._reducir_matriz()
+            yield from self._reducir_matriz()
+
+        self._analizar_reducida()
+
+    def gauss_jordan_disperso(self) -> None:
+        """
+        Resolver el sistema aprovechando la dispersión de la matriz,
+        para sistemas con pocas entradas distintas de cero
+        (redes de flujo, circuitos, sistemas tridiagonales, etc.).
+
+        ---
+
+        Procedimiento:
+        - Si la matriz de variables es tridiagonal,
+          resolver con el algoritmo de Thomas en O(n).
+        - Si no, representar cada fila como un diccionario {columna: valor}
+          de sus entradas distintas de cero, y reducirla escogiendo los
+          pivotes con la heurística de Markowitz para reducir el relleno.
+        - Analizar la matriz reducida igual que en self.gauss_jordan().
+
+        """
+
+        # la matriz cero no tiene nada que reducir
+        if self.matriz.es_matriz_cero():
+            self.gauss_jordan()
+            return
+
+        self._procedimiento += "\nMatriz original:\n"
+        self._procedimiento += str(self.matriz) + "\n"
+
+        if self._es_tridiagonal() and self._resolver_tridiagonal():
+            return
+
+        self._reducir_disperso()
+        self._analizar_reducida()
+
+    def _analizar_reducida(self) -> None:
+        """
+        Analizar la matriz ya reducida para determinar
+        si es consistente y si su solución es única.
+        """
 
         test_final: tuple[bool, int] = self._validar_consistencia()
         if not test_final[0]:
-            self._obtener_soluciones_gj(unica=False, libres=[], validacion=test_final)
+            self._obtener_soluciones_gj(unica=False, validacion=test_final)
             return
 
         libres: list[int] = self._encontrar_variables_libres()
         solucion_unica: bool = self._validar_escalonada_reducida() and libres == []
 
-        self._obtener_soluciones_gj(
-            unica=solucion_unica,
-            libres=([] if solucion_unica else libres),
-            validacion=(True, -1),
-        )
+        self._obtener_soluciones_gj(unica=solucion_unica, validacion=(True, -1))
 
-    def _reducir_matriz(self) -> None:
+    def _reducir_matriz(self) -> Iterator[PasoGJ]:
         """
         Reducir la matriz a su forma escalonada usando el método de reducción por filas.
         """
 
-        self._eliminar_debajo()
-        self._eliminar_encima()
+        yield from self._eliminar_debajo()
+        yield from self._eliminar_encima()
 
-    def _eliminar_debajo(self) -> None:  # noqa: C901
+    def _eliminar_debajo(self) -> Iterator[PasoGJ]:  # noqa: C901
         """
         Para cada fila de la matriz:
         - Encontrar entradas pivotes maximas.
@@ -256,10 +599,12 @@ class SistemaEcuaciones:
                     self.matriz[fila_actual],
                 )
 
-                self.procedimiento += (
+                self._procedimiento += (
                     f"\n\nF{fila_actual + 1}  <=>  F{fila_pivote + 1}:\n{self.matriz}"
                 )
 
+                yield ("intercambio", fila_actual, fila_pivote, Fraction(0))
+
             # normalizar fila pivote (convertir elemento pivote en 1)
             pivote: Fraction = self.matriz[fila_actual, j]
 
@@ -268,17 +613,24 @@ class SistemaEcuaciones:
                     self.matriz.valores[fila_actual][k] /= pivote
 
                 if pivote == -1:
-                    self.procedimiento += (
+                    self._procedimiento += (
                         f"\n\nF{fila_actual + 1}  =>  -F{fila_actual + 1}:\n"
                     )
                 else:
-                    self.procedimiento += f"\n\nF{fila_actual + 1}  =>  "
-                    self.procedimiento += f"F{fila_actual + 1} / {
+                    self._procedimiento += f"\n\nF{fila_actual + 1}  =>  "
+                    self._procedimiento += f"F{fila_actual + 1} / {
                         format_factor(
                             pivote.limit_denominator(FRAC_PREC['prec']), False
                         )
                     }:\n"
-                self.procedimiento += str(self.matriz)
+                self._procedimiento += str(self.matriz)
+
+                yield ("normalizar", fila_actual, -1, pivote)
+
+            # solo las columnas distintas de cero de la fila pivote cambian
+            no_ceros: list[int] = [
+                k for k, valor in enumerate(self.matriz[fila_actual]) if valor != 0
+            ]
 
             # eliminar elementos debajo del pivote
             for f in range(fila_actual + 1, self.matriz.filas):
@@ -286,21 +638,22 @@ class SistemaEcuaciones:
                     continue
 
                 factor: Fraction = self.matriz[f, j]
-                for k in range(self.matriz.columnas):
+                for k in no_ceros:
                     self.matriz.valores[f][k] -= factor * self.matriz[fila_actual, k]
 
-                self.procedimiento += (
-                    f"\n\nF{fila_actual + 1}  =>  F{fila_actual + 1} − "
-                )
-
-                self.procedimiento += f"[ {
+                # la fila modificada es f, y se le resta un multiplo
+                # de la fila pivote, que ya se movio a fila_actual
+                self._procedimiento += f"\n\nF{f + 1}  =>  F{f + 1} − "
+                self._procedimiento += f"[ {
                     format_factor(factor.limit_denominator(FRAC_PREC['prec']))
-                }F{fila_pivote + 1} ]:\n{self.matriz}"
+                }F{fila_actual + 1} ]:\n{self.matriz}"
+
+                yield ("eliminar", f, fila_actual, factor)
 
             # ir a proxima fila
             fila_actual += 1
 
-    def _eliminar_encima(self) -> None:
+    def _eliminar_encima(self) -> Iterator[PasoGJ]:
         """
         Eliminar elementos encima de los pivotes,
         empezando desde la última fila y la última columna.
@@ -316,6 +669,10 @@ class SistemaEcuaciones:
                 # no hay pivote en la fila actual
                 continue
 
+            no_ceros: list[int] = [
+                k for k, valor in enumerate(self.matriz[i]) if valor != 0
+            ]
+
             # para cada fila encima de la fila actual
             # eliminar elementos empezando desde abajo
             for f in reversed(range(i)):
@@ -323,133 +680,250 @@ class SistemaEcuaciones:
                     continue
 
                 factor: Fraction = self.matriz[f, columna_pivote]
-                for k in range(self.matriz.columnas):
+                for k in no_ceros:
                     self.matriz.valores[f][k] -= factor * self.matriz[i, k]
 
-                self.procedimiento += f"\n\nF{f + 1}  =>  F{f + 1} − "
-                self.procedimiento += f"[ {
+                self._procedimiento += f"\n\nF{f + 1}  =>  F{f + 1} − "
+                self._procedimiento += f"[ {
                     format_factor(factor.limit_denominator(FRAC_PREC['prec']))
                 }F{i + 1} ]:\n{self.matriz}"
 
-    def _encontrar_variables_libres(self) -> list[int]:
+                yield ("eliminar", f, i, factor)
+
+    def _reducir_disperso(self) -> None:
+        """
+        Reducir la matriz a su forma escalonada reducida,
+        operando sobre filas dispersas.
+
+        Las columnas se recorren en orden, y en cada columna se escoge
+        como pivote la fila candidata con menos entradas distintas de cero
+        (heurística de Markowitz restringida a filas: con la columna fija,
+        minimizar (r - 1)(c - 1) equivale a minimizar r). Los multiplicadores
+        cero se saltan, y cada eliminación solo recorre las entradas
+        distintas de cero de la fila pivote.
         """
-        Encontrar variables libres de self mediante las variables básicas.
 
-        Returns:
-            list[int]: Lista de índices de variables libres.
+        n: int = self.matriz.columnas - 1
+        filas: list[dict[int, Fraction]] = [
+            {k: valor for k, valor in enumerate(fila) if valor != 0}
+            for fila in self.matriz.valores
+        ]
 
-        """
+        pendientes: list[int] = list(range(self.matriz.filas))
+        pivotes: list[tuple[int, int]] = []
 
-        entradas_principales: list[int] = []
-        for i in range(self.matriz.filas):
-            try:
-                # encontrar una entrada distinta de 0 en la fila
-                entradas_principales.append(
-                    next(
-                        j
-                        for j in range(self.matriz.columnas - 1)
-                        if self.matriz[i, j] != 0
-                    ),
-                )
-            except StopIteration:
-                # la fila es una fila cero
+        for j in range(n):
+            candidatas: list[int] = [i for i in pendientes if j in filas[i]]
+            if not candidatas:
                 continue
 
-        # las variables libres no son entradas principales
-        return [
-            x for x in range(self.matriz.columnas - 1) if x not in entradas_principales
+            fila_pivote: int = min(
+                candidatas,
+                key=lambda i: (len(filas[i]), -abs(filas[i][j])),
+            )
+
+            pendientes.remove(fila_pivote)
+            pivotes.append((fila_pivote, j))
+
+            # normalizar fila pivote (convertir elemento pivote en 1)
+            pivote: Fraction = filas[fila_pivote][j]
+            if pivote != 1:
+                filas[fila_pivote] = {
+                    k: valor / pivote for k, valor in filas[fila_pivote].items()
+                }
+
+                self._procedimiento += f"\nF{fila_pivote + 1}  =>  F{fila_pivote + 1}"
+                self._procedimiento += f" / {
+                    format_factor(pivote.limit_denominator(FRAC_PREC['prec']), False)
+                }"
+
+            # eliminar la columna j de las demas filas candidatas
+            for f in candidatas:
+                if f != fila_pivote:
+                    self._restar_fila_dispersa(filas, f, fila_pivote, j)
+
+        # eliminar encima de los pivotes, empezando por el ultimo
+        for indice, (fila_pivote, j) in reversed(list(enumerate(pivotes))):
+            for f, _ in pivotes[:indice]:
+                if j in filas[f]:
+                    self._restar_fila_dispersa(filas, f, fila_pivote, j)
+
+        # reordenar las filas segun el orden de los pivotes,
+        # dejando las filas restantes al final de la matriz
+        orden: list[int] = [f for f, _ in pivotes] + pendientes
+        self.matriz.valores[:] = [
+            [filas[f].get(k, Fraction(0)) for k in range(self.matriz.columnas)]
+            for f in orden
         ]
 
-    def _despejar_variables(self, libres: list[int]) -> list[str]:
+        self._procedimiento += "\n\nFilas reordenadas según los pivotes:\n"
+        self._procedimiento += str(self.matriz)
+
+    def _restar_fila_dispersa(
+        self,
+        filas: list[dict[int, Fraction]],
+        destino: int,
+        origen: int,
+        columna: int,
+    ) -> None:
         """
-        Despejar las variables de las ecuaciones de self.
+        Restar a la fila destino un múltiplo de la fila origen,
+        para hacer cero su entrada en la columna indicada.
 
         Args:
-            libres: Lista de índices de columnas de variables libres.
-
-        Returns:
-            list[str]: Lista de ecuaciones despejadas.
+            filas:   Filas dispersas de la matriz.
+            destino: Índice de la fila a modificar.
+            origen:  Índice de la fila pivote.
+            columna: Columna del pivote de la fila origen.
 
         """
 
-        # agregar variables libres
-        ecuaciones: list[str] = [f"X{x + 1} es libre\n" for x in libres]
+        fila: dict[int, Fraction] = filas[destino]
+        factor: Fraction = fila[columna]
 
-        for i in range(self.matriz.filas):
-            for j in range(self.matriz.columnas - 1):
-                # ignorar entradas distintas a 0
-                if self.matriz[i, j] == 0:
-                    continue
+        for k, valor in filas[origen].items():
+            nuevo: Fraction = fila.get(k, Fraction(0)) - factor * valor
+            if nuevo == 0:
+                fila.pop(k, None)
+            else:
+                fila[k] = nuevo
+
+        self._procedimiento += f"\nF{destino + 1}  =>  F{destino + 1} − "
+        self._procedimiento += f"[ {
+            format_factor(factor.limit_denominator(FRAC_PREC['prec']))
+        }F{origen + 1} ]"
 
-                expresion: str = self._despejar_expresion(i, j)
-                ecuaciones.append(f"X{j + 1} = {expresion}\n")
-                break
+    def _es_tridiagonal(self) -> bool:
+        """
+        Validar si la matriz de variables es cuadrada y tridiagonal.
 
-        # sort las ecuaciones por el indice de la variable (X1, X2, etc.)
-        return sorted(ecuaciones, key=lambda x: x[1])
+        Returns:
+            bool: Si todas las entradas fuera de las tres diagonales centrales son 0.
 
-    def _despejar_expresion(self, fila: int, columna: int) -> str:
         """
-        Despejar la variable principal de una ecuación.
 
-        ---
+        n: int = self.matriz.columnas - 1
+        if self.matriz.filas != n or n < 2:
+            return False
 
-        Ejemplo:
-        -  1, 0, -1/2 | 3   # fila
-        - X1 - 1/2*X3 = 3   # fila escrita como ecuación
-        - X1 = 3 + 1/2*X3   # ecuación despejada (output)
+        return all(
+            valor == 0
+            for i, fila in enumerate(self.matriz.valores)
+            for k, valor in enumerate(fila[:n])
+            if abs(i - k) > 1
+        )
 
-        ---
+    def _resolver_tridiagonal(self) -> bool:
+        """
+        Resolver un sistema tridiagonal con el algoritmo de Thomas,
+        en O(n) operaciones en lugar de O(n^3).
 
-        Args:
-            fila:    Ecuación del sistema a despejar.
-            columna: Variable principal de la ecuación.
+        El algoritmo no intercambia filas; si se encuentra un pivote cero,
+        se abandona y el sistema se resuelve con eliminación dispersa.
 
         Returns:
-            str: La ecuación despejada y formateada.
+            bool: Si se logró resolver el sistema.
 
         """
 
-        # validar si el resto de los elementos de la fila son 0
-        if all(
-            self.matriz[fila, x] == 0 for x in range(self.matriz.columnas) if x != fila
-        ):
-            return "0"
+        n: int = self.matriz.filas
+        valores: list[list[Fraction]] = self.matriz.valores
 
-        constante: Fraction = self.matriz[fila, -1]
+        c_prima: list[Fraction] = [Fraction(0) for _ in range(n)]
+        d_prima: list[Fraction] = [Fraction(0) for _ in range(n)]
 
-        # si la constante es 0, no agregar nada
-        expresion = (
-            str(constante.limit_denominator(FRAC_PREC["prec"]))
-            if constante != 0
-            else ""
+        proc: str = "\nLa matriz de variables es tridiagonal, por lo que se\n"
+        proc += "resuelve con el algoritmo de Thomas (eliminación en O(n)).\n\n"
+        proc += "Barrido hacia adelante:\n"
+
+        for i in range(n):
+            a: Fraction = valores[i][i - 1] if i > 0 else Fraction(0)
+            b: Fraction = valores[i][i]
+            c: Fraction = valores[i][i + 1] if i < n - 1 else Fraction(0)
+            d: Fraction = valores[i][-1]
+
+            denominador: Fraction = b - a * c_prima[i - 1] if i > 0 else b
+            if denominador == 0:
+                LOGGER.info("Pivote cero en algoritmo de Thomas, usando eliminación.")
+                return False
+
+            c_prima[i] = c / denominador
+            d_prima[i] = (d - a * d_prima[i - 1]) / denominador if i > 0 else d / b
+
+            proc += f"c'{i + 1} = {
+                format_factor(
+                    c_prima[i].limit_denominator(FRAC_PREC['prec']),
+                    mult=False,
+                    parenth_fracs=False,
+                    skip_ones=False,
+                )
+            },  d'{i + 1} = {
+                format_factor(
+                    d_prima[i].limit_denominator(FRAC_PREC['prec']),
+                    mult=False,
+                    parenth_fracs=False,
+                    skip_ones=False,
+                )
+            }\n"
+
+        # sustitucion hacia atras
+        soluciones: list[Fraction] = [Fraction(0) for _ in range(n)]
+        soluciones[-1] = d_prima[-1]
+        for i in reversed(range(n - 1)):
+            soluciones[i] = d_prima[i] - c_prima[i] * soluciones[i + 1]
+
+        proc += "\nSustitución hacia atrás:\n"
+        proc += f"X{n} = d'{n}\n"
+        proc += f"Xi = d'i − c'i • X(i + 1),  para i = {n - 1}, ..., 1\n"
+
+        tipo_sol: str = (
+            "trivial" if all(sol == 0 for sol in soluciones) else "no trivial"
         )
 
-        for j in range(columna + 1, self.matriz.columnas - 1):
-            if self.matriz[fila, j] == 0:
-                continue
+        self._solucion += f"\nSolución {tipo_sol} encontrada:\n"
+        for i, sol in enumerate(soluciones):
+            self._solucion += f"X{i + 1} = {
+                format_factor(
+                    sol.limit_denominator(FRAC_PREC['prec']),
+                    mult=False,
+                    parenth_negs=False,
+                    parenth_fracs=False,
+                    skip_ones=False,
+                )
+            }\n"
 
-            # invertir el signo para "mover al otro lado"
-            coeficiente: Fraction = -self.matriz[fila, j]
+        self._procedimiento += proc
+        self._procedimiento += f"\n{self._solucion}"
+        return True
 
-            signo: str = " + " if coeficiente > 0 else " − "
+    def _encontrar_variables_libres(self) -> list[int]:
+        """
+        Encontrar variables libres de self mediante las variables básicas.
 
-            if coeficiente in (1, -1):
-                variable = f"X{j + 1}"
-            elif coeficiente.is_integer():
-                variable = f"{abs(coeficiente)}X{j + 1}"
-            else:
-                variable = f"[ ({
-                    abs(coeficiente).limit_denominator(FRAC_PREC['prec'])
-                }) • X{j + 1} ]"
-
-            expresion += (
-                f"{signo}{variable}"
-                if expresion != ""
-                else f"{'−' if coeficiente < 0 else ''}{variable}"
-            )
+        Returns:
+            list[int]: Lista de índices de variables libres.
+
+        """
+
+        entradas_principales: list[int] = []
+        for i in range(self.matriz.filas):
+            try:
+                # encontrar una entrada distinta de 0 en la fila
+                entradas_principales.append(
+                    next(
+                        j
+                        for j in range(self.matriz.columnas - 1)
+                        if self.matriz[i, j] != 0
+                    ),
+                )
+            except StopIteration:
+                # la fila es una fila cero
+                continue
 
-        return expresion
+        # las variables libres no son entradas principales
+        return [
+            x for x in range(self.matriz.columnas - 1) if x not in entradas_principales
+        ]
 
     def _validar_consistencia(self) -> tuple[bool, int]:
         """
@@ -559,12 +1033,15 @@ class SistemaEcuaciones:
         for i in range(self.matriz.filas):
             try:
                 entrada_principal: int = next(
-                    j for j in range(self.matriz.columnas - 1) if self.matriz[i, j] == 1
+                    j for j in range(self.matriz.columnas - 1) if self.matriz[i, j] != 0
                 )
             except StopIteration:
                 continue
 
             # condicion 2:
+            if self.matriz[i, entrada_principal] != 1:
+                return False
+
             entradas_inferiores_cero = any(
                 self.matriz[k, entrada_principal] != 0 and k != i
                 for k in range(self.matriz.filas)
@@ -579,7 +1056,6 @@ class SistemaEcuaciones:
     def _obtener_soluciones_gj(
         self,
         unica: bool,
-        libres: list[int],
         validacion: tuple[bool, int],
     ) -> None:
         """
@@ -590,13 +1066,12 @@ class SistemaEcuaciones:
         Soluciones posibles:
         1. Sistema inconsistente: Se determina la fila inconsistente de la matriz.
         2. Solución única:        Se deduce si es una solución trivial o no.
-        3. Solución general:      Se despejan las ecuaciones.
+        3. Solución general:      Se construye la solución paramétrica.
 
         ---
 
         Args:
             unica:      Si el sistema tiene una solución única.
-            libres:     Lista de indices de las variables libres.
             validacion: Return de self._validar_consistencia().
 
         """
@@ -605,10 +1080,10 @@ class SistemaEcuaciones:
         solucion, fila_inconsistente = validacion
 
         if not solucion and fila_inconsistente != -1:
-            self.solucion += "\n¡Sistema es inconsistente!"
-            self.solucion += f"\nEn la ecuación #{fila_inconsistente + 1}:"
-            self.solucion += f"\n0 != {self.matriz[fila_inconsistente, -1]}\n"
-            self.procedimiento += f"\n{self.solucion}"
+            self._solucion += "\n¡Sistema es inconsistente!"
+            self._solucion += f"\nEn la ecuación #{fila_inconsistente + 1}:"
+            self._solucion += f"\n0 != {self.matriz[fila_inconsistente, -1]}\n"
+            self._procedimiento += f"\n{self._solucion}"
             return
 
         if unica:
@@ -618,13 +1093,13 @@ class SistemaEcuaciones:
 
             tipo_solucion: str = "trivial" if solucion_trivial else "no trivial"
 
-            self.solucion += f"\nSolución {tipo_solucion} encontrada:\n"
+            self._solucion += f"\nSolución {tipo_solucion} encontrada:\n"
             for i in range(self.matriz.filas):
                 if all(x == 0 for x in self.matriz[i]):
                     LOGGER.warning("Saltando fila cero.")
                     continue
 
-                self.solucion += f"X{i + 1} = {
+                self._solucion += f"X{i + 1} = {
                     format_factor(
                         self.matriz[i, -1].limit_denominator(FRAC_PREC['prec']),
                         mult=False,
@@ -633,13 +1108,14 @@ class SistemaEcuaciones:
                         skip_ones=False,
                     )
                 }\n"
-            self.procedimiento += f"\n{self.solucion}"
+            self._procedimiento += f"\n{self._solucion}"
             return
 
-        ecuaciones: list[str] = self._despejar_variables(libres)
+        # el texto de la solucion general se genera solo al leer
+        # self.solucion o self.procedimiento (i.e. al mostrarlos)
+        self.solucion_general = SolucionParametrica.desde_escalonada(self.matriz)
 
-        self.solucion += "\n¡Sistema no tiene solución única!\n"
-        self.solucion += "\nSolución general encontrada:\n"
-        for linea in ecuaciones:
-            self.solucion += linea
-        self.procedimiento += f"\n{self.solucion}"
+        self._solucion += "\n¡Sistema no tiene solución única!\n"
+        self._solucion += "\nSolución general encontrada:\n"
+        self._procedimiento += f"\n{self._solucion}"
+        self._diferidos.append((len(self._procedimiento), self.solucion_general))
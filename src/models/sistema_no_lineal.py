@@ -0,0 +1,107 @@
+"""
+Implementación de sistemas de ecuaciones no lineales F(x) = 0,
+formados por funciones de varias variables. La función vectorial F
+y su matriz jacobiana se compilan una sola vez en evaluadores vectorizados.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sympy import Expr, Symbol, diff
+
+from .func_multivariable import compilar_arreglo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy import float64
+    from numpy.typing import NDArray
+
+    from .func_multivariable import FuncMultivariable
+
+
+class SistemaNoLineal:
+    """
+    Representa un sistema de ecuaciones f₁(x) = 0, ..., fₘ(x) = 0,
+    cuyas variables son todas las de sus funciones,
+    en el orden en que aparecen por primera vez.
+    """
+
+    def __init__(self, funcs: Sequence[FuncMultivariable]) -> None:
+        """
+        Args:
+            funcs: Funciones del sistema (cada ecuación es fᵢ = 0).
+
+        Raises:
+            ValueError: Si no se recibe ninguna función.
+
+        """
+
+        if len(funcs) == 0:
+            raise ValueError("El sistema debe tener al menos una ecuación.")
+
+        self.funcs: list[FuncMultivariable] = list(funcs)
+        self.vars: tuple[Symbol, ...] = tuple(
+            dict.fromkeys(var for func in self.funcs for var in func.vars),
+        )
+
+        self._jacobiano: list[list[Expr]] | None = None
+        self._evaluadores: dict[str, Callable[..., NDArray[float64]]] = {}
+
+    @property
+    def ecuaciones(self) -> int:
+        """
+        Número de ecuaciones del sistema.
+        """
+
+        return len(self.funcs)
+
+    @property
+    def es_cuadrado(self) -> bool:
+        """
+        Si el sistema tiene tantas ecuaciones como variables.
+        """
+
+        return len(self.funcs) == len(self.vars)
+
+    def jacobiano_expr(self) -> list[list[Expr]]:
+        """
+        Obtener la matriz jacobiana del sistema: la fila i
+        contiene las derivadas parciales de fᵢ con respecto a cada variable.
+        """
+
+        if self._jacobiano is None:
+            self._jacobiano = [
+                [diff(func.expr, var) for var in self.vars] for func in self.funcs
+            ]
+        return self._jacobiano
+
+    def evaluador(self) -> Callable[..., NDArray[float64]]:
+        """
+        Obtener el evaluador vectorizado de F: recibe un valor
+        (o arreglo de valores) por variable, y retorna un arreglo
+        de forma (m, *forma de los puntos).
+        """
+
+        if "F" not in self._evaluadores:
+            self._evaluadores["F"] = compilar_arreglo(
+                self.vars,
+                [func.expr for func in self.funcs],
+                (self.ecuaciones,),
+            )
+        return self._evaluadores["F"]
+
+    def jacobiano(self) -> Callable[..., NDArray[float64]]:
+        """
+        Obtener el evaluador vectorizado de la matriz jacobiana:
+        retorna un arreglo de forma (m, n, *forma de los puntos).
+        """
+
+        if "jacobiano" not in self._evaluadores:
+            self._evaluadores["jacobiano"] = compilar_arreglo(
+                self.vars,
+                [d for fila in self.jacobiano_expr() for d in fila],
+                (self.ecuaciones, len(self.vars)),
+            )
+        return self._evaluadores["jacobiano"]
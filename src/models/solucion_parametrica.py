@@ -0,0 +1,183 @@
+"""
+Implementación de soluciones generales de sistemas de ecuaciones
+con infinitas soluciones, representadas en forma paramétrica:
+una solución particular más una combinación lineal de una
+base del espacio nulo, en términos de las variables libres.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+from src import FRAC_PREC
+
+if TYPE_CHECKING:
+    from .matriz import Matriz
+
+
+class SolucionParametrica:
+    """
+    Representa la solución general x = p + Σ (Xf • nf) de un sistema,
+    donde p es una solución particular, y cada nf es el vector
+    del espacio nulo asociado a la variable libre Xf.
+    """
+
+    def __init__(
+        self,
+        particular: list[Fraction],
+        base: dict[int, list[Fraction]],
+    ) -> None:
+        """
+        Args:
+            particular: Solución particular (variables libres iguales a 0).
+            base:       Vectores del espacio nulo, indexados por variable libre.
+
+        """
+
+        self._particular = particular
+        self._base = base
+
+    @property
+    def particular(self) -> list[Fraction]:
+        """
+        Solución particular del sistema, con las variables libres iguales a 0.
+        """
+
+        return self._particular
+
+    @property
+    def base(self) -> dict[int, list[Fraction]]:
+        """
+        Base del espacio nulo, un vector por cada variable libre.
+        """
+
+        return self._base
+
+    @property
+    def libres(self) -> list[int]:
+        """
+        Índices de las variables libres.
+        """
+
+        return sorted(self._base)
+
+    def __str__(self) -> str:
+        """
+        Formatear la solución general como una ecuación despejada por variable.
+        """
+
+        return "".join(self.ecuaciones())
+
+    @classmethod
+    def desde_escalonada(cls, matriz: Matriz) -> SolucionParametrica:
+        """
+        Construir la solución general a partir de una
+        matriz aumentada en su forma escalonada reducida.
+        Cada fila se recorre una sola vez para encontrar su pivote.
+
+        ---
+
+        Ejemplo:
+        -  1, 0, -1/2 | 3   # fila
+        - X1 - 1/2*X3 = 3   # fila escrita como ecuación
+        - X1 = 3 + 1/2*X3   # p[0] = 3, n3[0] = 1/2
+
+        ---
+
+        Args:
+            matriz: Matriz aumentada escalonada reducida.
+
+        Returns:
+            SolucionParametrica: Solución general del sistema.
+
+        """
+
+        n: int = matriz.columnas - 1
+        particular: list[Fraction] = [Fraction(0) for _ in range(n)]
+
+        # (fila, columna pivote) de cada fila no cero
+        pivotes: list[tuple[list[Fraction], int]] = []
+        for fila in matriz.valores:
+            pivote: int | None = next((j for j in range(n) if fila[j] != 0), None)
+            if pivote is not None:
+                pivotes.append((fila, pivote))
+
+        columnas_pivote: set[int] = {pivote for _, pivote in pivotes}
+        base: dict[int, list[Fraction]] = {
+            libre: [Fraction(int(j == libre)) for j in range(n)]
+            for libre in range(n)
+            if libre not in columnas_pivote
+        }
+
+        for fila, pivote in pivotes:
+            particular[pivote] = fila[-1]
+
+            # "mover al otro lado" los terminos de las variables libres
+            for libre, vector in base.items():
+                if fila[libre] != 0:
+                    vector[pivote] = -fila[libre]
+
+        return cls(particular, base)
+
+    def ecuaciones(self) -> list[str]:
+        """
+        Generar las ecuaciones despejadas de la solución general,
+        ordenadas por el índice de la variable (X1, X2, etc.).
+
+        Returns:
+            list[str]: Lista de ecuaciones despejadas.
+
+        """
+
+        return [
+            f"X{i + 1} es libre\n"
+            if i in self._base
+            else f"X{i + 1} = {self._despejar_expresion(i)}\n"
+            for i in range(len(self._particular))
+        ]
+
+    def _despejar_expresion(self, variable: int) -> str:
+        """
+        Formatear el lado derecho de la ecuación de una variable básica.
+
+        Args:
+            variable: Índice de la variable básica.
+
+        Returns:
+            str: La ecuación despejada y formateada.
+
+        """
+
+        constante: Fraction = self._particular[variable]
+
+        # si la constante es 0, no agregar nada
+        expresion = (
+            str(constante.limit_denominator(FRAC_PREC["prec"]))
+            if constante != 0
+            else ""
+        )
+
+        for libre in self.libres:
+            coeficiente: Fraction = self._base[libre][variable]
+            if coeficiente == 0:
+                continue
+
+            signo: str = " + " if coeficiente > 0 else " − "
+
+            if coeficiente in (1, -1):
+                termino = f"X{libre + 1}"
+            elif coeficiente.is_integer():
+                termino = f"{abs(coeficiente)}X{libre + 1}"
+            else:
+                termino = f"[ ({
+                    abs(coeficiente).limit_denominator(FRAC_PREC['prec'])
+                }) • X{libre + 1} ]"
+
+            expresion += (
+                f"{signo}{termino}"
+                if expresion != ""
+                else f"{'−' if coeficiente < 0 else ''}{termino}"
+            )
+
+        return expresion or "0"
@@ -2,14 +2,27 @@
 Implementación de vectores matemáticos de cualquier dimensión.
 Se pueden realizar operaciones básicas como suma, resta,
 y multiplicación usando sobrecarga de operadores.
+
+Los componentes se almacenan como numeradores enteros sobre
+un denominador común, para que las operaciones se realicen
+con aritmética de enteros y se normalicen una sola vez.
+Las filas y columnas de una matriz se pueden representar como
+vistas de solo lectura, que leen sus componentes de la matriz.
 """
 
 from __future__ import annotations
 
 from fractions import Fraction
-from typing import overload
+from math import acos, gcd, lcm, sumprod
+from typing import TYPE_CHECKING, overload
+
+from numpy import array, float64
 
 from . import Matriz
+from .radical import Radical
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 
 class Vector:
@@ -17,6 +30,15 @@ class Vector:
     Representa un vector matemático de cualquier dimensión.
     """
 
+    __slots__ = (
+        "_arreglo",
+        "_componentes",
+        "_denominador",
+        "_norma_cuadrada",
+        "_numeradores",
+        "_origen",
+    )
+
     def __init__(self, componentes: list[Fraction] | None) -> None:
         """
         Args:
@@ -24,19 +46,270 @@ class Vector:
 
         """
 
-        if componentes is None:
-            self._componentes: list[Fraction] = []
-        else:
-            self._componentes = componentes
+        self._inicializar([Fraction(c) for c in componentes or []])
+
+    @classmethod
+    def vista_fila(cls, mat: Matriz, indice: int) -> Vector:
+        """
+        Obtener una fila de una matriz como un vector de solo lectura,
+        sin copiarla: sus componentes son la lista de la fila en mat.valores,
+        y sus numeradores enteros se construyen solo la primera vez
+        que se necesitan (al operar con el vector).
+
+        La matriz no debe modificarse después de operar con la vista,
+        porque sus numeradores ya no reflejarían la fila.
+
+        Args:
+            mat:    Matriz de la cual obtener la fila.
+            indice: Índice de la fila.
+
+        Returns:
+            Vector: Vista de la fila.
+
+        Raises:
+            IndexError: Si el índice está fuera de rango.
+
+        """
+
+        if not 0 <= indice < len(mat.valores):
+            raise IndexError("Índice inválido.")
+        return cls._vista(mat, indice, es_fila=True)
+
+    @classmethod
+    def vista_columna(cls, mat: Matriz, indice: int) -> Vector:
+        """
+        Obtener una columna de una matriz como un vector de solo lectura,
+        sin copiarla: cada componente se lee de mat.valores al accederlo,
+        y sus numeradores enteros se construyen solo la primera vez
+        que se necesitan (al operar con el vector).
+
+        La matriz no debe modificarse después de operar con la vista,
+        porque sus numeradores ya no reflejarían la columna.
+
+        Args:
+            mat:    Matriz de la cual obtener la columna.
+            indice: Índice de la columna.
+
+        Returns:
+            Vector: Vista de la columna.
+
+        Raises:
+            IndexError: Si el índice está fuera de rango.
+
+        """
+
+        if not mat.valores or not 0 <= indice < len(mat.valores[0]):
+            raise IndexError("Índice inválido.")
+        return cls._vista(mat, indice, es_fila=False)
+
+    @classmethod
+    def _vista(cls, mat: Matriz, indice: int, es_fila: bool) -> Vector:
+        """
+        Crear una vista de una fila o columna de mat,
+        sin construir todavía su representación entera.
+        """
+
+        vec: Vector = cls.__new__(cls)
+        vec._origen = (mat, indice, es_fila)
+        vec._componentes = None
+        vec._numeradores = None
+        vec._denominador = 1
+        vec._arreglo = None
+        vec._norma_cuadrada = None
+        return vec
+
+    @staticmethod
+    def matriz_filas(vecs: list[Vector]) -> Matriz:
+        """
+        Representar una lista de vectores como una matriz con un vector por fila,
+        sin copiarlos: las filas son las listas de componentes de los vectores
+        (o las filas de origen, si son vistas de filas de otra matriz).
+        La matriz no debe modificarse mientras se utilicen los vectores.
+
+        Args:
+            vecs: Vectores a representar, todos de la misma longitud.
+
+        Returns:
+            Matriz: Matriz k x n cuyas filas son los vectores.
+
+        """
+
+        return Matriz(
+            filas=len(vecs),
+            columnas=len(vecs[0]),
+            valores=[vec.componentes for vec in vecs],
+        )
+
+    @staticmethod
+    def matriz_columnas(vecs: list[Vector]) -> Matriz:
+        """
+        Representar una lista de vectores como una matriz con un vector por columna.
+        Como Matriz se almacena por filas, las filas son listas nuevas,
+        construidas en una sola pasada con referencias a los componentes
+        (las fracciones no se copian).
+
+        Args:
+            vecs: Vectores a representar, todos de la misma longitud.
+
+        Returns:
+            Matriz: Matriz n x k cuyas columnas son los vectores.
+
+        """
+
+        return Matriz(
+            filas=len(vecs[0]),
+            columnas=len(vecs),
+            valores=[
+                list(fila)
+                for fila in zip(*(vec.componentes for vec in vecs), strict=True)
+            ],
+        )
+
+    def _inicializar(self, fracciones: list[Fraction]) -> None:
+        """
+        Inicializar la representación entera de self
+        a partir de una lista de fracciones.
+        """
+
+        self._origen: tuple[Matriz, int, bool] | None = None
+        self._componentes: list[Fraction] | None = fracciones
+        self._numeradores: list[int] | None
+        self._denominador: int
+        self._numeradores, self._denominador = Vector._enteros(fracciones)
+
+        self._arreglo: NDArray[float64] | None = None
+        self._norma_cuadrada: Fraction | None = None
+
+    @staticmethod
+    def _enteros(fracciones: list[Fraction]) -> tuple[list[int], int]:
+        """
+        Llevar una lista de fracciones a numeradores enteros
+        sobre su mínimo denominador común.
+        """
+
+        # como las fracciones ya estan reducidas, el minimo comun multiplo
+        # de sus denominadores es el menor denominador comun posible
+        denominador: int = lcm(*(c.denominator for c in fracciones))
+        return (
+            [c.numerator * (denominador // c.denominator) for c in fracciones],
+            denominador,
+        )
+
+    @classmethod
+    def desde_enteros(cls, numeradores: list[int], denominador: int = 1) -> Vector:
+        """
+        Crear un vector a partir de numeradores enteros y un denominador común,
+        normalizando la fracción una sola vez para todos los componentes.
+
+        Args:
+            numeradores: Numeradores de los componentes.
+            denominador: Denominador común de los componentes.
+
+        Returns:
+            Vector: Vector con componentes numeradores[i] / denominador.
+
+        Raises:
+            ZeroDivisionError: Si el denominador es 0.
+
+        """
+
+        if denominador == 0:
+            raise ZeroDivisionError("El denominador de un vector no puede ser 0.")
+
+        divisor: int = gcd(denominador, *numeradores)
+        if denominador < 0:
+            divisor = -divisor
+
+        vec: Vector = cls.__new__(cls)
+        vec._denominador = denominador // divisor
+        vec._numeradores = (
+            [n // divisor for n in numeradores] if divisor != 1 else numeradores
+        )
+
+        vec._origen = None
+        vec._componentes = None
+        vec._arreglo = None
+        vec._norma_cuadrada = None
+        return vec
 
     @property
     def componentes(self) -> list[Fraction]:
         """
-        Lista de elementos del vector.
+        Lista de elementos del vector. En una vista,
+        se lee de la matriz de origen en cada acceso.
         """
 
+        if self._origen is not None:
+            mat, indice, es_fila = self._origen
+            if es_fila:
+                return mat.valores[indice]
+            return [fila[indice] for fila in mat.valores]
+
+        if self._componentes is None:
+            self._componentes = [
+                Fraction(n, self.denominador) for n in self.numeradores
+            ]
         return self._componentes
 
+    @property
+    def numeradores(self) -> list[int]:
+        """
+        Numeradores de los componentes sobre el denominador común.
+        En una vista, se construyen a partir de la matriz en el primer acceso.
+        """
+
+        if self._numeradores is None:
+            self._numeradores, self._denominador = Vector._enteros(self.componentes)
+        return self._numeradores
+
+    @property
+    def denominador(self) -> int:
+        """
+        Denominador común (positivo) de todos los componentes.
+        """
+
+        if self._numeradores is None:
+            self._numeradores, self._denominador = Vector._enteros(self.componentes)
+        return self._denominador
+
+    def norma_cuadrada(self) -> Fraction:
+        """
+        Calcular || self ||^2 = self • self.
+        Como los componentes de un vector no cambian,
+        se calcula una sola vez y se almacena.
+
+        Returns:
+            Fraction: Cuadrado de la magnitud de self.
+
+        """
+
+        if self._norma_cuadrada is None:
+            self._norma_cuadrada = Fraction(
+                sumprod(self.numeradores, self.numeradores),
+                self.denominador**2,
+            )
+        return self._norma_cuadrada
+
+    def como_arreglo(self) -> NDArray[float64]:
+        """
+        Representación opcional del vector como un arreglo float64 de numpy,
+        para operaciones aproximadas sobre vectores de muchas dimensiones.
+        Se calcula una sola vez y se almacena.
+
+        Returns:
+            NDArray[float64]: Componentes del vector en punto flotante.
+
+        """
+
+        if self._arreglo is None:
+            # la division entre enteros de python se redondea correctamente,
+            # incluso cuando los numeradores no caben en un float
+            self._arreglo = array(
+                [n / self.denominador for n in self.numeradores],
+                dtype=float64,
+            )
+        return self._arreglo
+
     @overload
     def __getitem__(self, indice: int) -> Fraction: ...
 
@@ -67,6 +340,10 @@ class Vector:
         """
 
         if isinstance(indice, int) and -len(self) <= indice < len(self):
+            # en una vista de columna, leer solo el elemento indicado
+            if self._origen is not None and not self._origen[2]:
+                mat, columna, _ = self._origen
+                return mat.valores[indice][columna]
             return self.componentes[indice]
 
         if isinstance(indice, slice):
@@ -84,22 +361,25 @@ class Vector:
         Encontrar la longitud del vector.
 
         Returns:
-            int: Longitud de 'self.componentes'.
+            int: Número de componentes del vector.
 
         """
 
-        return len(self.componentes)
+        if self._origen is not None:
+            mat, indice, es_fila = self._origen
+            return len(mat.valores[indice]) if es_fila else len(mat.valores)
+        return len(self.numeradores)
 
     def __hash__(self) -> int:
         """
         Hashear los componentes del vector.
 
         Returns:
-            int: Hash de 'self.componentes'.
+            int: Hash de los numeradores y el denominador común.
 
         """
 
-        return hash(self.componentes)
+        return hash((tuple(self.numeradores), self.denominador))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -115,11 +395,11 @@ class Vector:
 
         if not isinstance(other, Vector):
             return False
-        if len(self) != len(other):
-            return False
 
-        return all(
-            a == b for a, b in zip(self.componentes, other.componentes, strict=False)
+        # ambos vectores estan normalizados, basta comparar los enteros
+        return (
+            self.denominador == other.denominador
+            and self.numeradores == other.numeradores
         )
 
     def __str__(self) -> str:
@@ -153,9 +433,7 @@ class Vector:
 
         if len(self) != len(vec2):
             raise ArithmeticError("Los vectores deben tener la misma longitud.")
-        return Vector(
-            [a + b for a, b in zip(self.componentes, vec2.componentes, strict=False)],
-        )
+        return self._combinar(vec2, 1)
 
     def __sub__(self, vec2: Vector) -> Vector:
         """
@@ -171,9 +449,7 @@ class Vector:
 
         if len(self) != len(vec2):
             raise ArithmeticError("Los vectores deben tener la misma longitud.")
-        return Vector(
-            [a - b for a, b in zip(self.componentes, vec2.componentes, strict=False)],
-        )
+        return self._combinar(vec2, -1)
 
     @overload
     def __mul__(self, multiplicador: Vector) -> Fraction: ...
@@ -209,18 +485,12 @@ class Vector:
             if len(self) != len(multiplicador):
                 raise ArithmeticError("Los vectores deben tener la misma longitud.")
             return Fraction(
-                sum(
-                    a * b
-                    for a, b in zip(
-                        self.componentes,
-                        multiplicador.componentes,
-                        strict=False,
-                    )
-                ),
+                sumprod(self.numeradores, multiplicador.numeradores),
+                self.denominador * multiplicador.denominador,
             )
 
         if isinstance(multiplicador, (int, float, Fraction)):
-            return Vector([Fraction(c * multiplicador) for c in self.componentes])
+            return self._escalar(Fraction(multiplicador))
         raise TypeError("Tipo de dato inválido.")
 
     def __rmul__(self, multiplicador: float | Fraction) -> Vector:
@@ -242,22 +512,142 @@ class Vector:
         """
 
         if isinstance(multiplicador, (int, float, Fraction)):
-            return Vector([Fraction(c * multiplicador) for c in self.componentes])
+            return self._escalar(Fraction(multiplicador))
         raise TypeError("Tipo de dato inválido.")
 
-    def magnitud(self) -> Fraction:
+    def prod_punto_flotante(self, vec2: Vector) -> float:
         """
-        Calcular la magnitud de self.
+        Calcular el producto punto aproximado con
+        las representaciones float64 de los vectores.
+
+        Args:
+            vec2: Vector a multiplicar.
+
+        Returns:
+            float: Producto punto aproximado.
+
+        Raises:
+            ArithmeticError: Si los vectores no tienen la misma longitud.
+
+        """
+
+        if len(self) != len(vec2):
+            raise ArithmeticError("Los vectores deben tener la misma longitud.")
+        return float(self.como_arreglo() @ vec2.como_arreglo())
+
+    def _combinar(self, vec2: Vector, signo: int) -> Vector:
+        """
+        Sumar (signo = 1) o restar (signo = -1) vec2 a self,
+        llevando ambos vectores a su mínimo común denominador.
+        """
+
+        denominador: int = lcm(self.denominador, vec2.denominador)
+        factor1: int = denominador // self.denominador
+        factor2: int = signo * (denominador // vec2.denominador)
+
+        return Vector.desde_enteros(
+            [
+                a * factor1 + b * factor2
+                for a, b in zip(self.numeradores, vec2.numeradores, strict=True)
+            ],
+            denominador,
+        )
+
+    def _escalar(self, escalar: Fraction) -> Vector:
+        """
+        Multiplicar self por un escalar, operando solo con enteros.
+        """
+
+        return Vector.desde_enteros(
+            [n * escalar.numerator for n in self.numeradores],
+            self.denominador * escalar.denominator,
+        )
+
+    def magnitud(self) -> Radical:
+        """
+        Calcular la magnitud exacta de self.
 
         Utiliza la fórmula:
         - || a || = √(a^2 + b^2 + c^2 + ...)
 
+        La suma de cuadrados se calcula sobre los numeradores enteros,
+        y su raíz se expresa como un racional por la raíz
+        de un entero libre de cuadrados.
+
+        Returns:
+            Radical: Magnitud de self.
+
+        """
+
+        return Radical.raiz(self.norma_cuadrada())
+
+    def normalizar(self) -> tuple[Radical, Vector]:
+        """
+        Calcular el vector unitario de self de forma exacta,
+        como un factor radical por un vector de enteros coprimos
+        con la misma dirección que self.
+
+        Returns:
+            (Radical, Vector):
+                Factor k y vector de dirección d,
+                tales que self / || self || = k • d.
+
+        Raises:
+            ArithmeticError: Si self es el vector cero.
+
+        """
+
+        if not any(self.numeradores):
+            raise ArithmeticError("El vector cero no se puede normalizar.")
+
+        # los numeradores, divididos entre su maximo comun divisor,
+        # son los enteros mas pequeños con la misma direccion que self
+        divisor: int = gcd(*self.numeradores)
+        direccion: Vector = Vector.desde_enteros(
+            [n // divisor for n in self.numeradores],
+        )
+        return (direccion.magnitud().inverso(), direccion)
+
+    def coseno_angulo(self, vec2: Vector) -> Radical:
+        """
+        Calcular el coseno exacto del ángulo entre self y vec2.
+
+        Utiliza la fórmula:
+        - cos(θ) = (a • b) / (|| a || • || b ||)
+
+        Args:
+            vec2: Vector con el cual formar el ángulo.
+
+        Returns:
+            Radical: Coseno del ángulo entre los vectores.
+
+        Raises:
+            ArithmeticError: Si alguno de los vectores es el vector cero.
+
+        """
+
+        if not any(self.numeradores) or not any(vec2.numeradores):
+            raise ArithmeticError(
+                "El ángulo no está definido para el vector cero.",
+            )
+
+        return (self * vec2) / (self.magnitud() * vec2.magnitud())
+
+    def angulo(self, vec2: Vector) -> float:
+        """
+        Calcular el ángulo (en radianes) entre self y vec2,
+        a partir del coseno exacto de coseno_angulo().
+
+        Args:
+            vec2: Vector con el cual formar el ángulo.
+
         Returns:
-            Fraction: Magnitud de self.
+            float: Ángulo entre los vectores, en el rango [0, π].
 
         """
 
-        return Fraction(sum(c**2 for c in self.componentes) ** Fraction(1, 2))
+        # acotar para evitar errores de dominio por redondeo
+        return acos(max(-1.0, min(1.0, float(self.coseno_angulo(vec2)))))
 
     @staticmethod
     def prod_cruz(dimensiones: int, vecs: list[Vector]) -> Vector:
@@ -298,14 +688,28 @@ class Vector:
                 [(a2 * b3) - (a3 * b2), (a3 * b1) - (a1 * b3), (a1 * b2) - (a2 * b1)],
             )
 
-        mat_prod_cruz = (
-            Matriz(
-                filas=len(vecs),
-                columnas=dimensiones,
-                valores=[vec.componentes for vec in vecs],
-            )
-            .encontrar_adjunta()
-            .transponer()
-        )
-
-        return Vector([mat_prod_cruz[0, i] for i in range(mat_prod_cruz.columnas)])
+        # para n >= 4, los componentes son los cofactores
+        # c_j = (-1)^j • det(M sin la columna j), que se obtienen
+        # todos de una sola eliminacion de la matriz (n - 1) x n
+        reducida, pivotes, factor = Vector.matriz_filas(
+            vecs,
+        ).forma_escalonada_reducida()
+
+        # si los vectores son linealmente dependientes,
+        # todos los menores maximales son 0
+        if len(pivotes) < len(vecs):
+            return Vector([Fraction(0) for _ in range(dimensiones)])
+
+        # el vector de cofactores esta en el espacio nulo de M,
+        # que es generado por el vector w de la unica columna libre:
+        # w_libre = 1, w_pivote = -R[fila][libre], y c_libre = (-1)^libre • factor
+        libre: int = next(j for j in range(dimensiones) if j not in pivotes)
+        escalar: Fraction = factor if libre % 2 == 0 else -factor
+        columna_libre: Vector = Vector.vista_columna(reducida, libre)
+
+        componentes: list[Fraction] = [Fraction(0) for _ in range(dimensiones)]
+        componentes[libre] = escalar
+        for fila, pivote in enumerate(pivotes):
+            componentes[pivote] = -columna_libre[fila] * escalar
+
+        return Vector(componentes)
@@ -4,6 +4,7 @@ Módulo de utilidades de la aplicación.
 
 from .paths import (
     ASSETS,
+    CALCULOS_PATH,
     CONFIG_PATH,
     DARK_NUMPAD_ICONS,
     DATA_PATH,
@@ -61,6 +62,7 @@ from .gui_util_funcs import (
     delete_msg_frame,
     delete_msg_if,
     place_msg_frame,
+    place_tarea_frame,
     set_icon,
     toggle_proc,
 )
@@ -70,6 +72,7 @@ __all__: list[str] = [
     "ANALISIS_ICON",
     "APP_ICON",
     "ASSETS",
+    "CALCULOS_PATH",
     "CHECK_ICON",
     "CONFIG_ICON",
     "CONFIG_PATH",
@@ -116,6 +119,7 @@ __all__: list[str] = [
     "handle_pi",
     "log_setup",
     "place_msg_frame",
+    "place_tarea_frame",
     "resize_image",
     "set_icon",
     "toggle_proc",
@@ -8,13 +8,14 @@ from platform import system
 from typing import TYPE_CHECKING, Literal
 
 from PIL.ImageTk import PhotoImage
-from customtkinter import CTkFont, CTkFrame, CTkImage, CTkLabel, CTkToplevel
+from customtkinter import CTkButton, CTkFont, CTkFrame, CTkImage, CTkLabel, CTkToplevel
 
 from .icons import APP_ICON
 
 if TYPE_CHECKING:
     from src.gui import GaussUI
     from src.gui.custom.adapted import CustomScrollFrame
+    from src.managers import Tarea
 
 
 def delete_msg_frame(msg_frame: CTkFrame | None) -> None:
@@ -107,6 +108,54 @@ def place_msg_frame(
     return msg_frame
 
 
+def place_tarea_frame(
+    parent_frame: CTkFrame | CustomScrollFrame,
+    msg_frame: CTkFrame | None,
+    tarea: Tarea,
+    msg: str = "Calculando...",
+    **grid_kwargs,  # noqa: ANN003
+) -> CTkFrame:
+    """
+    Reemplazar msg_frame por un frame que indica que una tarea
+    en segundo plano se está ejecutando, con un botón para cancelarla.
+
+    Args:
+        parent_frame: Frame que contendrá el frame creado.
+        msg_frame:    Frame a reemplazar.
+        tarea:        Tarea en ejecución.
+        msg:          Mensaje a mostrar en el frame.
+        grid_kwargs:  Kwargs a pasar a grid().
+
+    Returns:
+        CTkFrame: El frame colocado.
+
+    """
+
+    delete_msg_frame(msg_frame)
+    msg_frame = CTkFrame(parent_frame, fg_color="transparent")
+
+    CTkLabel(msg_frame, text=msg).grid(row=0, column=0, padx=5, sticky="e")
+    CTkButton(
+        msg_frame,
+        height=30,
+        text="Cancelar",
+        command=tarea.cancelar,
+    ).grid(row=0, column=1, padx=5, sticky="w")
+
+    # inicializar kwargs por defecto
+    for clave, valor in (
+        ("row", 0),
+        ("column", 0),
+        ("padx", 5),
+        ("pady", 5),
+        ("sticky", "n"),
+    ):
+        grid_kwargs.setdefault(clave, valor)
+
+    msg_frame.grid(**grid_kwargs)
+    return msg_frame
+
+
 def set_icon(app: GaussUI, window: GaussUI | CTkToplevel) -> None:
     """
     Establecer el ícono de una ventana según
@@ -24,6 +24,7 @@ DATA_PATH: Path = (
 )
 
 # archivos de datos especificos
+CALCULOS_PATH: Path = DATA_PATH / "calculos.json"
 CONFIG_PATH: Path = DATA_PATH / "config.json"
 FUNCIONES_PATH: Path = DATA_PATH / "funciones.json"
 LOG_PATH: Path = DATA_PATH / "log.txt"
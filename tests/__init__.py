@@ -0,0 +1,3 @@
+"""
+Pruebas de la aplicación.
+"""
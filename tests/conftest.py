@@ -0,0 +1,9 @@
+"""
+Configuración de pruebas: sin pantalla, las imágenes se generan con Agg.
+"""
+
+import matplotlib as mpl
+
+# src.models.func selecciona TkAgg al importarse, lo cual falla sin pantalla
+mpl.use("Agg")
+mpl.use = lambda *_, **__: None
@@ -0,0 +1,74 @@
+"""
+Pruebas de búsqueda de raíces de FuncManager.
+"""
+
+from decimal import Decimal
+from math import sqrt
+
+import pytest
+
+from src.managers import FuncManager
+from src.models import Func
+
+
+@pytest.mark.parametrize(
+    ("expr", "error", "esperadas"),
+    [
+        ("(x-2)^4*(x^2-3)", "1e-4", [-sqrt(3), sqrt(3), 2]),
+        ("(x-2)^4*(x^2-3)", "1e-13", [-sqrt(3), sqrt(3), 2]),
+        (
+            "(x-1)^3*(x^2-2)*(x^2-20001/10000)",
+            "1e-14",
+            [-sqrt(2.0001), -sqrt(2), 1, sqrt(2), sqrt(2.0001)],
+        ),
+    ],
+)
+def test_raices_polinomio_con_raiz_racional_factorizada(
+    expr: str,
+    error: str,
+    esperadas: list[float],
+) -> None:
+    """
+    Las raíces irracionales de un polinomio con una raíz racional múltiple
+    se pulen con el polinomio deflactado, sin salirse del intervalo.
+    """
+
+    raices = FuncManager.todas_las_raices(
+        Func("f(x)", expr),
+        (Decimal(-3), Decimal(3)),
+        Decimal(error),
+    )
+
+    assert [float(x) for x, _, _ in raices] == pytest.approx(esperadas, abs=1e-6)
+    assert all(its >= 0 for _, _, its in raices)
+
+
+@pytest.mark.parametrize("error", ["1e-4", "1e-30"])
+def test_secante_con_raiz_exacta_inicial(error: str) -> None:
+    """
+    Si la secante no está definida porque f(xᵢ − 1) = f(xᵢ),
+    pero xᵢ ya es una raíz, se reporta como encontrada.
+    """
+
+    x, fx, _, _, bandera = FuncManager.secante(
+        Func("f(x)", "x^2-1"),
+        (Decimal(-1), Decimal(1)),
+        Decimal(error),
+    )
+
+    assert (x, fx, bandera) == (1, 0, 0)
+
+
+def test_integral_numerica_retorna_bool() -> None:
+    """
+    La bandera de convergencia es un bool de Python, no un numpy.bool_.
+    """
+
+    valor, _, convergio = FuncManager.integral_numerica(
+        Func("f(x)", "sin(x)"),
+        (Decimal(0), Decimal(1)),
+        Decimal("1e-10"),
+    )
+
+    assert convergio is True
+    assert float(valor) == pytest.approx(0.4596976941318602)
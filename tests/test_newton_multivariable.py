@@ -0,0 +1,117 @@
+"""
+Pruebas del método de Newton para sistemas no lineales,
+y de las funciones de varias variables que los forman.
+"""
+
+from decimal import Decimal
+from math import sqrt
+
+from numpy import array
+import pytest
+
+from src.managers import FuncManager
+from src.models import FuncMultivariable, SistemaNoLineal
+
+
+def sistema(*funcs: tuple[str, str]) -> SistemaNoLineal:
+    """
+    Crear un sistema a partir de pares (nombre, expresión).
+    """
+
+    return SistemaNoLineal([FuncMultivariable(nombre, expr) for nombre, expr in funcs])
+
+
+def test_newton_multivariable_converge() -> None:
+    """
+    El método converge a la intersección de un círculo y una recta.
+    """
+
+    x, registro, its, bandera = FuncManager.newton_multivariable(
+        sistema(("f(x, y)", "x^2 + y^2 - 4"), ("g(x, y)", "x - y")),
+        [Decimal(1), Decimal(2)],
+        Decimal("1e-12"),
+    )
+
+    assert bandera == 0
+    assert [float(v) for v in x] == pytest.approx([sqrt(2), sqrt(2)], abs=1e-12)
+    assert 1 < its < 10
+    assert len(registro) > 0
+
+
+def test_newton_multivariable_jacobiano_singular() -> None:
+    """
+    Si el jacobiano es singular en el punto actual, se retorna la bandera 1.
+    """
+
+    x, _, its, bandera = FuncManager.newton_multivariable(
+        sistema(("f(x, y)", "x^2 + y^2 - 1"), ("g(x, y)", "x^2 - y")),
+        [Decimal(0), Decimal(0)],
+    )
+
+    assert (x, its, bandera) == ([0, 0], 1, 1)
+
+
+def test_newton_multivariable_fuera_del_dominio() -> None:
+    """
+    Si F no está definida en el punto actual, se retorna la bandera 2.
+    """
+
+    x, _, its, bandera = FuncManager.newton_multivariable(
+        sistema(("f(x, y)", "ln(x) + y"), ("g(x, y)", "x - y")),
+        [Decimal(-1), Decimal(0)],
+    )
+
+    assert (x, its, bandera) == ([-1, 0], 1, 2)
+
+
+def test_newton_multivariable_sistema_no_cuadrado() -> None:
+    """
+    El sistema debe tener tantas ecuaciones como variables.
+    """
+
+    with pytest.raises(ValueError, match="tantas ecuaciones"):
+        FuncManager.newton_multivariable(
+            sistema(("f(x, y)", "x + y")),
+            [Decimal(0), Decimal(0)],
+        )
+
+
+def test_newton_multivariable_valores_iniciales() -> None:
+    """
+    Se necesita un valor inicial por variable.
+    """
+
+    with pytest.raises(ValueError, match="valores iniciales"):
+        FuncManager.newton_multivariable(
+            sistema(("f(x, y)", "x + y"), ("g(x, y)", "x - y")),
+            [Decimal(0)],
+        )
+
+
+@pytest.mark.parametrize(
+    ("nombre", "expr"),
+    [("f", "x + y"), ("f(x, x)", "x"), ("f(x)", "x + y")],
+)
+def test_func_multivariable_invalida(nombre: str, expr: str) -> None:
+    """
+    El nombre debe indicar variables distintas,
+    y la expresión solo puede depender de ellas.
+    """
+
+    with pytest.raises(ValueError, match="variables"):
+        FuncMultivariable(nombre, expr)
+
+
+def test_func_multivariable_evaluadores() -> None:
+    """
+    Los evaluadores vectorizados retornan arreglos con la forma de los puntos.
+    """
+
+    func = FuncMultivariable("f(x, y)", "x^2 * y")
+
+    assert func.evaluador()(2.0, 3.0) == 12.0
+    assert func.gradiente()(array([1.0, 2.0]), 3.0).tolist() == [
+        [6.0, 12.0],
+        [1.0, 4.0],
+    ]
+    assert func.hessiana()(1.0, 2.0).tolist() == [[4.0, 2.0], [2.0, 0.0]]
@@ -0,0 +1,72 @@
+"""
+Pruebas de multiplicación de matrices por vectores de OpsManager.
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.managers import MatricesManager, OpsManager, VectoresManager
+from src.models import Matriz, Vector
+
+
+@pytest.fixture
+def manager() -> OpsManager:
+    """
+    Manager con una matriz A de 2 x 3 y tres vectores en R3.
+    """
+
+    return OpsManager(
+        MatricesManager(
+            {
+                "A": Matriz(
+                    filas=2,
+                    columnas=3,
+                    valores=[
+                        [Fraction(1, 2), Fraction(-2), Fraction(3, 4)],
+                        [Fraction(0), Fraction(5, 3), Fraction(-1)],
+                    ],
+                ),
+            },
+            {},
+        ),
+        VectoresManager(
+            {
+                "u": Vector([Fraction(1), Fraction(2), Fraction(3)]),
+                "v": Vector([Fraction(-1, 3), Fraction(0), Fraction(7, 2)]),
+                "w": Vector([Fraction(0), Fraction(0), Fraction(0)]),
+            },
+        ),
+    )
+
+
+def test_mat_por_vecs_igual_a_mat_por_vec(manager: OpsManager) -> None:
+    """
+    La multiplicación por lotes da los mismos vectores
+    que multiplicar por cada vector con mat_por_vec().
+    """
+
+    resultados = manager.mat_por_vecs("A", ["u", "v", "w"])
+
+    assert list(resultados) == ["Au", "Av", "Aw"]
+    for nombre in ("u", "v", "w"):
+        _, nombre_resultado, vec = manager.mat_por_vec("A", nombre)
+        assert resultados[nombre_resultado] == vec
+
+
+def test_mat_por_vecs_todos_por_defecto(manager: OpsManager) -> None:
+    """
+    Sin nombres, se multiplica por todos los vectores guardados.
+    """
+
+    assert manager.mat_por_vecs("A") == manager.mat_por_vecs("A", ["u", "v", "w"])
+    assert manager.mat_por_vecs("A")["Au"] == Vector([Fraction(-5, 4), Fraction(1, 3)])
+
+
+def test_mat_por_vecs_sin_vectores(manager: OpsManager) -> None:
+    """
+    Una lista vacía de vectores no se interpreta como todos los vectores.
+    """
+
+    with pytest.raises(ValueError, match="vector"):
+        manager.mat_por_vecs("A", [])
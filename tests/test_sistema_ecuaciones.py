@@ -0,0 +1,81 @@
+"""
+Pruebas de la resolución de SistemaEcuaciones.
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.models import Matriz, SistemaEcuaciones, SolucionParametrica
+
+
+def matriz_aumentada(valores: list[list[int]]) -> Matriz:
+    """
+    Crear una matriz aumentada con los valores enteros dados.
+    """
+
+    return Matriz(
+        aumentada=True,
+        filas=len(valores),
+        columnas=len(valores[0]),
+        valores=[[Fraction(x) for x in fila] for fila in valores],
+    )
+
+
+def test_pasos_gauss_jordan_nombran_la_fila_modificada() -> None:
+    """
+    Cada eliminación indica la fila que modifica, y la fila pivote
+    en su posición después del intercambio.
+    """
+
+    sistema = SistemaEcuaciones(
+        Matriz(
+            aumentada=True,
+            filas=2,
+            columnas=3,
+            valores=[
+                [Fraction(1), Fraction(1), Fraction(3)],
+                [Fraction(2), Fraction(1), Fraction(4)],
+            ],
+        ),
+    )
+
+    pasos = list(sistema.pasos_gauss_jordan())
+
+    assert pasos[:3] == [
+        ("intercambio", 0, 1, Fraction(0)),
+        ("normalizar", 0, -1, Fraction(2)),
+        ("eliminar", 1, 0, Fraction(1)),
+    ]
+    assert "F2  =>  F2 − [ F1 ]:" in sistema.procedimiento
+    assert "X1 = 1\nX2 = 2" in sistema.solucion
+
+
+def test_solucion_general_se_formatea_al_leerla(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    El texto de la solución general se genera al leer
+    la solución o el procedimiento, no al resolver el sistema
+    (ni al resolver las ecuaciones normales de mínimos cuadrados).
+    """
+
+    formateadas: list[SolucionParametrica] = []
+    formatear = SolucionParametrica.__str__
+
+    def contar(solucion: SolucionParametrica) -> str:
+        formateadas.append(solucion)
+        return formatear(solucion)
+
+    monkeypatch.setattr(SolucionParametrica, "__str__", contar)
+
+    sistema = SistemaEcuaciones(matriz_aumentada([[1, 2, 3, 4], [1, 0, 1, 2]]))
+    sistema.gauss_jordan()
+    cuadrados = SistemaEcuaciones(matriz_aumentada([[1, 1, 2], [1, 1, 3]]))
+    cuadrados.minimos_cuadrados()
+    assert formateadas == []
+
+    assert sistema.solucion.endswith("X1 = 2 − X3\nX2 = 1 − X3\nX3 es libre\n")
+    assert "X1 = 5/2 − X2\nX2 es libre\n---" in cuadrados.procedimiento
+    assert "Solución general" not in cuadrados.solucion
+    assert len(formateadas) == 2
@@ -0,0 +1,51 @@
+"""
+Pruebas de TareasManager.
+"""
+
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.connection import Connection
+from time import sleep
+
+import pytest
+
+from src.managers import TareasManager, tareas_manager
+
+bucle_trabajador = tareas_manager._bucle_trabajador  # noqa: SLF001
+
+
+def iniciar_lento(conexion: Connection) -> None:
+    """
+    Bucle de trabajador que tarda en iniciar, como al importar sympy.
+    """
+
+    sleep(1)
+    bucle_trabajador(conexion)
+
+
+@pytest.mark.skipif(
+    "fork" not in get_all_start_methods(),
+    reason="requiere el contexto fork",
+)
+def test_limite_tiempo_no_incluye_inicio_del_proceso(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    El límite de tiempo de una tarea cuenta desde que su proceso
+    está listo, aunque iniciarlo tarde más que el límite.
+    """
+
+    monkeypatch.setattr(tareas_manager, "_bucle_trabajador", iniciar_lento)
+    manager = TareasManager(max_procesos=1)
+    manager._contexto = get_context("fork")  # noqa: SLF001
+
+    try:
+        tarea = manager.enviar(sleep, 0.1, limite_tiempo=0.5)
+        tarea.resultado(espera=10)
+        assert tarea.estado == "terminada"
+
+        tarea = manager.enviar(sleep, 5, limite_tiempo=0.5)
+        with pytest.raises(TimeoutError):
+            tarea.resultado(espera=10)
+        assert tarea.estado == "agotada"
+    finally:
+        manager.cerrar()
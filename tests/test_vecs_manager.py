@@ -0,0 +1,80 @@
+"""
+Pruebas de proyecciones y operaciones por lotes de VectoresManager.
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.managers import VectoresManager
+from src.models import Vector
+
+
+@pytest.fixture
+def manager() -> VectoresManager:
+    """
+    Manager con un vector b y dos vectores base u, v.
+    """
+
+    return VectoresManager(
+        {
+            "b": Vector([Fraction(1), Fraction(-3), Fraction(2)]),
+            "u": Vector([Fraction(1), Fraction(1), Fraction(0)]),
+            "v": Vector([Fraction(0), Fraction(1), Fraction(1)]),
+        },
+    )
+
+
+def test_proyeccion_sin_vectores_base(manager: VectoresManager) -> None:
+    """
+    Una lista vacía de vectores base no se interpreta
+    como todos los vectores ingresados.
+    """
+
+    with pytest.raises(ValueError, match="vector base"):
+        manager.proyeccion("b", [])
+
+
+def test_proyeccion_coeficientes_negativos(manager: VectoresManager) -> None:
+    """
+    Los coeficientes negativos del procedimiento se muestran con "−".
+    """
+
+    proc, _, proj, perp = manager.proyeccion("b", ["u", "v"])
+
+    assert "c1  =  −1\n" in proc
+    assert proj == Vector([Fraction(-1), Fraction(-1), Fraction(0)])
+    assert perp == Vector([Fraction(2), Fraction(-2), Fraction(2)])
+
+
+def test_matriz_gram_con_fracciones() -> None:
+    """
+    La matriz de Gram coincide con los productos punto de cada par,
+    aunque los vectores tengan denominadores distintos.
+    """
+
+    vecs = {
+        "a": Vector([Fraction(1, 2), Fraction(-2, 3)]),
+        "b": Vector([Fraction(3), Fraction(1, 4)]),
+        "c": Vector([Fraction(-5, 6), Fraction(0)]),
+    }
+
+    _, gram = VectoresManager(vecs).matriz_gram()
+
+    assert gram.valores == [[v1 * v2 for v2 in vecs.values()] for v1 in vecs.values()]
+
+
+@pytest.mark.parametrize(
+    "operacion",
+    ["apilar_vectores", "matriz_gram", "productos_punto", "distancias"],
+)
+def test_operaciones_por_lotes_sin_vectores(
+    manager: VectoresManager,
+    operacion: str,
+) -> None:
+    """
+    Una lista vacía de nombres no se interpreta como todos los vectores.
+    """
+
+    with pytest.raises(ValueError, match="vector"):
+        getattr(manager, operacion)([])
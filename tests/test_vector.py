@@ -0,0 +1,94 @@
+"""
+Pruebas de las vistas de filas y columnas de Vector.
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.models import Matriz, Vector
+
+
+@pytest.fixture
+def mat() -> Matriz:
+    """
+    Matriz 2 x 3 con fracciones.
+    """
+
+    return Matriz(
+        filas=2,
+        columnas=3,
+        valores=[
+            [Fraction(1, 2), Fraction(2), Fraction(-3)],
+            [Fraction(4), Fraction(5, 3), Fraction(6)],
+        ],
+    )
+
+
+def test_vista_fila_comparte_la_fila(mat: Matriz) -> None:
+    """
+    Una vista de fila no copia la fila, y la lee hasta que se opera con ella.
+    """
+
+    fila = Vector.vista_fila(mat, 0)
+    assert fila.componentes is mat.valores[0]
+
+    mat.valores[0][1] = Fraction(7)
+    assert fila == Vector([Fraction(1, 2), Fraction(7), Fraction(-3)])
+    assert (fila.numeradores, fila.denominador) == ([1, 14, -6], 2)
+
+
+def test_vista_columna_lee_la_matriz(mat: Matriz) -> None:
+    """
+    Una vista de columna lee cada elemento de la matriz al accederlo.
+    """
+
+    columna = Vector.vista_columna(mat, 1)
+    assert len(columna) == 2
+    assert columna[1] == Fraction(5, 3)
+
+    mat.valores[1][1] = Fraction(1)
+    assert columna[-1] == 1
+    assert columna * Vector([Fraction(3), Fraction(1)]) == 7
+
+
+def test_vistas_fuera_de_rango(mat: Matriz) -> None:
+    """
+    Las vistas validan el índice al crearse.
+    """
+
+    with pytest.raises(IndexError):
+        Vector.vista_fila(mat, 2)
+    with pytest.raises(IndexError):
+        Vector.vista_columna(mat, 3)
+
+
+def test_matriz_filas_comparte_componentes() -> None:
+    """
+    Una matriz de vectores por fila comparte las listas de los vectores.
+    """
+
+    vecs = [Vector([Fraction(1), Fraction(2)]), Vector([Fraction(3), Fraction(4)])]
+    mat = Vector.matriz_filas(vecs)
+
+    assert all(
+        fila is vec.componentes for fila, vec in zip(mat.valores, vecs, strict=True)
+    )
+
+
+def test_prod_cruz_r4() -> None:
+    """
+    El producto cruz en R4 es ortogonal a los vectores, con los cofactores
+    de la matriz de vectores por fila.
+    """
+
+    vecs = [
+        Vector([Fraction(1), Fraction(0), Fraction(2), Fraction(1)]),
+        Vector([Fraction(0), Fraction(1), Fraction(1), Fraction(3)]),
+        Vector([Fraction(2), Fraction(1), Fraction(0), Fraction(1)]),
+    ]
+
+    cruz = Vector.prod_cruz(4, vecs)
+
+    assert cruz == Vector([Fraction(3), Fraction(-11), Fraction(-4), Fraction(5)])
+    assert all(cruz * vec == 0 for vec in vecs)